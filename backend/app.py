@@ -1,39 +1,238 @@
-from flask import Flask, jsonify, request
+# Running the server directly: make every blocking call (sockets, DB I/O, sleeps)
+# cooperative before anything else is imported. gunicorn's eventlet worker does this itself.
+if __name__ == '__main__':
+    import eventlet
+    eventlet.monkey_patch()
+
+from flask import Flask, jsonify, request, g, has_request_context, stream_with_context
 from flask_sqlalchemy import SQLAlchemy
 from flask_cors import CORS
-from flask_socketio import SocketIO
+from sqlalchemy import (event, func, false, or_, and_, insert, update, select, literal, literal_column, case,
+                        bindparam, DDL)
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import contains_eager
 from werkzeug.security import generate_password_hash, check_password_hash
+from jose import jwt, JWTError
 from dotenv import load_dotenv
-from datetime import datetime
+from datetime import datetime, timedelta
+from collections import OrderedDict
+import base64
+import csv
+import functools
+import hashlib
+import heapq
+import io
+import json
+import math
 import os
+import re
+import threading
+import time
+import uuid
+import zlib
+
+# Optional accelerators: orjson for encoding streamed lists, brotli as a second content coding
+try:
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    import brotli
+except ImportError:
+    brotli = None
 
 # Load environment variables
 load_dotenv()
 
-# Initialize Flask app
-app = Flask(__name__)
+# Deployment profile. 'realtime' (default): the Socket.IO server on eventlet, plus the
+# `flask db` CLI. 'http' (automatic on Vercel): plain WSGI for serverless functions that
+# never imports the realtime stack or Alembic. Everything else (models, routes, the engine
+# without a connection) is still set up at import.
+APP_PROFILE = os.getenv('APP_PROFILE') or ('http' if os.getenv('VERCEL') else 'realtime')
+
+db = SQLAlchemy()
+
+class HttpOnlySocketIO:
+    """
+    Stands in for Flask-SocketIO in the http profile. Events are published
+    write-only to SOCKETIO_MESSAGE_QUEUE, so clients of the realtime workers
+    still receive them, or dropped when there is no queue. Background tasks
+    run inline, since a function is frozen once its response is sent.
+    """
+    async_mode = 'threading'
+    
+    def __init__(self, message_queue=None):
+        self.message_queue = message_queue
+        self.manager = None
+    
+    def on(self, event):
+        return lambda handler: handler
+    
+    def emit(self, event, data, to=None):
+        if not self.message_queue:
+            return
+        if self.manager is None:
+            # python-socketio alone, without Flask-SocketIO or eventlet
+            import socketio as socketio_package
+            if self.message_queue.startswith(('redis://', 'rediss://')):
+                self.manager = socketio_package.RedisManager(self.message_queue, write_only=True)
+            else:
+                self.manager = socketio_package.KombuManager(self.message_queue, write_only=True)
+        self.manager.emit(event, data, namespace='/', room=to)
+    
+    def start_background_task(self, target, *args, **kwargs):
+        target(*args, **kwargs)
+    
+    def sleep(self, seconds):
+        time.sleep(seconds)
+
+def build_app(profile=APP_PROFILE):
+    """
+    Build the Flask app for `profile`, with its config and extensions. Not a
+    factory: the routes below are registered on the module's one `app`.
+    """
+    app = Flask(__name__)
+    
+    # Configuration
+    app.config['APP_PROFILE'] = profile
+    # Signs auth tokens; without a real one no tokens are issued or accepted (see token_secret)
+    app.config['SECRET_KEY'] = os.getenv('SECRET_KEY') or None
+    app.config['SQLALCHEMY_DATABASE_URI'] = os.getenv('DATABASE_URL', 'postgresql://localhost/dev_tracker')
+    app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+    # Signed auth tokens and password hashing limits
+    app.config['TOKEN_TTL_HOURS'] = float(os.getenv('TOKEN_TTL_HOURS', '12'))
+    app.config['PASSWORD_HASH_MAX_PENDING'] = int(os.getenv('PASSWORD_HASH_MAX_PENDING', '64'))
+    # In-process employee directory cache (entries, seconds)
+    app.config['EMPLOYEE_CACHE_SIZE'] = int(os.getenv('EMPLOYEE_CACHE_SIZE', '128'))
+    app.config['EMPLOYEE_CACHE_TTL'] = float(os.getenv('EMPLOYEE_CACHE_TTL', '300'))
+    # Polled project/notification lists: identical concurrent requests share one build, kept
+    # for LIST_CACHE_TTL seconds (0 disables); followers wait up to LIST_CACHE_WAIT seconds
+    app.config['LIST_CACHE_TTL'] = float(os.getenv('LIST_CACHE_TTL', '1'))
+    app.config['LIST_CACHE_SIZE'] = int(os.getenv('LIST_CACHE_SIZE', '1024'))
+    app.config['LIST_CACHE_WAIT'] = float(os.getenv('LIST_CACHE_WAIT', '5'))
+    # Also coalesce streamed (unpaged) lists; each cached copy holds the whole body in memory
+    app.config['LIST_CACHE_STREAMED'] = os.getenv('LIST_CACHE_STREAMED', 'false').lower() == 'true'
+    # Create project notifications in a background task instead of on the request path
+    app.config['NOTIFICATION_FANOUT_ASYNC'] = os.getenv('NOTIFICATION_FANOUT_ASYNC', 'false').lower() == 'true'
+    # Fan-out job statuses kept in memory (entries, seconds); older ones are answered from the database
+    app.config['FANOUT_JOB_CACHE_SIZE'] = int(os.getenv('FANOUT_JOB_CACHE_SIZE', '1024'))
+    app.config['FANOUT_JOB_TTL'] = float(os.getenv('FANOUT_JOB_TTL', '3600'))
+    # Batch auto-assignment: seconds between passes (0 disables the in-process loop) and per-employee cap
+    app.config['AUTO_ASSIGN_INTERVAL'] = float(os.getenv('AUTO_ASSIGN_INTERVAL', '0'))
+    app.config['AUTO_ASSIGN_MAX_ACTIVE'] = int(os.getenv('AUTO_ASSIGN_MAX_ACTIVE', '3'))
+    # Bulk project import: valid rows inserted (with their broadcasts) per transaction
+    app.config['BULK_IMPORT_CHUNK_SIZE'] = int(os.getenv('BULK_IMPORT_CHUNK_SIZE', '1000'))
+    # Ratings: age (days) at which a rating counts half as much in the recency-weighted score
+    app.config['RATING_HALF_LIFE_DAYS'] = float(os.getenv('RATING_HALF_LIFE_DAYS', '90'))
+    # Notification retention: finished rows older than this many days leave the live table,
+    # BATCH_SIZE rows per transaction; INTERVAL seconds between in-process passes (0 disables)
+    app.config['NOTIFICATION_RETENTION_DAYS'] = float(os.getenv('NOTIFICATION_RETENTION_DAYS', '30'))
+    app.config['NOTIFICATION_ARCHIVE_BATCH_SIZE'] = int(os.getenv('NOTIFICATION_ARCHIVE_BATCH_SIZE', '1000'))
+    app.config['NOTIFICATION_ARCHIVE_INTERVAL'] = float(os.getenv('NOTIFICATION_ARCHIVE_INTERVAL', '0'))
+    # Deadline sweeper: run it in this process, hours of deadlines held in memory at a time, hours
+    # before a deadline to warn (0: no warnings), seconds between checks for changes from other processes
+    app.config['DEADLINE_SWEEPER'] = os.getenv('DEADLINE_SWEEPER', 'false').lower() == 'true'
+    app.config['DEADLINE_WINDOW_HOURS'] = float(os.getenv('DEADLINE_WINDOW_HOURS', '24'))
+    app.config['DEADLINE_WARNING_HOURS'] = float(os.getenv('DEADLINE_WARNING_HOURS', '24'))
+    app.config['DEADLINE_SYNC_SECONDS'] = float(os.getenv('DEADLINE_SYNC_SECONDS', '60'))
+    # Request instrumentation: Server-Timing response header and slow-request log threshold (ms)
+    app.config['SERVER_TIMING'] = os.getenv('SERVER_TIMING', 'false').lower() == 'true'
+    app.config['SLOW_REQUEST_MS'] = float(os.getenv('SLOW_REQUEST_MS', '500'))
+    # Stream unpaged list responses from a server-side cursor (rows fetched per batch)
+    app.config['STREAM_LISTS'] = os.getenv('STREAM_LISTS', 'true').lower() == 'true'
+    app.config['STREAM_BATCH_SIZE'] = int(os.getenv('STREAM_BATCH_SIZE', '500'))
+    # ?since= cursors lag the clock by this many seconds: updated_at is stamped at flush, before
+    # commit, so rows committed just after a read (or stamped by a host whose clock is behind) are resent
+    app.config['SYNC_CURSOR_OVERLAP_SECONDS'] = float(os.getenv('SYNC_CURSOR_OVERLAP_SECONDS', '30'))
+    # Response compression: smallest JSON body worth compressing, gzip level and brotli quality
+    app.config['COMPRESS_MIN_BYTES'] = int(os.getenv('COMPRESS_MIN_BYTES', '1024'))
+    app.config['GZIP_LEVEL'] = int(os.getenv('GZIP_LEVEL', '6'))
+    app.config['BROTLI_QUALITY'] = int(os.getenv('BROTLI_QUALITY', '5'))
 
-# Configuration
-app.config['SECRET_KEY'] = os.getenv('SECRET_KEY', 'your-secret-key-here')
-app.config['SQLALCHEMY_DATABASE_URI'] = os.getenv('DATABASE_URL', 'postgresql://localhost/dev_tracker')
-app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+    # Handle Vercel's DATABASE_URL format
+    if os.getenv('DATABASE_URL'):
+        if os.getenv('DATABASE_URL').startswith("postgres://"):
+            app.config['SQLALCHEMY_DATABASE_URI'] = os.getenv('DATABASE_URL').replace("postgres://", "postgresql://", 1)
+    # Name the installed driver: SQLAlchemy 2.1 maps a bare postgresql:// to psycopg 3
+    if app.config['SQLALCHEMY_DATABASE_URI'].startswith("postgresql://"):
+        app.config['SQLALCHEMY_DATABASE_URI'] = app.config['SQLALCHEMY_DATABASE_URI'].replace(
+            "postgresql://", "postgresql+psycopg2://", 1)
 
-# Handle Vercel's DATABASE_URL format
-if os.getenv('DATABASE_URL'):
-    if os.getenv('DATABASE_URL').startswith("postgres://"):
-        app.config['SQLALCHEMY_DATABASE_URI'] = os.getenv('DATABASE_URL').replace("postgres://", "postgresql://", 1)
+    # Connection pool. Green threads beyond pool size + overflow wait up to
+    # DB_POOL_TIMEOUT for a connection instead of opening more. A serverless
+    # function serves one request at a time, so it holds a single connection.
+    if app.config['SQLALCHEMY_DATABASE_URI'].startswith('postgresql'):
+        app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
+            'pool_size': int(os.getenv('DB_POOL_SIZE', '1' if profile == 'http' else '20')),
+            'max_overflow': int(os.getenv('DB_MAX_OVERFLOW', '0' if profile == 'http' else '10')),
+            'pool_timeout': float(os.getenv('DB_POOL_TIMEOUT', '10')),
+            'pool_recycle': int(os.getenv('DB_POOL_RECYCLE', '1800')),
+            'pool_pre_ping': os.getenv('DB_POOL_PRE_PING', 'true').lower() == 'true'
+        }
+    # Green threads the eventlet server runs at once (socketio.run only)
+    app.config['MAX_GREEN_THREADS'] = int(os.getenv('MAX_GREEN_THREADS', '1000'))
+    # Multiple workers: Socket.IO emits are relayed through this queue (redis://..., or any
+    # kombu URL). With a queue, clients must stay on one worker, so only WebSocket is offered.
+    app.config['SOCKETIO_MESSAGE_QUEUE'] = os.getenv('SOCKETIO_MESSAGE_QUEUE') or None
+    app.config['SOCKETIO_TRANSPORTS'] = os.getenv(
+        'SOCKETIO_TRANSPORTS', 'websocket' if app.config['SOCKETIO_MESSAGE_QUEUE'] else 'polling,websocket'
+    ).split(',')
+    
+    # Initialize CORS with WebSocket support
+    CORS(app, resources={
+        r"/*": {"origins": "*"},
+        r"/socket.io/*": {"origins": "*"}
+    })
+    
+    db.init_app(app)
+    if profile != 'http':
+        # Only the `flask db` CLI needs it, and it imports Alembic
+        from flask_migrate import Migrate
+        Migrate(app, db)
+    return app
 
-# Initialize CORS with WebSocket support
-CORS(app, resources={
-    r"/*": {"origins": "*"},
-    r"/socket.io/*": {"origins": "*"}
-})
+def build_socketio(app):
+    if app.config['APP_PROFILE'] == 'http':
+        return HttpOnlySocketIO(app.config['SOCKETIO_MESSAGE_QUEUE'])
+    from flask_socketio import SocketIO
+    return SocketIO(app, cors_allowed_origins="*", async_mode='eventlet',
+                    message_queue=app.config['SOCKETIO_MESSAGE_QUEUE'],
+                    transports=app.config['SOCKETIO_TRANSPORTS'])
+
+# Initialize Flask app and SocketIO
+app = build_app()
+socketio = build_socketio(app)
+
+def make_psycopg2_green():
+    """
+    psycopg2 is a C extension, so monkey patching does not reach its sockets and
+    every query would block the whole hub. A wait callback switches it to
+    non-blocking I/O and yields to other green threads while Postgres works.
+    """
+    import psycopg2
+    from psycopg2 import extensions
+    from eventlet.hubs import trampoline
+
+    def eventlet_wait_callback(conn, timeout=-1):
+        while True:
+            state = conn.poll()
+            if state == extensions.POLL_OK:
+                break
+            elif state == extensions.POLL_READ:
+                trampoline(conn.fileno(), read=True)
+            elif state == extensions.POLL_WRITE:
+                trampoline(conn.fileno(), write=True)
+            else:
+                raise psycopg2.OperationalError(f'Bad result from poll: {state}')
 
-# Initialize SQLAlchemy
-db = SQLAlchemy(app)
+    extensions.set_wait_callback(eventlet_wait_callback)
 
-# Initialize SocketIO
-socketio = SocketIO(app, cors_allowed_origins="*", async_mode='eventlet')
+if socketio.async_mode == 'eventlet' and app.config['SQLALCHEMY_DATABASE_URI'].startswith('postgresql'):
+    import eventlet.patcher
+    if eventlet.patcher.is_monkey_patched('socket'):
+        make_psycopg2_green()
 
 # Define models directly in this file to avoid circular imports
 class Employee(db.Model):
@@ -42,11 +241,23 @@ class Employee(db.Model):
     employee_id = db.Column(db.String(50), unique=True, nullable=False)
     role = db.Column(db.String(20), nullable=False)
     password_hash = db.Column(db.String(200), nullable=False)
-    is_admin = db.Column(db.Boolean, default=False)
-    rating = db.Column(db.Float, default=5.0)
+    is_admin = db.Column(db.Boolean, default=False, index=True)
+    # Aggregates over the employee's Rating rows, kept current by record_rating():
+    # `rating` is the running average, `rating_score` the recency-weighted average
+    rating = db.Column(db.Float, default=5.0, index=True)
+    rating_count = db.Column(db.Integer, default=0, nullable=False)
+    rating_score = db.Column(db.Float, default=5.0, index=True)
+    rating_weight = db.Column(db.Float, default=0.0, nullable=False)  # decayed sum of rating weights
+    rated_at = db.Column(db.DateTime, nullable=True)  # time `rating_weight` was last decayed to
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     projects = db.relationship('Project', backref='assigned_to', lazy=True, foreign_keys='Project.employee_id')
     notifications = db.relationship('Notification', backref='employee', lazy=True)
+    
+    __table_args__ = (
+        # Leaderboards filtered by role
+        db.Index('ix_employee_role_rating', 'role', 'rating'),
+        db.Index('ix_employee_role_rating_score', 'role', 'rating_score'),
+    )
 
     def to_dict(self):
         return {
@@ -55,7 +266,9 @@ class Employee(db.Model):
             'employee_id': self.employee_id,
             'role': self.role,
             'is_admin': self.is_admin,
-            'rating': self.rating
+            'rating': self.rating,
+            'rating_count': self.rating_count,
+            'rating_score': self.rating_score
         }
 
 class Project(db.Model):
@@ -65,16 +278,27 @@ class Project(db.Model):
     status = db.Column(db.String(20), default='pending')
     priority = db.Column(db.Integer, default=1)
     deadline = db.Column(db.DateTime, nullable=True)
+    # Set by the deadline sweeper when the deadline passes before the project is completed
+    overdue_at = db.Column(db.DateTime, nullable=True)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, index=True)
     
     # Foreign keys
-    employee_id = db.Column(db.Integer, db.ForeignKey('employee.id'), nullable=True)
+    employee_id = db.Column(db.Integer, db.ForeignKey('employee.id'), nullable=True, index=True)
     created_by = db.Column(db.Integer, db.ForeignKey('employee.id'), nullable=False)
     
+    __table_args__ = (
+        # Admin list filters
+        db.Index('ix_project_status_priority', 'status', 'priority'),
+        # The deadline sweeper's window loads: deadlines in a range that have not been marked overdue
+        db.Index('ix_project_overdue_deadline', 'overdue_at', 'deadline'),
+    )
+    
     # Relationships
     employee = db.relationship('Employee', foreign_keys=[employee_id], backref='assigned_projects')
     creator = db.relationship('Employee', foreign_keys=[created_by], backref='created_projects')
     notifications = db.relationship('Notification', backref='project', cascade='all, delete-orphan')
+    broadcast = db.relationship('NotificationBroadcast', backref='project', uselist=False, cascade='all, delete-orphan')
     
     # Many-to-many relationship for employees who accepted the project
     accepted_by = db.relationship('Employee', 
@@ -90,34 +314,1649 @@ class Project(db.Model):
             'priority': self.priority,
             'created_at': self.created_at.isoformat(),
             'deadline': self.deadline.isoformat() if self.deadline else None,
-            'employee_id': self.employee_id
+            'overdue_at': self.overdue_at.isoformat() if self.overdue_at else None,
+            'employee_id': self.employee_id,
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None
         }
+    
+    def to_dict_with_assignee(self):
+        """to_dict plus the assignee's name and rating; load `employee` with the query (embed_assignee)"""
+        data = self.to_dict()
+        employee = self.employee
+        data['assignee'] = {'id': employee.id, 'name': employee.name, 'rating': employee.rating} if employee else None
+        return data
 
 # Association table for Project-Employee acceptances
 project_acceptances = db.Table('project_acceptances',
     db.Column('project_id', db.Integer, db.ForeignKey('project.id'), primary_key=True),
-    db.Column('employee_id', db.Integer, db.ForeignKey('employee.id'), primary_key=True)
+    db.Column('employee_id', db.Integer, db.ForeignKey('employee.id'), primary_key=True, index=True)
 )
 
-class Notification(db.Model):
+class Rating(db.Model):
+    """One rating given to an employee; rows are only ever appended"""
     id = db.Column(db.Integer, primary_key=True)
     employee_id = db.Column(db.Integer, db.ForeignKey('employee.id'), nullable=False)
-    project_id = db.Column(db.Integer, db.ForeignKey('project.id'), nullable=False)
-    status = db.Column(db.String(20), default='pending')  # pending, accept, reject, closed
+    project_id = db.Column(db.Integer, db.ForeignKey('project.id'), nullable=True, index=True)
+    rating = db.Column(db.Float, nullable=False)
+    comment = db.Column(db.Text, nullable=True)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_by = db.Column(db.Integer, db.ForeignKey('employee.id'), nullable=True)
+    
+    __table_args__ = (
+        # An employee's rating history, newest first
+        db.Index('ix_rating_employee_created', 'employee_id', 'created_at'),
+    )
     
     def to_dict(self):
-        project = Project.query.get(self.project_id)
         return {
             'id': self.id,
             'employee_id': self.employee_id,
             'project_id': self.project_id,
-            'project_title': project.title if project else 'Unknown',
-            'project_description': project.description if project else '',
-            'status': self.status,
-            'created_at': self.created_at.isoformat()
+            'rating': self.rating,
+            'comment': self.comment,
+            'created_at': self.created_at.isoformat(),
+            'created_by': self.created_by
         }
 
+# Full-text search on PostgreSQL: a generated tsvector over title (weight A) and
+# description (weight B), so every insert and update keeps it current, with a GIN index.
+# It is not mapped on Project, so ordinary project queries never load it.
+SEARCH_CONFIG = 'english'
+PROJECT_SEARCH_VECTOR = (
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(title, '')), 'A') || "
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(description, '')), 'B')"
+)
+event.listen(Project.__table__, 'after_create', DDL(
+    f"ALTER TABLE project ADD COLUMN search_vector tsvector GENERATED ALWAYS AS ({PROJECT_SEARCH_VECTOR}) STORED"
+).execute_if(dialect='postgresql'))
+event.listen(Project.__table__, 'after_create', DDL(
+    "CREATE INDEX ix_project_search_vector ON project USING gin (search_vector)"
+).execute_if(dialect='postgresql'))
+
+class NotificationBroadcast(db.Model):
+    """
+    The offer of one project to every non-admin employee. An employee has no
+    Notification row for it until they respond or are assigned; until then the
+    open broadcast is their pending notification, and its id is the one clients see.
+    """
+    __tablename__ = 'notification_broadcast'
+    
+    id = db.Column(db.Integer, primary_key=True)
+    project_id = db.Column(db.Integer, db.ForeignKey('project.id'), nullable=False, unique=True)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, index=True)
+    closed_at = db.Column(db.DateTime, nullable=True, index=True)  # set once the project is assigned
+
+class Notification(db.Model):
+    """An employee's response to a project's broadcast"""
+    id = db.Column(db.Integer, primary_key=True)
+    employee_id = db.Column(db.Integer, db.ForeignKey('employee.id'), nullable=False)
+    project_id = db.Column(db.Integer, db.ForeignKey('project.id'), nullable=False, index=True)
+    status = db.Column(db.String(20), default='pending')  # accept, reject, assigned, closed
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    __table_args__ = (
+        # One response per employee per project, and the lookup behind the notification list's anti-join
+        db.Index('ix_notification_employee_project', 'employee_id', 'project_id', unique=True),
+        # An employee's notification list and its ?since= delta
+        db.Index('ix_notification_employee_status', 'employee_id', 'status'),
+        db.Index('ix_notification_employee_updated', 'employee_id', 'updated_at'),
+        # Finds the rows due for archiving without scanning the live ones
+        db.Index('ix_notification_status_updated', 'status', 'updated_at'),
+    )
+
+class NotificationArchive(db.Model):
+    """Finished notifications moved out of the live table by archive_notifications()"""
+    __tablename__ = 'notification_archive'
+    
+    id = db.Column(db.Integer, primary_key=True, autoincrement=False)  # id it had in notification
+    employee_id = db.Column(db.Integer, nullable=False, index=True)
+    project_id = db.Column(db.Integer, nullable=False, index=True)
+    status = db.Column(db.String(20))
+    created_at = db.Column(db.DateTime)
+    updated_at = db.Column(db.DateTime)
+    archived_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+# Password hashing is deliberately slow, so it runs on eventlet's native thread
+# pool instead of the hub; excess requests are turned away rather than queued forever
+password_work_slots = threading.BoundedSemaphore(app.config['PASSWORD_HASH_MAX_PENDING'])
+
+class PasswordHasherBusy(Exception):
+    pass
+
+def run_password_work(fn, *args):
+    if not password_work_slots.acquire(blocking=False):
+        raise PasswordHasherBusy()
+    try:
+        if socketio.async_mode == 'eventlet':
+            from eventlet import tpool
+            return tpool.execute(fn, *args)
+        return fn(*args)
+    finally:
+        password_work_slots.release()
+
+def busy_response():
+    response = jsonify({'error': 'Server busy, please retry'})
+    response.headers['Retry-After'] = '1'
+    return response, 503
+
+# Stateless auth: the token carries the identity, so checking it needs no DB hit
+TOKEN_ALGORITHM = 'HS256'
+# The key shipped in .env.example; anyone could sign admin tokens with it
+PLACEHOLDER_SECRET_KEYS = {'your-secret-key-here'}
+
+class TokenSigningDisabled(Exception):
+    pass
+
+def token_secret():
+    """The key tokens are signed with, or None while SECRET_KEY is unset or a published placeholder"""
+    secret = app.config['SECRET_KEY']
+    return None if not secret or secret in PLACEHOLDER_SECRET_KEYS else secret
+
+if token_secret() is None:
+    app.logger.warning('SECRET_KEY is unset or a placeholder: logins fail and all tokens are refused')
+
+def issue_token(employee):
+    secret = token_secret()
+    if secret is None:
+        raise TokenSigningDisabled()
+    now = datetime.utcnow()
+    return jwt.encode({
+        'sub': str(employee.id),
+        'name': employee.name,
+        'employee_id': employee.employee_id,
+        'role': employee.role,
+        'is_admin': bool(employee.is_admin),
+        'iat': now,
+        'exp': now + timedelta(hours=app.config['TOKEN_TTL_HOURS'])
+    }, secret, algorithm=TOKEN_ALGORITHM)
+
+def decode_token(token):
+    """Return the identity in a token, or None if it is missing, forged or expired (or signing is off)"""
+    secret = token_secret()
+    if not token or secret is None:
+        return None
+    try:
+        claims = jwt.decode(token, secret, algorithms=[TOKEN_ALGORITHM])
+    except JWTError:
+        return None
+    return {
+        'id': int(claims['sub']),
+        'name': claims['name'],
+        'employee_id': claims['employee_id'],
+        'role': claims['role'],
+        'is_admin': claims['is_admin']
+    }
+
+def current_identity():
+    """Identity from the request's `Authorization: Bearer` token, decoded once per request"""
+    # Kept on the request, not g: requests made inside an outer app context (scripts, tests) share g
+    if not hasattr(request, 'identity'):
+        header = request.headers.get('Authorization', '')
+        request.identity = decode_token(header[7:] if header.startswith('Bearer ') else None)
+    return request.identity
+
+class LRUCache:
+    """Thread-safe LRU cache whose entries also expire after `ttl` seconds"""
+    def __init__(self, max_size, ttl):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.entries = OrderedDict()
+        self.lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self.entries[key]
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key, value):
+        with self.lock:
+            self.entries[key] = (time.monotonic() + self.ttl, value)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.invalidations += 1
+
+    def stats(self):
+        with self.lock:
+            return {
+                'size': len(self.entries),
+                'max_size': self.max_size,
+                'ttl': self.ttl,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'invalidations': self.invalidations
+            }
+
+class CacheInvalidationBus:
+    """
+    Tells the other workers to clear their employee directory cache, over the
+    Redis behind SOCKETIO_MESSAGE_QUEUE. Without Redis there is nothing to
+    tell, or (other queues) the other workers' caches expire by TTL.
+    """
+    CHANNEL = 'dev_tracker:employee_cache'
+    
+    def __init__(self, url):
+        self.worker_id = uuid.uuid4().hex
+        self.redis = None
+        if url and url.startswith(('redis://', 'rediss://')):
+            import redis
+            self.redis = redis.Redis.from_url(url)
+    
+    def publish(self):
+        if self.redis is None:
+            return
+        try:
+            self.redis.publish(self.CHANNEL, self.worker_id)
+        except Exception:
+            app.logger.exception('Could not publish employee cache invalidation')
+    
+    def listen(self, on_invalidate):
+        """Call on_invalidate for every other worker's invalidation; runs as a background task"""
+        while True:
+            try:
+                pubsub = self.redis.pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(self.CHANNEL)
+                # Invalidations sent while disconnected were missed
+                on_invalidate()
+                for message in pubsub.listen():
+                    if message['data'].decode() != self.worker_id:
+                        on_invalidate()
+            except Exception:
+                app.logger.exception('Employee cache invalidation listener failed, reconnecting')
+                socketio.sleep(1)
+
+class SingleFlightCache(LRUCache):
+    """
+    LRUCache whose misses are computed once: callers asking for a key that is
+    already being computed wait for that result instead of repeating the work.
+    """
+    def __init__(self, max_size, ttl, wait_timeout):
+        super().__init__(max_size, ttl)
+        self.wait_timeout = wait_timeout
+        self.in_flight = {}
+        self.generation = 0
+        self.coalesced = 0
+
+    def get_or_compute(self, key, compute):
+        """
+        Return the cached value for key, or compute() it once for every concurrent
+        caller. A None result is passed to nobody: each waiter computes its own.
+        """
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None and entry[0] >= time.monotonic():
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            flight = self.in_flight.get(key)
+            leader = flight is None
+            if leader:
+                flight = self.in_flight[key] = {'done': threading.Event(), 'value': None}
+                self.misses += 1
+                generation = self.generation
+            else:
+                self.coalesced += 1
+        
+        if not leader:
+            flight['done'].wait(self.wait_timeout)
+            return flight['value'] if flight['value'] is not None else compute()
+        
+        try:
+            value = flight['value'] = compute()
+        finally:
+            with self.lock:
+                self.in_flight.pop(key, None)
+            flight['done'].set()
+        with self.lock:
+            # Invalidated while computing: the waiters share the value, later callers do not
+            if value is not None and self.generation == generation:
+                self.set(key, value)
+        return value
+
+    def invalidate(self, predicate):
+        """Drop the entries whose key matches predicate"""
+        with self.lock:
+            self.generation += 1
+            for key in [key for key in self.entries if predicate(key)]:
+                del self.entries[key]
+            self.invalidations += 1
+
+    def stats(self):
+        with self.lock:
+            return dict(super().stats(), coalesced=self.coalesced, in_flight=len(self.in_flight))
+
+# Employees change rarely (signup, rating updates), so the directory and the
+# admin lookup are served from memory until one of those routes invalidates them
+employee_directory_cache = LRUCache(app.config['EMPLOYEE_CACHE_SIZE'], app.config['EMPLOYEE_CACHE_TTL'])
+cache_invalidation_bus = CacheInvalidationBus(app.config['SOCKETIO_MESSAGE_QUEUE'])
+# Only servers listen; in an unpatched script the blocking read would stall the hub
+if cache_invalidation_bus.redis is not None and socketio.async_mode == 'eventlet':
+    import eventlet.patcher
+    if eventlet.patcher.is_monkey_patched('socket'):
+        socketio.start_background_task(cache_invalidation_bus.listen, employee_directory_cache.clear)
+
+def invalidate_employee_directory():
+    employee_directory_cache.clear()
+    cache_invalidation_bus.publish()
+
+def get_admin_id():
+    """Id of the admin that new projects are created by, or None if there is no admin"""
+    admin_id = employee_directory_cache.get('admin_id')
+    if admin_id is None:
+        admin = Employee.query.filter_by(is_admin=True).first()
+        if admin:
+            admin_id = admin.id
+            employee_directory_cache.set('admin_id', admin_id)
+    return admin_id
+
+# Ratings an admin can give
+MIN_RATING = 1.0
+MAX_RATING = 5.0
+
+def record_rating(employee_id, value, project_id=None, comment=None, created_by=None):
+    """
+    Appends a rating and folds it into the employee's aggregates in O(1),
+    holding the employee's row lock so concurrent ratings are not lost.
+    Returns (rating, employee), or None if there is no such employee.
+    
+    `rating_score` is a weighted average where a rating's weight halves every
+    RATING_HALF_LIFE_DAYS. Time decays the weights of all past ratings alike,
+    so the score only moves when a rating arrives and can be indexed.
+    Before an employee's first rating both averages are the old flat rating,
+    which the first rating replaces.
+    """
+    employee = Employee.query.filter_by(id=employee_id).with_for_update().first()
+    if employee is None:
+        return None
+    now = datetime.utcnow()
+    
+    count = employee.rating_count or 0
+    employee.rating = value if count == 0 else employee.rating + (value - employee.rating) / (count + 1)
+    employee.rating_count = count + 1
+    
+    weight = employee.rating_weight or 0.0
+    if weight and employee.rated_at:
+        age_days = max((now - employee.rated_at).total_seconds(), 0) / 86400
+        weight *= 0.5 ** (age_days / app.config['RATING_HALF_LIFE_DAYS'])
+    employee.rating_score = value if weight == 0 else (employee.rating_score * weight + value) / (weight + 1)
+    employee.rating_weight = weight + 1
+    employee.rated_at = now
+    
+    rating = Rating(employee_id=employee.id, project_id=project_id, rating=value, comment=comment,
+                    created_by=created_by, created_at=now)
+    db.session.add(rating)
+    db.session.commit()
+    invalidate_employee_directory()
+    # Project lists can embed the assignee's rating
+    invalidate_list_cache('projects')
+    return rating, employee
+
+def parse_rating_value(data):
+    """Return the request's rating as a float, raise ValueError if missing or out of range"""
+    if data.get('rating') is None:
+        raise ValueError('Rating not provided')
+    try:
+        value = float(data['rating'])
+    except (TypeError, ValueError):
+        raise ValueError('Rating must be a number')
+    if not MIN_RATING <= value <= MAX_RATING:
+        raise ValueError(f'Rating must be between {MIN_RATING} and {MAX_RATING}')
+    return value
+
+# Socket.IO rooms used to push changes instead of having clients poll
+ADMIN_ROOM = 'admins'
+EMPLOYEES_ROOM = 'employees'
+
+def employee_room(employee_id):
+    return f'employee_{employee_id}'
+
+def push_event(event, payload, *rooms):
+    """Emit a small delta event to the given rooms (each client receives it once)"""
+    rooms = [room for room in rooms if room is not None]
+    if rooms:
+        socketio.emit(event, payload, to=rooms)
+
+@socketio.on('connect')
+def handle_connect(auth=None):
+    # Rooms come only from the signed token sent as {auth: {token}}; an unverified
+    # ?userId= would let any client join another employee's room or the admins'
+    identity = decode_token((auth or {}).get('token'))
+    if not identity:
+        return False
+
+    from flask_socketio import join_room
+    join_room(employee_room(identity['id']))
+    join_room(ADMIN_ROOM if identity['is_admin'] else EMPLOYEES_ROOM)
+    request_metrics.socket_connected(1)
+
+@socketio.on('disconnect')
+def handle_disconnect():
+    request_metrics.socket_connected(-1)
+
+class Tombstone(db.Model):
+    """Records a row leaving a list view so `?since=` clients can drop it"""
+    id = db.Column(db.Integer, primary_key=True)
+    resource = db.Column(db.String(20), nullable=False)  # project, notification
+    resource_id = db.Column(db.Integer, nullable=False)
+    employee_id = db.Column(db.Integer, nullable=True)  # list it left; None means every list
+    removed_at = db.Column(db.DateTime, default=datetime.utcnow)
+    
+    __table_args__ = (
+        db.Index('ix_tombstone_resource_removed', 'resource', 'removed_at'),
+    )
+
+# Notification statuses shown in an employee's notification list
+ACTIVE_NOTIFICATION_STATUSES = ['pending', 'accept']
+
+def employee_notifications(employee_id):
+    """
+    Every broadcast with its project and this employee's response, if any, as
+    flat rows. A broadcast without a response row is a pending notification.
+    """
+    return db.session.query(
+        NotificationBroadcast.id,
+        NotificationBroadcast.project_id,
+        NotificationBroadcast.created_at,
+        NotificationBroadcast.closed_at,
+        Project.title.label('project_title'),
+        Project.description.label('project_description'),
+        Project.priority.label('project_priority'),
+        func.coalesce(Notification.status, 'pending').label('status')
+    ).join(
+        Project, Project.id == NotificationBroadcast.project_id
+    ).outerjoin(
+        Notification, and_(Notification.project_id == NotificationBroadcast.project_id,
+                           Notification.employee_id == employee_id)
+    )
+
+def open_notification_filter(statuses):
+    """Open broadcasts the employee has not answered (the anti-join) and/or has accepted"""
+    conditions = []
+    if 'pending' in statuses:
+        conditions.append(Notification.id.is_(None))
+    if 'accept' in statuses:
+        conditions.append(Notification.status == 'accept')
+    return and_(NotificationBroadcast.closed_at.is_(None), or_(false(), *conditions))
+
+def dialect_insert(table):
+    """INSERT for the session's database with on_conflict_do_nothing/on_conflict_do_update (PostgreSQL, SQLite)"""
+    if db.session.get_bind().dialect.name == 'postgresql':
+        return postgresql_insert(table)
+    return sqlite_insert(table)
+
+def lock_broadcasts(project_ids):
+    """
+    Lock these projects' broadcasts before reading or closing their responses. A response
+    holds FOR SHARE on the broadcast until it commits, so this waits for the ones in flight,
+    and later ones wait for our commit and then find the offer closed.
+    """
+    db.session.execute(
+        select(NotificationBroadcast.id)
+        .where(NotificationBroadcast.project_id.in_(project_ids))
+        .with_for_update(key_share=True)
+    ).all()
+
+def close_broadcasts(project_ids, now):
+    """Stop offering these projects; employees who never responded simply stop seeing them"""
+    db.session.execute(
+        update(NotificationBroadcast)
+        .where(NotificationBroadcast.project_id.in_(project_ids), NotificationBroadcast.closed_at.is_(None))
+        .values(closed_at=now, updated_at=now)
+    )
+
+def reopen_broadcasts(project_ids, now):
+    """
+    Offer these projects again where their offer was closed. Answers to the closed
+    offer are dropped, so every employee sees it as pending and must accept anew.
+    """
+    reopened = db.session.scalars(
+        select(NotificationBroadcast.project_id)
+        .where(NotificationBroadcast.project_id.in_(project_ids), NotificationBroadcast.closed_at.isnot(None))
+    ).all()
+    if not reopened:
+        return
+    db.session.execute(Notification.__table__.delete().where(Notification.project_id.in_(reopened)))
+    db.session.execute(project_acceptances.delete().where(project_acceptances.c.project_id.in_(reopened)))
+    db.session.execute(
+        update(NotificationBroadcast)
+        .where(NotificationBroadcast.project_id.in_(reopened))
+        .values(closed_at=None, updated_at=now)
+    )
+
+def sync_cursor():
+    """The X-Sync-Cursor for a list read now; deltas overlap, so clients merge them by id"""
+    return datetime.utcnow() - timedelta(seconds=app.config['SYNC_CURSOR_OVERLAP_SECONDS'])
+
+def parse_since_cursor():
+    """Return the `since` query parameter as a datetime, None if absent, raise ValueError if invalid"""
+    since = request.args.get('since')
+    return datetime.fromisoformat(since) if since else None
+
+def list_etag(*parts):
+    """Build a weak-enough ETag from cheap aggregates describing a list's current state"""
+    fingerprint = '|'.join(str(part) for part in parts)
+    return hashlib.sha1(fingerprint.encode()).hexdigest()
+
+# Streamed JSON lists and response compression
+STREAM_CHUNK_BYTES = 64 * 1024
+
+class StreamedList:
+    """An unpaged list left as a lazy query, serialized row by row when the response is sent"""
+    def __init__(self, rows, serialize):
+        self.rows = rows
+        self.serialize = serialize
+
+def encode_json(value):
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, separators=(',', ':')).encode()
+
+def json_array_chunks(rows, serialize):
+    """Encode rows into a JSON array one at a time, yielding it in chunks of about STREAM_CHUNK_BYTES"""
+    buffer = [b'[']
+    size = 1
+    for i, row in enumerate(rows):
+        encoded = encode_json(serialize(row))
+        if i:
+            buffer.append(b',')
+        buffer.append(encoded)
+        size += len(encoded) + 1
+        if size >= STREAM_CHUNK_BYTES:
+            yield b''.join(buffer)
+            buffer = []
+            size = 0
+    buffer.append(b']')
+    yield b''.join(buffer)
+
+def render_json(payload):
+    """Serialize a page payload to bytes, encoding a StreamedList without materializing it"""
+    if isinstance(payload, StreamedList):
+        return b''.join(json_array_chunks(payload.rows, payload.serialize))
+    return jsonify(payload).get_data()
+
+def negotiate_encoding():
+    """Pick the content coding for this response: brotli if installed and accepted, then gzip"""
+    accepted = request.accept_encodings
+    if brotli is not None and accepted['br']:
+        return 'br'
+    if accepted['gzip']:
+        return 'gzip'
+    return None
+
+def make_compressor(encoding):
+    """Return (compress, finish) callables for an incremental compressor"""
+    if encoding == 'br':
+        compressor = brotli.Compressor(quality=app.config['BROTLI_QUALITY'])
+        return compressor.process, compressor.finish
+    compressor = zlib.compressobj(app.config['GZIP_LEVEL'], zlib.DEFLATED, 31)  # 31: gzip container
+    return compressor.compress, compressor.flush
+
+def compressed_chunks(chunks, encoding):
+    compress, finish = make_compressor(encoding)
+    for chunk in chunks:
+        data = compress(chunk)
+        if data:
+            yield data
+    yield finish()
+
+def streamed_json_response(streamed):
+    """
+    Send a StreamedList as a chunked response. Rows are fetched from the cursor
+    in batches and encoded as they go, so memory stays flat however long the list.
+    """
+    encoding = negotiate_encoding()
+    body = json_array_chunks(streamed.rows, streamed.serialize)
+    if encoding:
+        body = compressed_chunks(body, encoding)
+    response = app.response_class(stream_with_context(body), mimetype='application/json')
+    if encoding:
+        response.headers['Content-Encoding'] = encoding
+    response.vary.add('Accept-Encoding')
+    return response
+
+class ListSnapshot:
+    """A list response's ETag, sync cursor and encoded body, shared by coalesced requests"""
+    def __init__(self, etag, cursor, body):
+        self.etag = etag
+        self.cursor = cursor
+        self.bodies = {None: body}
+
+    def body(self, encoding):
+        # Compressed once per content coding, not once per client
+        if encoding not in self.bodies:
+            compress, finish = make_compressor(encoding)
+            self.bodies[encoding] = compress(self.bodies[None]) + finish()
+        return self.bodies[encoding]
+
+# Polled lists keyed by (resource, employee_id argument, path, query string)
+list_response_cache = SingleFlightCache(app.config['LIST_CACHE_SIZE'], app.config['LIST_CACHE_TTL'],
+                                        app.config['LIST_CACHE_WAIT'])
+
+def invalidate_list_cache(resource, employee_id=None):
+    """Drop cached `resource` lists; with employee_id only that employee's and the unfiltered lists"""
+    list_response_cache.invalidate(
+        lambda key: key[0] == resource and (employee_id is None or key[1] in (None, str(employee_id)))
+    )
+
+def coalesced_list(resource):
+    """
+    Serve a list route from a single-flight cache: identical concurrent requests
+    (same path and query string) share one build of the ETag and body, which is
+    then kept for LIST_CACHE_TTL seconds. Error responses are never shared, and
+    streamed lists only with LIST_CACHE_STREAMED.
+    """
+    def decorator(view):
+        @functools.wraps(view)
+        def wrapper(*args, **kwargs):
+            if app.config['LIST_CACHE_TTL'] <= 0:
+                return view(*args, **kwargs)
+            uncached = {}
+            
+            def take_snapshot():
+                # conditional_list_response returns a ListSnapshot instead of a response
+                g.list_snapshot = True
+                try:
+                    result = view(*args, **kwargs)
+                finally:
+                    g.pop('list_snapshot', None)
+                if isinstance(result, ListSnapshot):
+                    return result
+                uncached['response'] = result
+                return None
+            
+            key = (resource, request.args.get('employee_id'), request.path, request.query_string)
+            snapshot = list_response_cache.get_or_compute(key, take_snapshot)
+            if snapshot is None:
+                return uncached['response']
+            return snapshot_response(snapshot)
+        return wrapper
+    return decorator
+
+def snapshot_response(snapshot):
+    """This client's response to a shared ListSnapshot: 304 if its ETag matches, else the body"""
+    encoding = negotiate_encoding()
+    etag = f'{snapshot.etag}-{encoding}' if encoding else snapshot.etag
+    if request.if_none_match.contains(etag):
+        response = app.response_class(status=304)
+    else:
+        body_encoding = encoding if len(snapshot.bodies[None]) >= app.config['COMPRESS_MIN_BYTES'] else None
+        response = app.response_class(snapshot.body(body_encoding), mimetype='application/json')
+        if body_encoding:
+            response.headers['Content-Encoding'] = body_encoding
+    response.vary.add('Accept-Encoding')
+    response.set_etag(etag)
+    response.headers['X-Sync-Cursor'] = snapshot.cursor.isoformat()
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
+
+def conditional_list_response(etag, cursor, build_payload):
+    """Answer 304 when the client's ETag still matches, otherwise serialize the payload"""
+    payload = None
+    if g.get('list_snapshot'):
+        payload = build_payload()
+        if not isinstance(payload, StreamedList) or app.config['LIST_CACHE_STREAMED']:
+            return ListSnapshot(etag, cursor, render_json(payload))
+        # Not cached but streamed as usual below; its lazy query only runs if it is sent
+    # Each content coding is a different representation, so it gets its own ETag
+    encoding = negotiate_encoding()
+    if encoding:
+        etag = f'{etag}-{encoding}'
+    if request.if_none_match.contains(etag):
+        response = app.response_class(status=304)
+    else:
+        if payload is None:
+            payload = build_payload()
+        if isinstance(payload, StreamedList):
+            response = streamed_json_response(payload)
+        else:
+            response = jsonify(payload)
+    response.set_etag(etag)
+    response.headers['X-Sync-Cursor'] = cursor.isoformat()
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
+
+def tombstone_ids(resource, since, employee_id=None):
+    query = db.session.query(Tombstone.resource_id).filter(
+        Tombstone.resource == resource,
+        Tombstone.removed_at > since
+    )
+    if employee_id is None:
+        query = query.filter(Tombstone.employee_id.is_(None))
+    else:
+        query = query.filter(or_(Tombstone.employee_id.is_(None), Tombstone.employee_id == employee_id))
+    return [row.resource_id for row in query]
+
+# Keyset pagination: ?limit=&after=&sort=[-]<key>
+MAX_PAGE_SIZE = 500
+
+class PageArgs:
+    def __init__(self, column, key, descending, limit, after):
+        self.column = column
+        self.key = key
+        self.descending = descending
+        self.limit = limit
+        self.after = after
+
+def parse_page_args(sort_keys, default_sort='id'):
+    """Read ?sort=, ?limit= and ?after= against the allowed sort keys, raise ValueError if invalid"""
+    sort = request.args.get('sort', default_sort)
+    key = sort.lstrip('-')
+    if key not in sort_keys:
+        raise ValueError(f'Invalid sort key: {key}')
+    column = sort_keys[key]
+    
+    limit = request.args.get('limit')
+    if limit is not None:
+        if not limit.isdigit():
+            raise ValueError('limit must be a positive integer')
+        limit = int(limit)
+        if limit < 1:
+            raise ValueError('limit must be positive')
+        limit = min(limit, MAX_PAGE_SIZE)
+    
+    after = request.args.get('after')
+    if after:
+        try:
+            value, last_id = json.loads(base64.urlsafe_b64decode(after.encode()))
+            if value is not None and isinstance(column.type, db.DateTime):
+                value = datetime.fromisoformat(value)
+            after = (value, int(last_id))
+        except Exception:
+            raise ValueError('Invalid after cursor')
+    return PageArgs(column, key, sort.startswith('-'), limit, after)
+
+def encode_page_cursor(value, row_id):
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    return base64.urlsafe_b64encode(json.dumps([value, row_id]).encode()).decode()
+
+def build_page(query, page, id_column, serialize, stream=False):
+    """
+    Order the query by the sort key (ties broken by id) and, when a limit is
+    given, return one keyset page as {items, has_more, next_after}. Without a
+    limit the whole ordered list is returned, as before, or with stream=True
+    (and STREAM_LISTS on) a StreamedList reading it in STREAM_BATCH_SIZE batches.
+    """
+    column = page.column
+    # NULLs sort as the largest value (last ascending, first descending), matching
+    # PostgreSQL's default index order, so a NULL sort value can also be a cursor
+    if page.after:
+        value, last_id = page.after
+        if value is None and page.descending:
+            query = query.filter(or_(column.isnot(None), and_(column.is_(None), id_column < last_id)))
+        elif value is None:
+            query = query.filter(column.is_(None), id_column > last_id)
+        elif page.descending:
+            query = query.filter(or_(column < value, and_(column == value, id_column < last_id)))
+        else:
+            query = query.filter(or_(column > value, and_(column == value, id_column > last_id), column.is_(None)))
+    if page.descending:
+        query = query.order_by(column.desc().nulls_first(), id_column.desc())
+    else:
+        query = query.order_by(column.asc().nulls_last(), id_column.asc())
+    
+    if page.limit is None:
+        if stream and app.config['STREAM_LISTS']:
+            return StreamedList(query.yield_per(app.config['STREAM_BATCH_SIZE']), serialize)
+        return [serialize(row) for row in query.all()]
+    
+    rows = query.limit(page.limit + 1).all()
+    has_more = len(rows) > page.limit
+    rows = rows[:page.limit]
+    last = rows[-1] if rows else None
+    return {
+        'items': [serialize(row) for row in rows],
+        'has_more': has_more,
+        'next_after': encode_page_cursor(getattr(last, page.key), last.id) if has_more else None
+    }
+
+def parse_list_arg(name, convert=str):
+    """Read a comma-separated filter such as ?status=pending,in_progress"""
+    value = request.args.get(name)
+    if not value:
+        return None
+    return [convert(item) for item in value.split(',')]
+
+def parse_datetime_arg(name):
+    value = request.args.get(name)
+    return datetime.fromisoformat(value) if value else None
+
+PROJECT_SORT_KEYS = {
+    'id': Project.id,
+    'title': Project.title,
+    'priority': Project.priority,
+    'created_at': Project.created_at,
+    'updated_at': Project.updated_at
+}
+
+EMPLOYEE_SORT_KEYS = {
+    'id': Employee.id,
+    'name': Employee.name,
+    'rating': Employee.rating,
+    'created_at': Employee.created_at
+}
+
+RATING_SORT_KEYS = {
+    'id': Rating.id,
+    'created_at': Rating.created_at
+}
+
+# Aggregates a leaderboard can rank by (each is indexed, alone and after role)
+LEADERBOARD_KEYS = {
+    'rating': Employee.rating,
+    'score': Employee.rating_score
+}
+MAX_LEADERBOARD_SIZE = 100
+
+NOTIFICATION_SORT_KEYS = {
+    'id': NotificationBroadcast.id,
+    'created_at': NotificationBroadcast.created_at
+}
+
+# Project search: ?q= in websearch syntax on PostgreSQL, all words must match in the fallback
+SEARCH_HIGHLIGHT_START = '<mark>'
+SEARCH_HIGHLIGHT_STOP = '</mark>'
+SEARCH_SNIPPET_WORDS = 30
+
+def search_projects_postgres(q, limit, statuses):
+    """Rank matches with ts_rank_cd over the GIN-indexed search_vector and highlight them"""
+    query_ts = func.websearch_to_tsquery(SEARCH_CONFIG, q)
+    vector = literal_column('project.search_vector')
+    rank = func.ts_rank_cd(vector, query_ts)
+    marks = f'StartSel={SEARCH_HIGHLIGHT_START}, StopSel={SEARCH_HIGHLIGHT_STOP}'
+    query = db.session.query(
+        Project,
+        rank.label('rank'),
+        func.ts_headline(SEARCH_CONFIG, Project.title, query_ts, f'{marks}, HighlightAll=true'),
+        func.ts_headline(SEARCH_CONFIG, func.coalesce(Project.description, ''), query_ts,
+                         f'{marks}, MaxWords={SEARCH_SNIPPET_WORDS}, MinWords=10')
+    ).filter(vector.op('@@')(query_ts))
+    if statuses:
+        query = query.filter(Project.status.in_(statuses))
+    # ts_headline is costly enough that PostgreSQL runs it after the LIMIT
+    return [tuple(row) for row in query.order_by(rank.desc(), Project.id).limit(limit)]
+
+def search_tokens(text):
+    """Lower-cased words with a plural 's' dropped, so 'Projects' finds 'project'"""
+    tokens = []
+    for word in re.findall(r'\w+', (text or '').lower()):
+        if len(word) > 3 and word.endswith('s') and not word.endswith('ss'):
+            word = word[:-1]
+        tokens.append(word)
+    return tokens
+
+def highlight_text(text, tokens, snippet=False):
+    """Wrap words matching `tokens` in highlight marks; with snippet=True only a window around the first"""
+    words = re.split(r'(\w+)', text or '')
+    matched = [i for i in range(1, len(words), 2) if search_tokens(words[i])[0] in tokens]
+    for i in matched:
+        words[i] = f'{SEARCH_HIGHLIGHT_START}{words[i]}{SEARCH_HIGHLIGHT_STOP}'
+    if snippet and len(words) > SEARCH_SNIPPET_WORDS * 2:
+        start = max((matched[0] if matched else 1) - SEARCH_SNIPPET_WORDS // 2 * 2, 0)
+        words = words[start:start + SEARCH_SNIPPET_WORDS * 2]
+    return ''.join(words).strip()
+
+class ProjectSearchIndex:
+    """
+    In-process inverted index over project titles and descriptions, for
+    databases without full-text search (SQLite). Before each search it
+    indexes the projects changed since its last refresh (by updated_at),
+    and it rebuilds if projects were deleted. Title words weigh 1.0 and
+    description words 0.4, as the A and B weights do in PostgreSQL.
+    """
+    TITLE_WEIGHT = 1.0
+    DESCRIPTION_WEIGHT = 0.4
+    
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.postings = {}  # token -> {project_id: weight}
+        self.documents = {}  # project_id -> tokens it is posted under
+        self.watermark = None
+    
+    def refresh(self):
+        count, last_updated = db.session.query(func.count(Project.id), func.max(Project.updated_at)).one()
+        if self.watermark is not None and last_updated == self.watermark and count == len(self.documents):
+            return
+        self.catch_up()
+        if len(self.documents) != count:
+            # Projects were deleted (or rows without updated_at were missed): start over
+            self.postings.clear()
+            self.documents.clear()
+            self.watermark = None
+            self.catch_up()
+    
+    def catch_up(self):
+        rows = db.session.query(Project.id, Project.title, Project.description, Project.updated_at)
+        if self.watermark is not None:
+            # Rows updated in the same instant as the watermark are indexed again, harmlessly
+            rows = rows.filter(Project.updated_at >= self.watermark)
+        for project_id, title, description, updated_at in rows.yield_per(1000):
+            self.index(project_id, title, description)
+            if updated_at and (self.watermark is None or updated_at > self.watermark):
+                self.watermark = updated_at
+    
+    def index(self, project_id, title, description):
+        for token in self.documents.pop(project_id, ()):
+            self.postings[token].pop(project_id, None)
+        weights = {}
+        for token in search_tokens(title):
+            weights[token] = weights.get(token, 0) + self.TITLE_WEIGHT
+        for token in search_tokens(description):
+            weights[token] = weights.get(token, 0) + self.DESCRIPTION_WEIGHT
+        for token, weight in weights.items():
+            self.postings.setdefault(token, {})[project_id] = weight
+        self.documents[project_id] = list(weights)
+    
+    def ranked_ids(self, tokens):
+        """Ids of projects containing every token, best first (weight times inverse document frequency)"""
+        postings = [self.postings.get(token, {}) for token in set(tokens)]
+        if not postings or not all(postings):
+            return []
+        postings.sort(key=len)
+        total = len(self.documents)
+        scores = {}
+        for project_id in postings[0]:
+            if all(project_id in posting for posting in postings[1:]):
+                scores[project_id] = sum(posting[project_id] * math.log(1 + total / len(posting))
+                                         for posting in postings)
+        return sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+    
+    def search(self, q, limit, statuses):
+        tokens = search_tokens(q)
+        with self.lock:
+            self.refresh()
+            ranked = self.ranked_ids(tokens)
+        results = []
+        # Status is not indexed, so candidates are checked against the database a batch at a time
+        for start in range(0, len(ranked), limit * 4):
+            batch = dict(ranked[start:start + limit * 4])
+            query = Project.query.filter(Project.id.in_(batch))
+            if statuses:
+                query = query.filter(Project.status.in_(statuses))
+            for project in sorted(query, key=lambda project: (-batch[project.id], project.id)):
+                results.append((project, batch[project.id], highlight_text(project.title, tokens),
+                                highlight_text(project.description, tokens, snippet=True)))
+                if len(results) == limit:
+                    return results
+        return results
+
+project_search_index = ProjectSearchIndex()
+
+# Background notification fan-out jobs by id (in-process, bounded, lost on restart). Ids start
+# with the project id, so a job that was evicted or started by another worker can still be
+# reported from the database.
+fanout_jobs = LRUCache(app.config['FANOUT_JOB_CACHE_SIZE'], app.config['FANOUT_JOB_TTL'])
+
+def fan_out_notifications(project_id):
+    """
+    Offer the project to every non-admin employee with a single broadcast row.
+    Returns the number of employees it reaches.
+    """
+    db.session.add(NotificationBroadcast(project_id=project_id))
+    db.session.commit()
+    invalidate_list_cache('projects')
+    invalidate_list_cache('notifications')
+    return db.session.query(func.count(Employee.id)).filter(
+        Employee.is_admin == False  # noqa: E712 (= false can use ix_employee_is_admin)
+    ).scalar()
+
+# Bulk project import and mutation
+PROJECT_STATUSES = ['pending', 'in_progress', 'completed']
+IMPORT_COLUMNS = ['title', 'description', 'priority', 'deadline']
+MAX_BULK_IDS = 10000
+
+def iter_jsonl_rows(lines):
+    """Yield (line number, row, error) for each non-blank JSON Lines record"""
+    for line_no, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError:
+            yield line_no, None, 'Invalid JSON'
+            continue
+        if not isinstance(row, dict):
+            yield line_no, None, 'Expected a JSON object'
+        else:
+            yield line_no, row, None
+
+def iter_csv_rows(lines):
+    """Yield (line number, row, error) for each CSV record after the header"""
+    reader = csv.DictReader(lines)
+    for row in reader:
+        yield reader.line_num, row, None
+
+def parse_project_row(row):
+    """Validate one imported row into Project column values, raise ValueError if invalid"""
+    title = (row.get('title') or '').strip()
+    if not title:
+        raise ValueError('title is required')
+    if len(title) > 100:
+        raise ValueError('title is longer than 100 characters')
+    priority = row.get('priority')
+    try:
+        priority = int(priority) if priority not in (None, '') else 1
+    except (TypeError, ValueError):
+        raise ValueError(f'Invalid priority: {priority}')
+    deadline = row.get('deadline')
+    try:
+        deadline = datetime.fromisoformat(deadline) if deadline else None
+    except (TypeError, ValueError):
+        raise ValueError(f'Invalid deadline: {deadline}')
+    return {'title': title, 'description': row.get('description') or '', 'priority': priority,
+            'deadline': deadline}
+
+def import_projects(rows, created_by, chunk_size=None):
+    """
+    Creates a pending project, and its broadcast, for every valid row of
+    `rows` ((line number, row, error) tuples, consumed as they arrive).
+    Rows are inserted `chunk_size` at a time, one transaction and one
+    `projects_imported` event per chunk. Invalid rows are reported and skipped.
+    Returns {created, failed, project_ids, errors: [{line, error}]}.
+    """
+    if chunk_size is None:
+        chunk_size = app.config['BULK_IMPORT_CHUNK_SIZE']
+    report = {'created': 0, 'failed': 0, 'project_ids': [], 'errors': []}
+    chunk = []
+    
+    def flush():
+        now = datetime.utcnow()
+        project_ids = db.session.scalars(insert(Project).returning(Project.id), [
+            dict(values, status='pending', created_by=created_by, employee_id=None, created_at=now, updated_at=now)
+            for values in chunk
+        ]).all()
+        db.session.execute(insert(NotificationBroadcast), [
+            {'project_id': project_id, 'created_at': now, 'updated_at': now} for project_id in project_ids
+        ])
+        db.session.commit()
+        invalidate_list_cache('projects')
+        invalidate_list_cache('notifications')
+        report['created'] += len(project_ids)
+        report['project_ids'].extend(project_ids)
+        push_event('projects_imported', {'project_ids': project_ids}, ADMIN_ROOM, EMPLOYEES_ROOM)
+        chunk.clear()
+    
+    for line, row, error in rows:
+        if error is None:
+            try:
+                chunk.append(parse_project_row(row))
+            except ValueError as e:
+                error = str(e)
+        if error is not None:
+            report['failed'] += 1
+            report['errors'].append({'line': line, 'error': error})
+        elif len(chunk) >= chunk_size:
+            flush()
+    if chunk:
+        flush()
+    return report
+
+def bulk_update_projects(project_ids, changes):
+    """
+    Applies `changes` (status, priority and/or employee_id) to every listed
+    project with one UPDATE. Reassigned projects leave their previous
+    assignees' lists (tombstones written with one INSERT ... SELECT).
+    Assigning closes their offers as finalize does, and unassigning reopens
+    them. Returns the ids that existed.
+    """
+    now = datetime.utcnow()
+    project_table = Project.__table__
+    # FOR NO KEY UPDATE, like finalize: responses' foreign-key checks on these rows are not blocked
+    found = db.session.scalars(
+        select(project_table.c.id).where(project_table.c.id.in_(project_ids)).with_for_update(key_share=True)
+    ).all()
+    if not found:
+        db.session.rollback()
+        return []
+    
+    rooms = set()
+    if 'employee_id' in changes:
+        new_employee_id = changes['employee_id']
+        leaving = and_(project_table.c.id.in_(found), project_table.c.employee_id.isnot(None))
+        if new_employee_id is not None:
+            leaving = and_(leaving, project_table.c.employee_id != new_employee_id)
+            rooms.add(employee_room(new_employee_id))
+        previous = db.session.scalars(select(project_table.c.employee_id).distinct().where(leaving)).all()
+        rooms.update(employee_room(employee_id) for employee_id in previous)
+        db.session.execute(insert(Tombstone).from_select(
+            ['resource', 'resource_id', 'employee_id', 'removed_at'],
+            select(literal('project'), project_table.c.id, project_table.c.employee_id, literal(now)).where(leaving)
+        ))
+        # Offers close or reopen, so every employee's notification list changes
+        lock_broadcasts(found)
+        rooms.add(EMPLOYEES_ROOM)
+        if new_employee_id is not None:
+            notification_table = Notification.__table__
+            db.session.execute(
+                update(notification_table)
+                .where(notification_table.c.project_id.in_(found))
+                .values(status=case((notification_table.c.employee_id == new_employee_id, 'assigned'), else_='closed'),
+                        updated_at=now)
+            )
+            close_broadcasts(found, now)
+        else:
+            reopen_broadcasts(found, now)
+    else:
+        rooms.update(employee_room(employee_id) for employee_id in db.session.scalars(
+            select(project_table.c.employee_id).distinct()
+            .where(project_table.c.id.in_(found), project_table.c.employee_id.isnot(None))
+        ))
+    
+    db.session.execute(update(project_table).where(project_table.c.id.in_(found)).values(updated_at=now, **changes))
+    db.session.commit()
+    invalidate_list_cache('projects')
+    invalidate_list_cache('notifications')
+    
+    push_event('projects_updated', {'project_ids': found, 'changes': changes}, ADMIN_ROOM, *rooms)
+    return found
+
+def run_fanout_job(job, project_id):
+    with app.app_context():
+        try:
+            job['notifications_sent'] = fan_out_notifications(project_id)
+            job['status'] = 'completed'
+            project = Project.query.get(project_id)
+            push_event('new_project', {'project': project.to_dict()}, ADMIN_ROOM, EMPLOYEES_ROOM)
+        except Exception as e:
+            db.session.rollback()
+            job['status'] = 'failed'
+            job['error'] = str(e)
+        finally:
+            job['finished_at'] = datetime.utcnow().isoformat()
+
+def auto_assign_pending_projects(max_active=None):
+    """
+    Assigns every pending project that has acceptors in one pass.
+    Projects are taken highest priority first, then earliest deadline; each
+    goes to its highest-rated acceptor who has fewer than `max_active`
+    unfinished projects. One bulk read per table, one batched write per
+    table, one commit. Returns the (project_id, employee_id) pairs assigned.
+    """
+    if max_active is None:
+        max_active = app.config['AUTO_ASSIGN_MAX_ACTIVE']
+    
+    pending = and_(Project.employee_id.is_(None), Project.status == 'pending')
+    
+    # Lock the candidates (FOR NO KEY UPDATE, as in finalize); projects an admin is
+    # finalizing right now are skipped
+    candidates = db.session.execute(
+        select(Project.id, Project.priority, Project.deadline)
+        .where(pending, select(project_acceptances.c.project_id)
+               .where(project_acceptances.c.project_id == Project.id).exists())
+        .with_for_update(skip_locked=True, key_share=True)
+    ).all()
+    if not candidates:
+        db.session.rollback()
+        return []
+    # Wait out responses in flight before reading the acceptors, as finalize does
+    lock_broadcasts([row.id for row in candidates])
+    
+    # Acceptors of every pending project, best rated first
+    acceptors = {}
+    for project_id, employee_id in db.session.execute(
+        select(project_acceptances.c.project_id, Employee.id)
+        .join(Employee, Employee.id == project_acceptances.c.employee_id)
+        .join(Project, Project.id == project_acceptances.c.project_id)
+        .where(pending)
+        .order_by(project_acceptances.c.project_id, Employee.rating.desc().nulls_last(), Employee.id)
+    ):
+        acceptors.setdefault(project_id, []).append(employee_id)
+    
+    # Unfinished projects each employee already holds
+    workload = dict(db.session.execute(
+        select(Project.employee_id, func.count())
+        .where(Project.employee_id.isnot(None), Project.status != 'completed')
+        .group_by(Project.employee_id)
+    ).all())
+    
+    queue = [(-(row.priority or 0), row.deadline or datetime.max, row.id) for row in candidates]
+    heapq.heapify(queue)
+    assignments = []
+    while queue:
+        _, _, project_id = heapq.heappop(queue)
+        for employee_id in acceptors.get(project_id, ()):
+            if workload.get(employee_id, 0) < max_active:
+                workload[employee_id] = workload.get(employee_id, 0) + 1
+                assignments.append((project_id, employee_id))
+                break
+    
+    if not assignments:
+        db.session.rollback()
+        return []
+    
+    now = datetime.utcnow()
+    params = [{'pid': project_id, 'eid': employee_id} for project_id, employee_id in assignments]
+    project_table = Project.__table__
+    notification_table = Notification.__table__
+    db.session.execute(
+        update(project_table)
+        .where(project_table.c.id == bindparam('pid'))
+        .values(employee_id=bindparam('eid'), status='in_progress', updated_at=now),
+        params
+    )
+    db.session.execute(
+        update(notification_table)
+        .where(notification_table.c.project_id == bindparam('pid'))
+        .values(status=case((notification_table.c.employee_id == bindparam('eid'), 'assigned'), else_='closed'),
+                updated_at=now),
+        params
+    )
+    close_broadcasts([project_id for project_id, _ in assignments], now)
+    db.session.commit()
+    invalidate_list_cache('projects')
+    invalidate_list_cache('notifications')
+    
+    push_event('projects_assigned', {
+        'assignments': [{'project_id': project_id, 'employee_id': employee_id}
+                        for project_id, employee_id in assignments]
+    }, ADMIN_ROOM, EMPLOYEES_ROOM)
+    return assignments
+
+def run_auto_assign_loop(interval):
+    while True:
+        with app.app_context():
+            try:
+                assignments = auto_assign_pending_projects()
+                if assignments:
+                    app.logger.info('Auto-assigned %d projects', len(assignments))
+            except Exception:
+                db.session.rollback()
+                app.logger.exception('Auto-assignment pass failed')
+        socketio.sleep(interval)
+
+# Notification statuses that never change again and can leave the live table
+ARCHIVABLE_NOTIFICATION_STATUSES = ['closed', 'reject', 'assigned']
+ARCHIVE_COLUMNS = ['id', 'employee_id', 'project_id', 'status', 'created_at', 'updated_at']
+
+def archive_notifications(older_than_days=None, batch_size=None, export=None):
+    """
+    Moves finished notifications whose offer has closed and that were not
+    updated for `older_than_days` out of the live table, `batch_size` rows
+    per transaction so no lock is held for long.
+    Rows go to notification_archive, or with `export` (a writable binary file,
+    e.g. gzip.open(path, 'ab')) are written there as JSON lines instead.
+    Returns the number of rows moved.
+    """
+    if older_than_days is None:
+        older_than_days = app.config['NOTIFICATION_RETENTION_DAYS']
+    if batch_size is None:
+        batch_size = app.config['NOTIFICATION_ARCHIVE_BATCH_SIZE']
+    
+    cutoff = datetime.utcnow() - timedelta(days=older_than_days)
+    table = Notification.__table__
+    broadcast_table = NotificationBroadcast.__table__
+    columns = [table.c[name] for name in ARCHIVE_COLUMNS]
+    moved = 0
+    while True:
+        # A missing row means "pending", so answers to offers still open must stay. The
+        # status/updated_at range drives the scan; each broadcast is found by its unique project_id.
+        # Rows another pass is archiving right now are skipped.
+        ids = db.session.scalars(
+            select(table.c.id)
+            .join(broadcast_table, broadcast_table.c.project_id == table.c.project_id)
+            .where(table.c.status.in_(ARCHIVABLE_NOTIFICATION_STATUSES), table.c.updated_at < cutoff,
+                   broadcast_table.c.closed_at.isnot(None))
+            .limit(batch_size)
+            .with_for_update(skip_locked=True, of=table)
+        ).all()
+        if not ids:
+            db.session.rollback()
+            return moved
+        
+        if export is None:
+            db.session.execute(insert(NotificationArchive).from_select(
+                ARCHIVE_COLUMNS + ['archived_at'],
+                select(*columns, literal(datetime.utcnow())).where(table.c.id.in_(ids))
+            ))
+        else:
+            for row in db.session.execute(select(*columns).where(table.c.id.in_(ids))):
+                record = row._asdict()
+                record['created_at'] = row.created_at.isoformat() if row.created_at else None
+                record['updated_at'] = row.updated_at.isoformat() if row.updated_at else None
+                export.write(encode_json(record) + b'\n')
+            # The batch is on disk before its rows are deleted
+            export.flush()
+        db.session.execute(table.delete().where(table.c.id.in_(ids)))
+        db.session.commit()
+        moved += len(ids)
+
+def run_archive_loop(interval):
+    while True:
+        with app.app_context():
+            try:
+                moved = archive_notifications()
+                if moved:
+                    app.logger.info('Archived %d notifications', moved)
+            except Exception:
+                db.session.rollback()
+                app.logger.exception('Notification archive pass failed')
+        socketio.sleep(interval)
+
+# Deadline engine: upcoming deadlines wait in a timer heap, passed ones are marked in bulk
+class DeadlineScheduler:
+    """
+    Timers for project deadlines, kept in a min-heap: a warning
+    DEADLINE_WARNING_HOURS before each deadline and an overdue mark when it
+    passes. Only deadlines within the current window (DEADLINE_WINDOW_HOURS)
+    are held; the next window is read from ix_project_overdue_deadline as the
+    current one runs out, so the project table is never scanned on a timer.
+    create_project and update_project push changed deadlines directly. Changes
+    made by other processes arrive through a read of recently updated projects
+    every DEADLINE_SYNC_SECONDS. Superseded timers are dropped when popped.
+    """
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.heap = []  # (fires_at, kind, project_id, deadline)
+        self.deadlines = {}  # project_id -> the deadline its timers are for
+        self.window_end = None
+        self.synced_at = None
+        self.wakeup = threading.Event()
+        self.running = False
+
+    def push(self, project_id, deadline, warn_from=None):
+        """Add timers for one deadline (lock held); warnings due before warn_from are skipped"""
+        if self.deadlines.get(project_id) == deadline:
+            return
+        self.deadlines[project_id] = deadline
+        heapq.heappush(self.heap, (deadline, 'overdue', project_id, deadline))
+        if self.warning:
+            warn_at = deadline - self.warning
+            if warn_from is None or warn_at >= warn_from:
+                heapq.heappush(self.heap, (warn_at, 'warn', project_id, deadline))
+
+    def schedule(self, project_id, deadline, active=True):
+        """Track a project's new deadline, or stop tracking it (no deadline, completed, already overdue)"""
+        if not self.running:
+            return
+        with self.lock:
+            if self.window_end is None:
+                return
+            if not active or deadline is None or deadline >= self.window_end:
+                # Deadlines past the window are loaded with the window that reaches them
+                self.deadlines.pop(project_id, None)
+                return
+            self.push(project_id, deadline)
+        self.wakeup.set()
+
+    def load_window(self, start, end, warn_from=None):
+        rows = db.session.execute(
+            select(Project.id, Project.deadline).where(
+                Project.overdue_at.is_(None),
+                Project.deadline < end,
+                *([Project.deadline >= start] if start else []),
+                Project.status != 'completed'
+            )
+        ).all()
+        with self.lock:
+            for project_id, deadline in rows:
+                self.push(project_id, deadline, warn_from)
+            self.window_end = end
+
+    def sync(self, now):
+        """Apply deadline changes made since the last sync, found through ix_project_updated_at"""
+        # Overlap by one period: a row's updated_at is set before its transaction commits
+        since = self.synced_at - self.sync_interval
+        self.synced_at = now
+        rows = db.session.execute(
+            select(Project.id, Project.deadline, Project.overdue_at, Project.status)
+            .where(Project.updated_at >= since)
+        ).all()
+        with self.lock:
+            for project_id, deadline, overdue_at, status in rows:
+                if deadline is None or overdue_at is not None or status == 'completed' or deadline >= self.window_end:
+                    self.deadlines.pop(project_id, None)
+                else:
+                    self.push(project_id, deadline)
+
+    def fire(self, now):
+        """Mark every passed deadline overdue in one UPDATE and send the due warnings"""
+        if self.window_end is None:
+            # Deadlines missed while no sweeper ran are marked now; their warnings are not sent
+            self.load_window(None, now + max(self.window, self.warning), warn_from=now)
+        while now + self.warning >= self.window_end:
+            self.load_window(self.window_end, self.window_end + self.window)
+        if now - self.synced_at >= self.sync_interval:
+            self.sync(now)
+        
+        overdue, warned = [], []
+        with self.lock:
+            while self.heap and self.heap[0][0] <= now:
+                _, kind, project_id, deadline = heapq.heappop(self.heap)
+                if self.deadlines.get(project_id) != deadline:
+                    continue
+                if kind == 'overdue':
+                    del self.deadlines[project_id]
+                    overdue.append(project_id)
+                else:
+                    warned.append(project_id)
+        
+        project_table = Project.__table__
+        if overdue:
+            # Rows completed, already marked or moved later since the timer was set are skipped
+            marked = db.session.execute(
+                update(project_table)
+                .where(project_table.c.id.in_(overdue), project_table.c.overdue_at.is_(None),
+                       project_table.c.deadline <= now, project_table.c.status != 'completed')
+                .values(overdue_at=now, updated_at=now)
+                .returning(project_table.c.id, project_table.c.employee_id)
+            ).all()
+            db.session.commit()
+            if marked:
+                invalidate_list_cache('projects')
+                rooms = {employee_room(employee_id) for _, employee_id in marked if employee_id}
+                push_event('projects_overdue', {
+                    'project_ids': [project_id for project_id, _ in marked],
+                    'overdue_at': now.isoformat()
+                }, ADMIN_ROOM, *rooms)
+                app.logger.info('Marked %d projects overdue', len(marked))
+        if warned:
+            upcoming = db.session.execute(
+                select(Project.id, Project.title, Project.deadline, Project.employee_id)
+                .where(Project.id.in_(warned), Project.overdue_at.is_(None), Project.status != 'completed')
+            ).all()
+            db.session.rollback()
+            if upcoming:
+                rooms = {employee_room(row.employee_id) for row in upcoming if row.employee_id}
+                push_event('deadlines_approaching', {
+                    'projects': [{'id': row.id, 'title': row.title, 'deadline': row.deadline.isoformat(),
+                                  'employee_id': row.employee_id} for row in upcoming]
+                }, ADMIN_ROOM, *rooms)
+
+    def next_wakeup(self, now):
+        """Seconds until the earliest timer, the next window load or the next sync"""
+        if self.window_end is None:
+            return 0.0
+        with self.lock:
+            due = [self.window_end - self.warning, self.synced_at + self.sync_interval]
+            if self.heap:
+                due.append(self.heap[0][0])
+        return max(0.0, (min(due) - now).total_seconds())
+
+    def configure(self, window_hours=None, warning_hours=None, sync_seconds=None):
+        """Set the window, warning lead and sync period, defaulting to the DEADLINE_* settings"""
+        self.window = timedelta(hours=window_hours or app.config['DEADLINE_WINDOW_HOURS'])
+        if self.window <= timedelta(0):
+            raise ValueError('The deadline window must be positive')
+        self.warning = timedelta(hours=app.config['DEADLINE_WARNING_HOURS'] if warning_hours is None else warning_hours)
+        self.sync_interval = timedelta(seconds=sync_seconds or app.config['DEADLINE_SYNC_SECONDS'])
+        self.synced_at = datetime.utcnow()
+
+    def run(self, window_hours=None, warning_hours=None, sync_seconds=None):
+        """Sweep deadlines forever; call from a background task or a dedicated process"""
+        self.configure(window_hours, warning_hours, sync_seconds)
+        self.running = True
+        while True:
+            self.wakeup.clear()
+            self.wakeup.wait(self.next_wakeup(datetime.utcnow()))
+            with app.app_context():
+                try:
+                    self.fire(datetime.utcnow())
+                except Exception:
+                    db.session.rollback()
+                    app.logger.exception('Deadline sweep failed')
+                    socketio.sleep(1)
+
+deadline_scheduler = DeadlineScheduler()
+
+# Per-request instrumentation exposed at /metrics (Prometheus text format)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+# Statements kept per request for the slow-request log
+SLOW_LOG_MAX_STATEMENTS = 50
+
+class RequestMetrics:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.routes = {}
+        self.connected_clients = 0
+
+    def observe(self, method, route, status, seconds, statements, db_seconds, response_bytes):
+        with self.lock:
+            stats = self.routes.get((method, route))
+            if stats is None:
+                stats = self.routes[(method, route)] = {
+                    'buckets': [0] * len(LATENCY_BUCKETS), 'count': 0, 'seconds': 0.0,
+                    'statements': 0, 'db_seconds': 0.0, 'response_bytes': 0, 'statuses': {}
+                }
+            for i, bound in enumerate(LATENCY_BUCKETS):
+                if seconds <= bound:
+                    stats['buckets'][i] += 1
+            stats['count'] += 1
+            stats['seconds'] += seconds
+            stats['statements'] += statements
+            stats['db_seconds'] += db_seconds
+            stats['response_bytes'] += response_bytes
+            stats['statuses'][status] = stats['statuses'].get(status, 0) + 1
+
+    def socket_connected(self, delta):
+        with self.lock:
+            self.connected_clients += delta
+
+    def render(self):
+        with self.lock:
+            routes = [(f'method="{method}",route="{route}"', dict(stats, buckets=list(stats['buckets']),
+                                                                  statuses=dict(stats['statuses'])))
+                      for (method, route), stats in sorted(self.routes.items())]
+            connected_clients = self.connected_clients
+        
+        lines = ['# TYPE http_request_duration_seconds histogram']
+        for labels, stats in routes:
+            for bound, count in zip(LATENCY_BUCKETS, stats['buckets']):
+                lines.append(f'http_request_duration_seconds_bucket{{{labels},le="{bound}"}} {count}')
+            lines.append(f'http_request_duration_seconds_bucket{{{labels},le="+Inf"}} {stats["count"]}')
+            lines.append(f'http_request_duration_seconds_sum{{{labels}}} {stats["seconds"]:.6f}')
+            lines.append(f'http_request_duration_seconds_count{{{labels}}} {stats["count"]}')
+        lines.append('# TYPE http_requests_total counter')
+        for labels, stats in routes:
+            for status, count in sorted(stats['statuses'].items()):
+                lines.append(f'http_requests_total{{{labels},status="{status}"}} {count}')
+        for name, key, fmt in (('http_request_sql_statements_total', 'statements', 'd'),
+                               ('http_request_db_seconds_total', 'db_seconds', '.6f'),
+                               ('http_response_bytes_total', 'response_bytes', 'd')):
+            lines.append(f'# TYPE {name} counter')
+            for labels, stats in routes:
+                lines.append(f'{name}{{{labels}}} {stats[key]:{fmt}}')
+        lines.append('# TYPE socketio_connected_clients gauge')
+        lines.append(f'socketio_connected_clients {connected_clients}')
+        cache = employee_directory_cache.stats()
+        lines.append('# TYPE employee_cache_requests_total counter')
+        lines.append(f'employee_cache_requests_total{{result="hit"}} {cache["hits"]}')
+        lines.append(f'employee_cache_requests_total{{result="miss"}} {cache["misses"]}')
+        lists = list_response_cache.stats()
+        lines.append('# TYPE list_cache_requests_total counter')
+        lines.append(f'list_cache_requests_total{{result="hit"}} {lists["hits"]}')
+        lines.append(f'list_cache_requests_total{{result="coalesced"}} {lists["coalesced"]}')
+        lines.append(f'list_cache_requests_total{{result="miss"}} {lists["misses"]}')
+        return '\n'.join(lines) + '\n'
+
+request_metrics = RequestMetrics()
+
+# The start time lives on the statement's execution context, so a statement that raises
+# (and never reaches after_cursor_execute) leaves nothing behind on the pooled connection
+@event.listens_for(Engine, 'before_cursor_execute')
+def start_statement_timer(conn, cursor, statement, parameters, context, executemany):
+    if context is not None:
+        context.statement_started = time.perf_counter()
+
+@event.listens_for(Engine, 'after_cursor_execute')
+def record_statement(conn, cursor, statement, parameters, context, executemany):
+    started = getattr(context, 'statement_started', None)
+    if started is None or not has_request_context() or 'request_started' not in g:
+        return
+    elapsed = time.perf_counter() - started
+    g.sql_statements += 1
+    g.db_seconds += elapsed
+    if len(g.sql_log) < SLOW_LOG_MAX_STATEMENTS:
+        g.sql_log.append((elapsed, statement))
+
+@app.before_request
+def start_request_timer():
+    g.request_started = time.perf_counter()
+    g.sql_statements = 0
+    g.db_seconds = 0.0
+    g.sql_log = []
+
+@app.after_request
+def record_request_metrics(response):
+    if 'request_started' not in g:
+        return response
+    elapsed = time.perf_counter() - g.request_started
+    route = request.url_rule.rule if request.url_rule else 'unmatched'
+    response_bytes = 0 if response.is_streamed else (response.calculate_content_length() or 0)
+    request_metrics.observe(request.method, route, response.status_code, elapsed,
+                            g.sql_statements, g.db_seconds, response_bytes)
+    
+    if app.config['SERVER_TIMING']:
+        response.headers['Server-Timing'] = (
+            f'db;dur={g.db_seconds * 1000:.1f};desc="{g.sql_statements} queries", '
+            f'total;dur={elapsed * 1000:.1f}'
+        )
+    
+    if elapsed * 1000 >= app.config['SLOW_REQUEST_MS']:
+        statements = '\n'.join(f'  {seconds * 1000:8.1f} ms  {" ".join(sql.split())}' for seconds, sql in g.sql_log)
+        app.logger.warning('Slow request %s %s: %.1f ms, %d queries, %.1f ms in DB\n%s',
+                           request.method, request.full_path, elapsed * 1000,
+                           g.sql_statements, g.db_seconds * 1000, statements)
+    return response
+
+@app.after_request
+def compress_response(response):
+    """gzip/brotli-encode JSON bodies that are worth it (streamed lists compress themselves)"""
+    if (response.is_streamed or response.status_code != 200 or response.mimetype != 'application/json'
+            or 'Content-Encoding' in response.headers):
+        return response
+    response.vary.add('Accept-Encoding')
+    encoding = negotiate_encoding()
+    body = response.get_data()
+    if encoding is None or len(body) < app.config['COMPRESS_MIN_BYTES']:
+        return response
+    compress, finish = make_compressor(encoding)
+    response.set_data(compress(body) + finish())
+    response.headers['Content-Encoding'] = encoding
+    return response
+
+@app.route('/metrics', methods=['GET'])
+def metrics():
+    return app.response_class(request_metrics.render(), mimetype='text/plain; version=0.0.4')
+
 # Define routes directly in this file
 @app.route('/')
 def index():
@@ -134,16 +1973,22 @@ def signup():
     
     if Employee.query.filter_by(employee_id=data['employee_id']).first():
         return jsonify({'error': 'Employee ID already exists'}), 400
+    
+    try:
+        password_hash = run_password_work(generate_password_hash, data['password'])
+    except PasswordHasherBusy:
+        return busy_response()
         
     employee = Employee(
         name=data['name'],
         employee_id=data['employee_id'],
         role=data['role'],
-        password_hash=generate_password_hash(data['password'])
+        password_hash=password_hash
     )
     
     db.session.add(employee)
     db.session.commit()
+    invalidate_employee_directory()
     
     return jsonify({'message': 'Employee created successfully'}), 201
 
@@ -152,49 +1997,150 @@ def login():
     data = request.get_json()
     employee = Employee.query.filter_by(employee_id=data['employee_id']).first()
     
-    if employee and check_password_hash(employee.password_hash, data['password']):
-        return jsonify(employee.to_dict())
+    try:
+        valid = employee and run_password_work(check_password_hash, employee.password_hash, data['password'])
+    except PasswordHasherBusy:
+        return busy_response()
+    
+    if valid:
+        response = employee.to_dict()
+        try:
+            response['token'] = issue_token(employee)
+        except TokenSigningDisabled:
+            return jsonify({'error': 'Login is disabled until SECRET_KEY is configured'}), 503
+        return jsonify(response)
     
     return jsonify({'error': 'Invalid credentials'}), 401
 
 @app.route('/api/auth/check', methods=['GET'])
 def check_auth():
-    # Simple stub for auth check - in a real app this would use sessions/JWT
-    return jsonify({'error': 'Not authenticated'}), 401
+    # Verified from the signed token alone - no DB lookup, no hashing
+    identity = current_identity()
+    if not identity:
+        return jsonify({'error': 'Not authenticated'}), 401
+    return jsonify(identity)
 
 # Project routes
 @app.route('/api/projects', methods=['GET'])
+@coalesced_list('projects')
 def get_projects():
+    """
+    Lists projects, either for one employee or all of them (admin view).
+    Supports `If-None-Match` (304 when unchanged) and `?since=<cursor>`, which
+    returns only rows changed after the cursor plus ids of removed rows.
+    Filters: status, priority, unassigned, deadline_from, deadline_to.
+    Paging: sort, limit, after (see build_page). `embed=assignee` adds each
+    project's assignee (id, name, rating), joined in the same query.
+    """
     employee_id_param = request.args.get('employee_id')
+    try:
+        since = parse_since_cursor()
+    except ValueError:
+        return jsonify({'error': 'Invalid since cursor'}), 400
+    try:
+        page = parse_page_args(PROJECT_SORT_KEYS)
+        statuses = parse_list_arg('status')
+        priorities = parse_list_arg('priority', int)
+        deadline_from = parse_datetime_arg('deadline_from')
+        deadline_to = parse_datetime_arg('deadline_to')
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    cursor = sync_cursor()
     
+    scope_employee_id = None
+    query = Project.query
     if employee_id_param:
         # First try to treat it as a numeric ID directly
         try:
-            employee_id = int(employee_id_param)
-            projects = Project.query.filter_by(employee_id=employee_id).all()
+            scope_employee_id = int(employee_id_param)
         except ValueError:
             # If not a numeric ID, treat as employee_id string
             employee = Employee.query.filter_by(employee_id=employee_id_param).first()
-            if employee:
-                projects = Project.query.filter_by(employee_id=employee.id).all()
-            else:
-                projects = []
-    else:
-        # If no employee_id is provided, return all projects (admin view)
-        projects = Project.query.all()
+            scope_employee_id = employee.id if employee else None
+            if not employee:
+                query = query.filter(false())
+        query = query.filter(Project.employee_id == scope_employee_id)
+    # If no employee_id is provided, return all projects (admin view)
+    elif request.args.get('unassigned') == 'true':
+        query = query.filter(Project.employee_id.is_(None))
+    
+    if statuses:
+        query = query.filter(Project.status.in_(statuses))
+    if priorities:
+        query = query.filter(Project.priority.in_(priorities))
+    if deadline_from:
+        query = query.filter(Project.deadline >= deadline_from)
+    if deadline_to:
+        query = query.filter(Project.deadline <= deadline_to)
+    
+    count, last_updated = query.with_entities(func.count(), func.max(Project.updated_at)).one()
+    last_removed = db.session.query(func.max(Tombstone.removed_at)).filter(Tombstone.resource == 'project').scalar()
+    etag_parts = ['projects', request.query_string, count, last_updated, last_removed]
+    
+    serialize = Project.to_dict
+    if request.args.get('embed') == 'assignee':
+        # Assignees come from the same statement; a rating change also changes the ETag
+        query = query.outerjoin(Project.employee).options(contains_eager(Project.employee))
+        serialize = Project.to_dict_with_assignee
+        etag_parts.append(db.session.query(func.max(Employee.rated_at)).scalar())
+    etag = list_etag(*etag_parts)
+    
+    if since is None:
+        return conditional_list_response(
+            etag, cursor, lambda: build_page(query, page, Project.id, serialize, stream=True)
+        )
     
-    return jsonify([project.to_dict() for project in projects])
+    def build_delta():
+        changed = query.filter(Project.updated_at > since).all()
+        return {
+            'changed': [serialize(project) for project in changed],
+            'removed': tombstone_ids('project', since, scope_employee_id),
+            'cursor': cursor.isoformat()
+        }
+    return conditional_list_response(etag, cursor, build_delta)
+
+@app.route('/api/projects/search', methods=['GET'])
+def search_projects():
+    """
+    Full-text search over project titles and descriptions, best match first.
+    `q` is required; `limit` (default 20) and `status` are optional. Each
+    item is the project plus its `rank` and highlighted `title_highlight`
+    and `description_highlight`.
+    """
+    q = (request.args.get('q') or '').strip()
+    if not q:
+        return jsonify({'error': 'q is required'}), 400
+    limit = request.args.get('limit', 20, type=int)
+    if limit < 1:
+        return jsonify({'error': 'limit must be positive'}), 400
+    limit = min(limit, MAX_PAGE_SIZE)
+    statuses = parse_list_arg('status')
+    
+    if db.engine.dialect.name == 'postgresql':
+        results = search_projects_postgres(q, limit, statuses)
+    else:
+        results = project_search_index.search(q, limit, statuses)
+    return jsonify({
+        'query': q,
+        'items': [dict(project.to_dict(), rank=round(rank, 6), title_highlight=title_highlight,
+                       description_highlight=description_highlight)
+                  for project, rank, title_highlight, description_highlight in results]
+    })
 
 @app.route('/api/projects/<int:project_id>/finalize-assignment', methods=['POST'])
 def finalize_project_assignment(project_id):
     """
     Finalizes project assignment by selecting the highest-rated employee 
     from those who accepted the project.
+    Runs as one transaction holding a row lock on the project, so concurrent
+    calls assign it once; the later caller sees it as already assigned.
+    The lock is FOR NO KEY UPDATE: a response holds FOR SHARE on the broadcast
+    while its inserts take KEY SHARE on the project, and FOR UPDATE here (we
+    lock the broadcast next) would deadlock with it.
     """
-    project = Project.query.get_or_404(project_id)
+    project = Project.query.filter_by(id=project_id).with_for_update(key_share=True).first_or_404()
     
-    # If project is already assigned, do nothing
-    if project.employee_id is not None:
+    def already_assigned():
         assigned_employee = Employee.query.get(project.employee_id)
         return jsonify({
             'message': 'Project is already assigned',
@@ -202,35 +2148,52 @@ def finalize_project_assignment(project_id):
             'employee': assigned_employee.to_dict() if assigned_employee else None
         }), 200
     
-    # Get all employees who accepted this project
-    employees_accepted = [emp for emp in project.accepted_by]
+    # If project is already assigned, do nothing
+    if project.employee_id is not None:
+        return already_assigned()
     
-    if not employees_accepted:
-        return jsonify({'error': 'No employees have accepted this project yet'}), 400
+    # Responses in flight commit first, and later ones are turned away once we close the offer
+    lock_broadcasts([project.id])
     
-    # Find the highest rated employee
-    highest_rated = max(employees_accepted, key=lambda e: e.rating)
+    # Find the highest rated employee among those who accepted this project
+    highest_rated = Employee.query.join(
+        project_acceptances, project_acceptances.c.employee_id == Employee.id
+    ).filter(
+        project_acceptances.c.project_id == project.id
+    ).order_by(Employee.rating.desc().nulls_last(), Employee.id).first()
     
-    # Assign project to the highest rated employee
-    project.employee_id = highest_rated.id
-    project.status = 'in_progress'
-    db.session.commit()
+    if not highest_rated:
+        return jsonify({'error': 'No employees have accepted this project yet'}), 400
     
-    # Close ALL notifications for this project, regardless of their current status
-    # This prevents any further acceptances or rejections
-    all_notifications = Notification.query.filter_by(
-        project_id=project.id
-    ).all()
+    # Assign project to the highest rated employee, guarded for databases without row locks (SQLite)
+    assigned = Project.query.filter(Project.id == project.id, Project.employee_id.is_(None)).update({
+        Project.employee_id: highest_rated.id,
+        Project.status: 'in_progress',
+        Project.updated_at: datetime.utcnow()
+    })
+    if not assigned:
+        db.session.rollback()
+        db.session.refresh(project)
+        return already_assigned()
     
-    for notification in all_notifications:
-        if notification.employee_id != highest_rated.id:
-            # Set all other notifications to 'closed'
-            notification.status = 'closed'
-        else:
-            # Set the winning employee's notification to 'assigned'
-            notification.status = 'assigned'
+    # Close the offer for everyone: the winning employee's response becomes 'assigned',
+    # every other response 'closed', and employees who never answered stop seeing it
+    now = datetime.utcnow()
+    Notification.query.filter_by(project_id=project.id).update({
+        Notification.status: case((Notification.employee_id == highest_rated.id, 'assigned'), else_='closed'),
+        Notification.updated_at: now
+    }, synchronize_session=False)
+    close_broadcasts([project.id], now)
     
     db.session.commit()
+    invalidate_list_cache('projects')
+    invalidate_list_cache('notifications')
+    
+    # Other employees drop the offer, the winner picks up the project
+    push_event('project_assigned', {
+        'project': project.to_dict(),
+        'employee': highest_rated.to_dict()
+    }, ADMIN_ROOM, EMPLOYEES_ROOM)
     
     # Return detailed response
     return jsonify({
@@ -249,8 +2212,8 @@ def create_project():
         return jsonify({'error': 'Project title is required'}), 400
     
     # Get admin user to set as creator
-    admin = Employee.query.filter_by(is_admin=True).first()
-    if not admin:
+    admin_id = get_admin_id()
+    if not admin_id:
         return jsonify({'error': 'No admin user found to set as project creator'}), 500
     
     # Create new project - always unassigned initially
@@ -259,49 +2222,44 @@ def create_project():
         description=data.get('description', ''),
         priority=int(data.get('priority', 1)),
         status='pending',
-        created_by=admin.id,
+        created_by=admin_id,
         deadline=datetime.fromisoformat(data.get('deadline')) if data.get('deadline') else None,
         employee_id=None  # Always unassigned initially
     )
     
     db.session.add(new_project)
     db.session.commit()
+    invalidate_list_cache('projects')
+    deadline_scheduler.schedule(new_project.id, new_project.deadline)
+    
+    response = new_project.to_dict()
     
     # Create notifications for all non-admin employees
-    non_admin_employees = Employee.query.filter_by(is_admin=False).all()
-    
-    notifications_created = []
-    for employee in non_admin_employees:
-        notification = Notification(
-            employee_id=employee.id,
-            project_id=new_project.id,
-            status='pending'
-        )
-        db.session.add(notification)
-        notifications_created.append({
-            'employee_id': employee.id,
-            'employee_name': employee.name
-        })
+    if app.config['NOTIFICATION_FANOUT_ASYNC']:
+        job_id = f'{new_project.id}-{uuid.uuid4().hex}'
+        job = {
+            'id': job_id,
+            'project_id': new_project.id,
+            'status': 'running',
+            'started_at': datetime.utcnow().isoformat()
+        }
+        fanout_jobs.set(job_id, job)
+        socketio.start_background_task(run_fanout_job, job, new_project.id)
+        response['fanout_job'] = job_id
+        return jsonify(response), 202
     
-    db.session.commit()
+    response['notifications_sent'] = fan_out_notifications(new_project.id)
     
-    return jsonify({
-        'id': new_project.id,
-        'title': new_project.title,
-        'description': new_project.description,
-        'priority': new_project.priority,
-        'status': new_project.status,
-        'created_at': new_project.created_at.isoformat(),
-        'deadline': new_project.deadline.isoformat() if new_project.deadline else None,
-        'employee_id': new_project.employee_id,
-        'notifications_sent': len(notifications_created),
-        'notified_employees': notifications_created
-    }), 201
+    # Employees re-fetch their notifications once instead of polling for them
+    push_event('new_project', {'project': new_project.to_dict()}, ADMIN_ROOM, EMPLOYEES_ROOM)
+    
+    return jsonify(response), 201
 
 @app.route('/api/projects/<int:project_id>', methods=['PUT'])
 def update_project(project_id):
     project = Project.query.get_or_404(project_id)
     data = request.get_json()
+    previous_employee_id = project.employee_id
     
     if 'status' in data:
         project.status = data['status']
@@ -313,32 +2271,312 @@ def update_project(project_id):
         project.description = data['description']
     if 'deadline' in data and data['deadline']:
         project.deadline = datetime.fromisoformat(data['deadline'])
+        # A deadline moved into the future is no longer overdue
+        if project.overdue_at and project.deadline > datetime.utcnow():
+            project.overdue_at = None
+    
+    # The project leaves the previous assignee's list
+    if previous_employee_id and previous_employee_id != project.employee_id:
+        db.session.add(Tombstone(resource='project', resource_id=project.id, employee_id=previous_employee_id))
     
     db.session.commit()
+    invalidate_list_cache('projects')
+    # Notification rows carry the project's title, description and priority
+    invalidate_list_cache('notifications')
+    if 'deadline' in data or 'status' in data:
+        deadline_scheduler.schedule(project.id, project.deadline,
+                                    active=project.overdue_at is None and project.status != 'completed')
+    
+    # Notify admins plus the previous and current assignee (if any)
+    rooms = {employee_room(eid) for eid in (previous_employee_id, project.employee_id) if eid}
+    push_event('project_updated', project.to_dict(), ADMIN_ROOM, *rooms)
     
     return jsonify(project.to_dict())
 
+@app.route('/api/projects/bulk', methods=['POST'])
+def bulk_import_projects():
+    """
+    Imports projects from a JSON Lines (default) or CSV (`Content-Type: text/csv`,
+    header row naming title, description, priority, deadline) request body.
+    The body is read and validated row by row as it streams in; see import_projects.
+    """
+    admin_id = get_admin_id()
+    if not admin_id:
+        return jsonify({'error': 'No admin user found to set as project creator'}), 500
+    
+    lines = io.TextIOWrapper(io.BufferedReader(request.stream), encoding='utf-8', newline='')
+    rows = iter_csv_rows(lines) if request.mimetype == 'text/csv' else iter_jsonl_rows(lines)
+    report = import_projects(rows, admin_id)
+    return jsonify(report), 201 if report['created'] else 400
+
+@app.route('/api/projects', methods=['PATCH'])
+def bulk_patch_projects():
+    """
+    Sets status, priority and/or employee_id on every project in `ids`. A null
+    employee_id unassigns: the projects go back to pending and are offered again.
+    """
+    data = request.get_json()
+    project_ids = data.get('ids')
+    if not isinstance(project_ids, list) or not project_ids:
+        return jsonify({'error': 'ids must be a non-empty list'}), 400
+    if len(project_ids) > MAX_BULK_IDS:
+        return jsonify({'error': f'At most {MAX_BULK_IDS} ids per request'}), 400
+    try:
+        project_ids = [int(project_id) for project_id in project_ids]
+    except (TypeError, ValueError):
+        return jsonify({'error': 'ids must be integers'}), 400
+    
+    changes = {key: data[key] for key in ('status', 'priority', 'employee_id') if key in data}
+    if not changes:
+        return jsonify({'error': 'Nothing to update'}), 400
+    if 'status' in changes and changes['status'] not in PROJECT_STATUSES:
+        return jsonify({'error': f"Invalid status: {changes['status']}"}), 400
+    if 'priority' in changes:
+        try:
+            changes['priority'] = int(changes['priority'])
+        except (TypeError, ValueError):
+            return jsonify({'error': 'priority must be an integer'}), 400
+    if 'employee_id' in changes and changes['employee_id'] is None:
+        if changes.setdefault('status', 'pending') != 'pending':
+            return jsonify({'error': 'Unassigned projects go back to pending'}), 400
+    elif 'employee_id' in changes:
+        try:
+            changes['employee_id'] = int(changes['employee_id'])
+        except (TypeError, ValueError):
+            return jsonify({'error': 'employee_id must be an integer or null'}), 400
+        if not Employee.query.get(changes['employee_id']):
+            return jsonify({'error': 'Employee not found'}), 404
+    
+    updated = bulk_update_projects(project_ids, changes)
+    return jsonify({
+        'updated': len(updated),
+        'missing': sorted(set(project_ids) - set(updated))
+    })
+
+@app.route('/api/jobs/<job_id>', methods=['GET'])
+def get_fanout_job(job_id):
+    job = fanout_jobs.get(job_id)
+    if job:
+        return jsonify(job)
+    
+    # Started by another worker (or before a restart): the broadcast exists once it is done
+    project_id = job_id.split('-', 1)[0]
+    if not project_id.isdigit() or not Project.query.get(int(project_id)):
+        return jsonify({'error': 'Job not found'}), 404
+    done = NotificationBroadcast.query.filter_by(project_id=int(project_id)).first() is not None
+    return jsonify({
+        'id': job_id,
+        'project_id': int(project_id),
+        'status': 'completed' if done else 'running'
+    })
+
+# Dashboard routes
+@app.route('/api/dashboard/summary', methods=['GET'])
+def get_dashboard_summary():
+    """
+    Admin dashboard figures, aggregated in the database with one GROUP BY per table:
+    project counts by status and priority, overdue and unassigned counts, and
+    per-employee active workload, overdue projects and acceptance rate. Responses
+    include archived notifications, so archiving does not move the rate.
+    """
+    now = datetime.utcnow()
+    unfinished = Project.status != 'completed'
+    overdue = case((and_(Project.deadline < now, unfinished), 1), else_=0)
+    
+    by_status, by_priority = {}, {}
+    total = overdue_total = unassigned = 0
+    for status, priority, count, overdue_count, unassigned_count in db.session.execute(
+        select(Project.status, Project.priority, func.count(), func.sum(overdue),
+               func.sum(case((Project.employee_id.is_(None), 1), else_=0)))
+        .group_by(Project.status, Project.priority)
+    ):
+        by_status[str(status)] = by_status.get(str(status), 0) + count
+        by_priority[priority] = by_priority.get(priority, 0) + count
+        total += count
+        overdue_total += overdue_count or 0
+        unassigned += unassigned_count or 0
+    
+    workload = {employee_id: (active, late) for employee_id, active, late in db.session.execute(
+        select(Project.employee_id, func.count(), func.sum(overdue))
+        .where(Project.employee_id.isnot(None), unfinished)
+        .group_by(Project.employee_id)
+    )}
+    # Archived responses still count, as their acceptances stay in project_acceptances
+    answers = select(Notification.employee_id).where(Notification.status != 'pending').union_all(
+        select(NotificationArchive.employee_id)
+    ).subquery()
+    responses = dict(db.session.execute(
+        select(answers.c.employee_id, func.count()).group_by(answers.c.employee_id)
+    ).all())
+    acceptances = dict(db.session.execute(
+        select(project_acceptances.c.employee_id, func.count()).group_by(project_acceptances.c.employee_id)
+    ).all())
+    
+    employees = []
+    for employee_id, name, rating in db.session.execute(
+        select(Employee.id, Employee.name, Employee.rating).where(Employee.is_admin == False)  # noqa: E712
+    ):
+        active, late = workload.get(employee_id, (0, 0))
+        answered = responses.get(employee_id, 0)
+        accepted = acceptances.get(employee_id, 0)
+        employees.append({
+            'id': employee_id,
+            'name': name,
+            'rating': rating,
+            'active_projects': active,
+            'overdue_projects': late or 0,
+            'responses': answered,
+            'acceptances': accepted,
+            'acceptance_rate': round(accepted / answered, 4) if answered else None
+        })
+    employees.sort(key=lambda employee: (-employee['active_projects'], employee['id']))
+    
+    total_responses = sum(responses.values())
+    return jsonify({
+        'projects': {
+            'total': total,
+            'by_status': by_status,
+            'by_priority': {str(priority): count for priority, count in by_priority.items()},
+            'overdue': overdue_total,
+            'unassigned': unassigned
+        },
+        'employees': employees,
+        'acceptance_rate': round(sum(acceptances.values()) / total_responses, 4) if total_responses else None,
+        'generated_at': now.isoformat()
+    })
+
 # Employee routes
 @app.route('/api/employees', methods=['GET'])
 def get_employees():
-    employees = Employee.query.all()
-    return jsonify([employee.to_dict() for employee in employees])
+    """
+    Lists employees. Filters: role, is_admin, min_rating. Paging: sort, limit, after.
+    Responses are cached pre-rendered per query string until an employee changes.
+    """
+    cache_key = ('employees', request.query_string)
+    body = employee_directory_cache.get(cache_key)
+    if body is not None:
+        return app.response_class(body, mimetype='application/json')
+    
+    try:
+        page = parse_page_args(EMPLOYEE_SORT_KEYS)
+        roles = parse_list_arg('role')
+        min_rating = request.args.get('min_rating', type=float)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
+    query = Employee.query
+    if roles:
+        query = query.filter(Employee.role.in_(roles))
+    if request.args.get('is_admin') in ('true', 'false'):
+        query = query.filter(Employee.is_admin == (request.args.get('is_admin') == 'true'))
+    if min_rating is not None:
+        query = query.filter(Employee.rating >= min_rating)
+    
+    body = render_json(build_page(query, page, Employee.id, Employee.to_dict, stream=True))
+    employee_directory_cache.set(cache_key, body)
+    return app.response_class(body, mimetype='application/json')
+
+@app.route('/api/employees/leaderboard', methods=['GET'])
+def get_leaderboard():
+    """
+    Top `limit` (default 20) non-admin employees by average rating, or with
+    ?by=score by recency-weighted score. Filters: role, min_ratings (default
+    1, since unrated employees keep the flat default rating; 0 includes them).
+    Reads the first rows of the rating index instead of sorting the table.
+    """
+    cache_key = ('leaderboard', request.query_string)
+    body = employee_directory_cache.get(cache_key)
+    if body is not None:
+        return app.response_class(body, mimetype='application/json')
+    
+    by = request.args.get('by', 'rating')
+    if by not in LEADERBOARD_KEYS:
+        return jsonify({'error': f'Invalid leaderboard key: {by}'}), 400
+    limit = request.args.get('limit', 20, type=int)
+    if limit < 1:
+        return jsonify({'error': 'limit must be positive'}), 400
+    min_ratings = request.args.get('min_ratings', 1, type=int)
+    column = LEADERBOARD_KEYS[by]
+    
+    query = Employee.query.filter(Employee.is_admin == False, column.isnot(None))  # noqa: E712
+    role = request.args.get('role')
+    if role:
+        query = query.filter(Employee.role == role)
+    if min_ratings > 0:
+        query = query.filter(Employee.rating_count >= min_ratings)
+    leaders = query.order_by(column.desc(), Employee.id).limit(min(limit, MAX_LEADERBOARD_SIZE)).all()
+    
+    body = render_json([dict(employee.to_dict(), rank=rank) for rank, employee in enumerate(leaders, 1)])
+    employee_directory_cache.set(cache_key, body)
+    return app.response_class(body, mimetype='application/json')
+
+@app.route('/api/cache/stats', methods=['GET'])
+def get_cache_stats():
+    return jsonify({
+        'employee_directory': employee_directory_cache.stats(),
+        'list_responses': list_response_cache.stats()
+    })
 
 @app.route('/api/employees/<int:employee_id>/rating', methods=['PUT'])
 def update_employee_rating(employee_id):
-    employee = Employee.query.get_or_404(employee_id)
+    """Rates the employee; the response carries the updated averages"""
     data = request.get_json()
+    try:
+        value = parse_rating_value(data)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     
-    if 'rating' in data:
-        # Update the employee's rating
-        employee.rating = float(data['rating'])
-        db.session.commit()
-        return jsonify(employee.to_dict())
+    project_id = data.get('project_id')
+    if project_id is not None and not Project.query.get(project_id):
+        return jsonify({'error': 'Project not found'}), 404
     
-    return jsonify({'error': 'Rating not provided'}), 400
+    identity = current_identity()
+    recorded = record_rating(employee_id, value, project_id=project_id, comment=data.get('comment'),
+                             created_by=identity['id'] if identity else None)
+    if recorded is None:
+        return jsonify({'error': 'Employee not found'}), 404
+    _, employee = recorded
+    push_event('employee_updated', employee.to_dict(), ADMIN_ROOM, employee_room(employee.id))
+    return jsonify(employee.to_dict())
+
+# Rating routes
+@app.route('/api/ratings', methods=['POST'])
+def create_rating():
+    data = request.get_json()
+    try:
+        value = parse_rating_value(data)
+        employee_id = int(data.get('employee_id'))
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except TypeError:
+        return jsonify({'error': 'Employee ID is required'}), 400
+    
+    project_id = data.get('project_id')
+    if project_id is not None and not Project.query.get(project_id):
+        return jsonify({'error': 'Project not found'}), 404
+    
+    identity = current_identity()
+    recorded = record_rating(employee_id, value, project_id=project_id, comment=data.get('comment'),
+                             created_by=identity['id'] if identity else None)
+    if recorded is None:
+        return jsonify({'error': 'Employee not found'}), 404
+    rating, employee = recorded
+    push_event('employee_updated', employee.to_dict(), ADMIN_ROOM, employee_room(employee.id))
+    return jsonify({'rating': rating.to_dict(), 'employee': employee.to_dict()}), 201
+
+@app.route('/api/ratings/employee/<int:employee_id>', methods=['GET'])
+def get_employee_ratings(employee_id):
+    """An employee's rating history, newest first by default. Paging: sort, limit, after."""
+    try:
+        page = parse_page_args(RATING_SORT_KEYS, default_sort='-created_at')
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    query = Rating.query.filter(Rating.employee_id == employee_id)
+    return jsonify(build_page(query, page, Rating.id, Rating.to_dict))
 
 # Notification routes
 @app.route('/api/notifications', methods=['GET'])
+@coalesced_list('notifications')
 def get_notifications():
     employee_id = request.args.get('employee_id')
     
@@ -357,29 +2595,73 @@ def get_notifications():
     if not employee:
         return jsonify({'error': f'Employee with ID {employee_id} not found'}), 404
     
-    # Get all active notifications for this employee (pending or accept)
+    try:
+        since = parse_since_cursor()
+    except ValueError:
+        return jsonify({'error': 'Invalid since cursor'}), 400
+    try:
+        page = parse_page_args(NOTIFICATION_SORT_KEYS)
+        # Only narrows the active statuses, other statuses are never listed
+        statuses = parse_list_arg('status') or ACTIVE_NOTIFICATION_STATUSES
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    cursor = sync_cursor()
+    
+    notifications = employee_notifications(employee_id)
+    if employee.is_admin:
+        # Offers go to non-admin employees only
+        notifications = notifications.filter(false())
+    # Open offers this employee has not answered yet (pending) or has accepted
     # We include 'accept' status so that employees can see tasks they've already accepted
-    notifications = Notification.query.filter(
-        Notification.employee_id == employee_id,
-        Notification.status.in_(['pending', 'accept'])  # Get both pending and accepted notifications
-    ).all()
+    active_notifications = notifications.filter(open_notification_filter(statuses))
+    
+    count = active_notifications.with_entities(func.count()).scalar()
+    # Broadcasts change when created or closed, responses when the employee answers, and
+    # the offered projects when edited (rows carry their title, description and priority)
+    last_broadcast, last_response, last_project, last_removed = db.session.query(
+        select(func.max(NotificationBroadcast.updated_at)).scalar_subquery(),
+        select(func.max(Notification.updated_at)).where(Notification.employee_id == employee_id).scalar_subquery(),
+        select(func.max(Project.updated_at))
+        .join(NotificationBroadcast, NotificationBroadcast.project_id == Project.id)
+        .where(NotificationBroadcast.closed_at.is_(None)).scalar_subquery(),
+        select(func.max(Tombstone.removed_at)).where(Tombstone.resource == 'notification').scalar_subquery()
+    ).one()
+    etag = list_etag('notifications', request.query_string, count, last_broadcast, last_response, last_project,
+                     last_removed)
     
-    # Prepare notification data with project details
-    notification_data = []
-    for notification in notifications:
-        project = Project.query.get(notification.project_id)
-        if project:
-            notification_data.append({
-                'id': notification.id,
-                'project_id': notification.project_id,
-                'project_title': project.title,
-                'project_description': project.description,
-                'project_priority': project.priority,
-                'created_at': notification.created_at.isoformat(),
-                'status': notification.status  # Include notification status
-            })
-    
-    return jsonify(notification_data), 200
+    def serialize_one(row):
+        return {
+            'id': row.id,
+            'project_id': row.project_id,
+            'project_title': row.project_title,
+            'project_description': row.project_description,
+            'project_priority': row.project_priority,
+            'created_at': row.created_at.isoformat(),
+            'status': row.status  # Include notification status
+        }
+    
+    if since is None:
+        return conditional_list_response(
+            etag, cursor, lambda: build_page(active_notifications, page, NotificationBroadcast.id, serialize_one,
+                               stream=True)
+        )
+    
+    def build_delta():
+        # Broadcasts opened or closed since the cursor, offers this employee answered since,
+        # and offers whose project was edited since
+        changed = {row.id: row for row in notifications.filter(NotificationBroadcast.updated_at > since)}
+        changed.update((row.id, row) for row in notifications.filter(Notification.updated_at > since))
+        changed.update((row.id, row) for row in notifications.filter(Project.updated_at > since))
+        # Offers that were closed, rejected or assigned leave the list just like deleted ones
+        listed = {row.id for row in changed.values()
+                  if row.closed_at is None and row.status in ACTIVE_NOTIFICATION_STATUSES}
+        return {
+            'changed': [serialize_one(row) for row in changed.values() if row.id in listed],
+            'removed': [row.id for row in changed.values() if row.id not in listed]
+                       + tombstone_ids('notification', since, employee_id),
+            'cursor': cursor.isoformat()
+        }
+    return conditional_list_response(etag, cursor, build_delta)
 
 @app.route('/api/notifications/<int:notification_id>/respond', methods=['PUT'])
 def respond_to_notification(notification_id):
@@ -389,34 +2671,75 @@ def respond_to_notification(notification_id):
     if not response or response not in ['accept', 'reject']:
         return jsonify({'error': 'Invalid response'}), 400
     
-    notification = Notification.query.get_or_404(notification_id)
-    
-    # Update notification status to match the response (accept/reject)
-    notification.status = response
-    db.session.commit()  # Commit the notification status change
-    
-    # Get the project associated with this notification
-    project = Project.query.get(notification.project_id)
-    employee = Employee.query.get(notification.employee_id)
+    # FOR SHARE: finalize and auto-assignment lock the broadcast (lock_broadcasts) before they read
+    # the acceptances, so a response either commits before the winner is picked or sees the offer closed
+    broadcast = NotificationBroadcast.query.filter_by(id=notification_id).with_for_update(read=True).first_or_404()
     
-    if not project:
-        return jsonify({'error': 'Project not found'}), 404
+    # The responding employee comes from the auth token only; admins hand out offers, they do not take them
+    identity = current_identity()
+    if not identity:
+        db.session.rollback()
+        return jsonify({'error': 'Not authenticated'}), 401
     
+    employee = Employee.query.get(identity['id'])
     if not employee:
+        db.session.rollback()
         return jsonify({'error': 'Employee not found'}), 404
+    if employee.is_admin:
+        db.session.rollback()
+        return jsonify({'error': 'Admins cannot respond to project offers'}), 403
+    
+    if broadcast.closed_at is not None:
+        db.session.rollback()
+        return jsonify({'error': 'Project is no longer open for responses'}), 409
+    
+    # The employee's notification row is created by their first response and updated by later
+    # ones, in one statement; rows already 'assigned' or 'closed' are left alone
+    now = datetime.utcnow()
+    notification_table = Notification.__table__
+    upsert = dialect_insert(notification_table).values(
+        employee_id=employee.id, project_id=broadcast.project_id, status=response, created_at=now, updated_at=now
+    )
+    upsert = upsert.on_conflict_do_update(
+        index_elements=[notification_table.c.employee_id, notification_table.c.project_id],
+        set_={'status': upsert.excluded.status, 'updated_at': now},
+        where=notification_table.c.status.in_(['accept', 'reject'])
+    ).returning(notification_table.c.id)
+    if db.session.execute(upsert).scalar() is None:
+        db.session.rollback()
+        return jsonify({'error': 'Project is no longer open for responses'}), 409
     
     if response == 'accept':
-        # Add this employee to the project's accepted_by list
-        if employee not in project.accepted_by:
-            project.accepted_by.append(employee)
-            db.session.commit()
+        # Primary-key insert, so the cost does not grow with the number of acceptors and a retry is a no-op
+        db.session.execute(
+            dialect_insert(project_acceptances)
+            .values(project_id=broadcast.project_id, employee_id=employee.id)
+            .on_conflict_do_nothing()
+        )
         
         # IMPORTANT: DO NOT automatically assign the project to this employee
         # DO NOT close other notifications - we want to let other employees also accept the task
         # The admin will need to use the "Finalize Assignment" button to choose the highest-rated employee
+    else:
+        # A rejection withdraws an earlier acceptance, so finalize can no longer pick this employee
+        db.session.execute(project_acceptances.delete().where(
+            project_acceptances.c.project_id == broadcast.project_id,
+            project_acceptances.c.employee_id == employee.id
+        ))
+    
+    db.session.commit()
+    invalidate_list_cache('notifications', employee.id)
     
-    # If the employee rejected, just leave their notification as rejected
-    # No need to do anything else as the project assignment will be handled by admin
+    push_event('notification_updated', {
+        'id': broadcast.id,
+        'project_id': broadcast.project_id,
+        'status': response
+    }, employee_room(employee.id))
+    push_event(f'project_{response}ed', {
+        'project_id': broadcast.project_id,
+        'employee_id': employee.id,
+        'employee_name': employee.name
+    }, ADMIN_ROOM)
     
     return jsonify({'message': f'Notification {response}ed successfully'}), 200
 
@@ -424,4 +2747,11 @@ def respond_to_notification(notification_id):
 if __name__ == '__main__':
     with app.app_context():
         db.create_all()
-    app.run(debug=True, host='0.0.0.0', port=5003) 
\ No newline at end of file
+    if app.config['AUTO_ASSIGN_INTERVAL'] > 0:
+        socketio.start_background_task(run_auto_assign_loop, app.config['AUTO_ASSIGN_INTERVAL'])
+    if app.config['NOTIFICATION_ARCHIVE_INTERVAL'] > 0:
+        socketio.start_background_task(run_archive_loop, app.config['NOTIFICATION_ARCHIVE_INTERVAL'])
+    if app.config['DEADLINE_SWEEPER']:
+        socketio.start_background_task(deadline_scheduler.run)
+    # socketio.run serves WebSockets and runs background tasks on the eventlet hub
+    socketio.run(app, debug=True, host='0.0.0.0', port=5003, max_size=app.config['MAX_GREEN_THREADS'])
@@ -0,0 +1,44 @@
+"""
+Notification retention.
+
+Moves closed, rejected and assigned notifications whose offer has closed and
+that have not changed for --older-than days out of the live notification
+table, in batches of --batch-size rows per transaction. By default they go to the
+notification_archive table; with --export they are appended to a gzipped
+JSON-lines file instead.
+
+    python archive_notifications.py --older-than 30
+    python archive_notifications.py --older-than 90 --export notifications-archive.jsonl.gz
+    python archive_notifications.py --interval 3600
+"""
+from app import app, archive_notifications
+import argparse
+import gzip
+import time
+
+def archive(older_than=None, batch_size=None, export_path=None, interval=0):
+    """Archive finished notifications, once or every `interval` seconds"""
+    while True:
+        started = time.perf_counter()
+        with app.app_context():
+            if export_path:
+                with gzip.open(export_path, 'ab') as export:
+                    moved = archive_notifications(older_than, batch_size, export)
+            else:
+                moved = archive_notifications(older_than, batch_size)
+        print(f"Archived {moved} notifications in {time.perf_counter() - started:.2f}s")
+        if not interval:
+            break
+        time.sleep(interval)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Move finished notifications out of the live table")
+    parser.add_argument('--older-than', type=float, default=None,
+                        help='days since last update (default: NOTIFICATION_RETENTION_DAYS)')
+    parser.add_argument('--batch-size', type=int, default=None,
+                        help='rows per transaction (default: NOTIFICATION_ARCHIVE_BATCH_SIZE)')
+    parser.add_argument('--export', help='append to this gzipped JSON-lines file instead of the archive table')
+    parser.add_argument('--interval', type=float, default=0,
+                        help='repeat every N seconds (default: run one pass and exit)')
+    args = parser.parse_args()
+    archive(args.older_than, args.batch_size, args.export, args.interval)
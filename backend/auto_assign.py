@@ -0,0 +1,22 @@
+from app import app, auto_assign_pending_projects
+import argparse
+import time
+
+def auto_assign(interval=0, max_active=None):
+    """Assign pending projects to their best available acceptor, once or every `interval` seconds"""
+    while True:
+        with app.app_context():
+            assignments = auto_assign_pending_projects(max_active)
+        print(f"Assigned {len(assignments)} projects")
+        if not interval:
+            break
+        time.sleep(interval)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Batch-assign pending projects that have acceptors")
+    parser.add_argument('--interval', type=float, default=0,
+                        help='repeat every N seconds (default: run one pass and exit)')
+    parser.add_argument('--max-active', type=int, default=None,
+                        help='unfinished projects an employee may hold (default: AUTO_ASSIGN_MAX_ACTIVE)')
+    args = parser.parse_args()
+    auto_assign(args.interval, args.max_active)
@@ -0,0 +1,71 @@
+"""
+Times one auto-assignment pass over a synthetic workload.
+
+Recreates all tables in the configured database, so point DATABASE_URL at a
+scratch database (SQLite works):
+
+    DATABASE_URL=sqlite:////tmp/bench.db python benchmark_auto_assign.py --projects 10000 --employees 5000
+"""
+from app import (app, db, Employee, Project, Notification, NotificationBroadcast, project_acceptances,
+                 auto_assign_pending_projects)
+from sqlalchemy import insert
+from datetime import datetime, timedelta
+import argparse
+import random
+import time
+
+def seed(projects, employees, acceptors_per_project):
+    db.drop_all()
+    db.create_all()
+    now = datetime.utcnow()
+
+    db.session.execute(insert(Employee), [{
+        'name': 'Admin User', 'employee_id': 'admin', 'role': 'Manager',
+        'password_hash': '-', 'is_admin': True, 'rating': 5.0, 'created_at': now
+    }] + [{
+        'name': f'Employee {i}', 'employee_id': f'emp{i}', 'role': 'Developer',
+        'password_hash': '-', 'is_admin': False, 'rating': round(random.uniform(1, 5), 1), 'created_at': now
+    } for i in range(employees)])
+
+    db.session.execute(insert(Project), [{
+        'title': f'Project {i}', 'status': 'pending', 'priority': random.randint(1, 5),
+        'deadline': now + timedelta(days=random.randint(1, 90)) if random.random() < 0.7 else None,
+        'created_by': 1, 'created_at': now, 'updated_at': now
+    } for i in range(projects)])
+
+    acceptances = []
+    for project_id in range(1, projects + 1):
+        for employee_id in random.sample(range(2, employees + 2), acceptors_per_project):
+            acceptances.append({'project_id': project_id, 'employee_id': employee_id})
+    db.session.execute(insert(project_acceptances), acceptances)
+    db.session.execute(insert(NotificationBroadcast), [{
+        'project_id': project_id, 'created_at': now, 'updated_at': now
+    } for project_id in range(1, projects + 1)])
+    # Acceptors' responses: the rows the close-out rewrites
+    db.session.execute(insert(Notification), [
+        dict(row, status='accept', created_at=now, updated_at=now) for row in acceptances
+    ])
+    db.session.commit()
+    return len(acceptances)
+
+def benchmark(projects, employees, acceptors_per_project, max_active):
+    with app.app_context():
+        started = time.perf_counter()
+        acceptances = seed(projects, employees, acceptors_per_project)
+        print(f"Seeded {projects} projects, {employees} employees, {acceptances} acceptances "
+              f"in {time.perf_counter() - started:.2f}s")
+
+        started = time.perf_counter()
+        assignments = auto_assign_pending_projects(max_active)
+        elapsed = time.perf_counter() - started
+        print(f"Assigned {len(assignments)} projects in {elapsed:.2f}s "
+              f"({len(assignments) / elapsed:.0f} projects/s)")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the batch auto-assignment pass")
+    parser.add_argument('--projects', type=int, default=10000)
+    parser.add_argument('--employees', type=int, default=5000)
+    parser.add_argument('--acceptors-per-project', type=int, default=10)
+    parser.add_argument('--max-active', type=int, default=3)
+    args = parser.parse_args()
+    benchmark(args.projects, args.employees, args.acceptors_per_project, args.max_active)
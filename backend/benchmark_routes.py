@@ -0,0 +1,230 @@
+"""
+Endpoint benchmark suite.
+
+Replays every route in app.py through Flask's test client against the
+configured database and records latency percentiles, SQL statement counts
+and response sizes per route. Load data first with generate_data.py, since
+write routes change the data they run against. SECRET_KEY must be set, since
+the authenticated routes run with a login token:
+
+    DATABASE_URL=sqlite:////tmp/bench.db python generate_data.py --employees 2000 --projects 1000
+    DATABASE_URL=sqlite:////tmp/bench.db python benchmark_routes.py --output before.json
+    ...
+    DATABASE_URL=sqlite:////tmp/bench.db python benchmark_routes.py --output after.json --compare before.json
+
+The in-memory response caches are cleared before every request, so each one
+is measured doing its full work rather than repeating a cached body.
+"""
+from app import (app, db, employee_directory_cache, list_response_cache, Employee, Project, Notification,
+                 NotificationBroadcast, project_acceptances)
+from sqlalchemy import event, select, func
+from datetime import datetime
+import argparse
+import json
+import statistics
+import time
+
+class Case:
+    def __init__(self, name, method, rule, make_request, iterations=None, headers=None):
+        self.name = name
+        self.method = method
+        self.rule = rule
+        self.make_request = make_request  # (iteration, fixtures) -> (path, json body or None)
+        self.iterations = iterations
+        self.headers = headers or {}
+
+def load_fixtures():
+    """Ids the request builders need, picked from the generated data"""
+    with app.app_context():
+        employee_id = db.session.scalar(
+            select(func.min(Employee.id)).where(Employee.is_admin == False)  # noqa: E712
+        ) or 2
+        # Open offers this employee has not answered
+        pending_notifications = db.session.scalars(
+            select(NotificationBroadcast.id).where(
+                NotificationBroadcast.closed_at.is_(None),
+                ~select(Notification.id).where(
+                    Notification.project_id == NotificationBroadcast.project_id,
+                    Notification.employee_id == employee_id
+                ).exists()
+            )
+        ).all()
+        assigned_employee_id = db.session.scalar(
+            select(Project.employee_id).where(Project.employee_id.isnot(None)).limit(1)
+        ) or employee_id
+        finalizable_projects = db.session.scalars(
+            select(Project.id).where(
+                Project.employee_id.is_(None),
+                select(project_acceptances.c.project_id)
+                .where(project_acceptances.c.project_id == Project.id).exists()
+            )
+        ).all()
+        return {
+            'employee_id': employee_id,
+            'employee_code': db.session.get(Employee, employee_id).employee_id,
+            'assigned_employee_id': assigned_employee_id,
+            'pending_notifications': pending_notifications,
+            'finalizable_projects': finalizable_projects,
+            'project_id': db.session.scalar(select(func.min(Project.id))) or 1,
+            'since': datetime.utcnow().isoformat()
+        }
+
+def cases():
+    run_id = int(time.time())
+    return [
+        Case('index', 'GET', '/', lambda i, f: ('/', None)),
+        Case('test', 'GET', '/test', lambda i, f: ('/test', None)),
+        Case('signup', 'POST', '/api/auth/signup', lambda i, f: ('/api/auth/signup', {
+            'name': f'Bench {run_id}-{i}', 'employee_id': f'bench-{run_id}-{i}', 'role': 'Developer', 'password': 'password'
+        }), iterations=10),
+        Case('login', 'POST', '/api/auth/login', lambda i, f: ('/api/auth/login', {
+            'employee_id': f['employee_code'], 'password': 'password'
+        }), iterations=10),
+        Case('auth_check', 'GET', '/api/auth/check', lambda i, f: ('/api/auth/check', None)),
+        Case('projects_admin', 'GET', '/api/projects', lambda i, f: ('/api/projects', None), iterations=10),
+        Case('projects_admin_gzip', 'GET', '/api/projects', lambda i, f: ('/api/projects', None),
+             iterations=10, headers={'Accept-Encoding': 'gzip'}),
+        Case('projects_admin_page', 'GET', '/api/projects',
+             lambda i, f: ('/api/projects?limit=50&sort=-priority', None)),
+        Case('projects_embed', 'GET', '/api/projects', lambda i, f: ('/api/projects?embed=assignee', None),
+             iterations=10),
+        Case('dashboard_summary', 'GET', '/api/dashboard/summary', lambda i, f: ('/api/dashboard/summary', None)),
+        Case('projects_employee', 'GET', '/api/projects',
+             lambda i, f: (f"/api/projects?employee_id={f['assigned_employee_id']}", None)),
+        Case('project_search', 'GET', '/api/projects/search',
+             lambda i, f: (f'/api/projects/search?q=synthetic project {i}', None)),
+        Case('projects_since', 'GET', '/api/projects', lambda i, f: (f"/api/projects?since={f['since']}", None)),
+        Case('employees', 'GET', '/api/employees', lambda i, f: ('/api/employees', None)),
+        Case('notifications', 'GET', '/api/notifications',
+             lambda i, f: (f"/api/notifications?employee_id={f['employee_id']}", None)),
+        Case('notifications_since', 'GET', '/api/notifications',
+             lambda i, f: (f"/api/notifications?employee_id={f['employee_id']}&since={f['since']}", None)),
+        Case('create_project', 'POST', '/api/projects', lambda i, f: ('/api/projects', {
+            'title': f'Bench project {run_id}-{i}', 'priority': 3
+        }), iterations=5),
+        Case('update_project', 'PUT', '/api/projects/<int:project_id>',
+             lambda i, f: (f"/api/projects/{f['project_id']}", {'priority': i % 5 + 1})),
+        # A one-line JSON body is a one-row JSON Lines import
+        Case('bulk_import', 'POST', '/api/projects/bulk', lambda i, f: ('/api/projects/bulk', {
+            'title': f'Bench import {run_id}-{i}', 'priority': 2
+        }), iterations=5),
+        Case('bulk_patch', 'PATCH', '/api/projects',
+             lambda i, f: ('/api/projects', {'ids': [f['project_id']], 'priority': i % 5 + 1})),
+        Case('update_rating', 'PUT', '/api/employees/<int:employee_id>/rating',
+             lambda i, f: (f"/api/employees/{f['employee_id']}/rating", {'rating': 3 + i % 3})),
+        Case('respond', 'PUT', '/api/notifications/<int:notification_id>/respond',
+             lambda i, f: (f"/api/notifications/{f['pending_notifications'][i]}/respond", {'response': 'accept'}),
+             iterations=20),
+        Case('finalize', 'POST', '/api/projects/<int:project_id>/finalize-assignment',
+             lambda i, f: (f"/api/projects/{f['finalizable_projects'][i]}/finalize-assignment", None),
+             iterations=10),
+        Case('job_status', 'GET', '/api/jobs/<job_id>', lambda i, f: ('/api/jobs/unknown', None)),
+        Case('leaderboard', 'GET', '/api/employees/leaderboard',
+             lambda i, f: ('/api/employees/leaderboard?limit=20&role=Developer', None)),
+        Case('create_rating', 'POST', '/api/ratings', lambda i, f: ('/api/ratings', {
+            'employee_id': f['employee_id'], 'project_id': f['project_id'], 'rating': 3 + i % 3
+        })),
+        Case('employee_ratings', 'GET', '/api/ratings/employee/<int:employee_id>',
+             lambda i, f: (f"/api/ratings/employee/{f['employee_id']}?limit=50", None)),
+        Case('cache_stats', 'GET', '/api/cache/stats', lambda i, f: ('/api/cache/stats', None)),
+        Case('metrics', 'GET', '/metrics', lambda i, f: ('/metrics', None)),
+    ]
+
+def percentile(samples, fraction):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+def run_benchmark(iterations):
+    fixtures = load_fixtures()
+    client = app.test_client()
+    login = client.post('/api/auth/login', json={'employee_id': fixtures['employee_code'], 'password': 'password'})
+    headers = {'Authorization': f"Bearer {login.get_json().get('token', '')}"}
+
+    statements = [0]
+    def count_statement(*args):
+        statements[0] += 1
+    with app.app_context():
+        engine = db.engine
+    event.listen(engine, 'before_cursor_execute', count_statement)
+
+    results = {}
+    try:
+        for case in cases():
+            runs = case.iterations or iterations
+            if case.name == 'respond':
+                runs = min(runs, len(fixtures['pending_notifications']))
+            if case.name == 'finalize':
+                runs = min(runs, len(fixtures['finalizable_projects']))
+            latencies, counts, sizes, status_codes = [], [], [], {}
+            for i in range(runs):
+                path, body = case.make_request(i, fixtures)
+                employee_directory_cache.clear()
+                list_response_cache.clear()
+                statements[0] = 0
+                started = time.perf_counter()
+                response = client.open(path, method=case.method, json=body, headers={**headers, **case.headers})
+                latencies.append((time.perf_counter() - started) * 1000)
+                counts.append(statements[0])
+                sizes.append(len(response.get_data()))
+                status_codes[str(response.status_code)] = status_codes.get(str(response.status_code), 0) + 1
+            if not latencies:
+                continue
+            results[case.name] = {
+                'route': f'{case.method} {case.rule}',
+                'iterations': runs,
+                'p50_ms': round(percentile(latencies, 0.5), 3),
+                'p95_ms': round(percentile(latencies, 0.95), 3),
+                'p99_ms': round(percentile(latencies, 0.99), 3),
+                'statements': round(statistics.mean(counts), 2),
+                'response_bytes': round(statistics.mean(sizes)),
+                'status_codes': status_codes
+            }
+    finally:
+        event.remove(engine, 'before_cursor_execute', count_statement)
+    return results
+
+def uncovered_routes():
+    covered = {(case.method, case.rule) for case in cases()}
+    missing = []
+    for rule in app.url_map.iter_rules():
+        if rule.endpoint == 'static':
+            continue
+        for method in rule.methods - {'HEAD', 'OPTIONS'}:
+            if (method, rule.rule) not in covered:
+                missing.append(f'{method} {rule.rule}')
+    return sorted(missing)
+
+def print_results(results, baseline=None):
+    print(f"{'route':<22} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'stmts':>7} {'bytes':>10}")
+    for name, result in results.items():
+        line = (f"{name:<22} {result['p50_ms']:>9.2f} {result['p95_ms']:>9.2f} {result['p99_ms']:>9.2f} "
+                f"{result['statements']:>7.1f} {result['response_bytes']:>10}")
+        if baseline and name in baseline:
+            before = baseline[name]
+            change = (result['p50_ms'] - before['p50_ms']) / before['p50_ms'] * 100 if before['p50_ms'] else 0
+            line += f"   p50 {change:+.0f}%, stmts {result['statements'] - before['statements']:+.1f}"
+        print(line)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark every route against the configured database")
+    parser.add_argument('--iterations', type=int, default=50, help='requests per read route')
+    parser.add_argument('--output', help='write results as JSON')
+    parser.add_argument('--compare', help='JSON results of an earlier run to diff against')
+    args = parser.parse_args()
+
+    missing = uncovered_routes()
+    if missing:
+        print(f"Routes without a benchmark case: {', '.join(missing)}")
+
+    results = run_benchmark(args.iterations)
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)['routes']
+    print_results(results, baseline)
+
+    if args.output:
+        with app.app_context():
+            dialect = db.engine.dialect.name
+        with open(args.output, 'w') as f:
+            json.dump({'database': dialect, 'recorded_at': datetime.utcnow().isoformat(), 'routes': results}, f, indent=2)
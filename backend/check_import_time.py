@@ -0,0 +1,92 @@
+"""
+Import-time regression check for the serverless (http) profile.
+
+Imports app in fresh interpreters under `python -X importtime`, once per
+profile, and reports the cumulative import time of the app module and its
+heaviest dependencies. Each figure is the best of --runs runs. Exits
+non-zero when the http profile exceeds --budget-ms, or when it imports any
+part of the realtime stack (eventlet, Flask-SocketIO, Engine.IO, Alembic).
+The realtime profile is skipped when its dependencies are not installed, as
+with only backend/requirements.txt (the serverless set); the http profile
+must always import.
+
+The default budget is what the http profile achieves on a development
+machine, plus some headroom. Flask, Flask-SQLAlchemy and SQLAlchemy make up
+most of it, so treat it as a regression guard rather than a cold-start target.
+
+    python check_import_time.py
+    python check_import_time.py --budget-ms 800 --runs 10
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+# Modules the http profile must never load
+REALTIME_MODULES = ['eventlet', 'flask_socketio', 'engineio', 'flask_migrate', 'alembic']
+
+def import_profile(profile):
+    """
+    Import app once in a new interpreter; return ({top-level package: cumulative us},
+    loaded realtime modules), or (None, error) when the import fails
+    """
+    env = dict(os.environ, APP_PROFILE=profile)
+    env.pop('VERCEL', None)
+    probe = f'import app, sys; print(",".join(m for m in {REALTIME_MODULES!r} if m in sys.modules))'
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', probe],
+                            env=env, capture_output=True, text=True,
+                            cwd=os.path.dirname(os.path.abspath(__file__)))
+    if result.returncode != 0:
+        errors = [line for line in result.stderr.splitlines() if not line.startswith('import time:')]
+        return None, errors[-1] if errors else f'exit status {result.returncode}'
+    packages = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = (part.strip() for part in line[len('import time:'):].split('|'))
+        package = name.split('.')[0]
+        # A package's outermost import is its first cumulative figure that covers the rest
+        packages[package] = max(packages.get(package, 0), int(cumulative))
+    loaded = [module for module in result.stdout.strip().split(',') if module]
+    return packages, loaded
+
+def measure(profile, runs):
+    best, loaded = None, []
+    for _ in range(runs):
+        packages, loaded = import_profile(profile)
+        if packages is None:
+            return None, loaded
+        if best is None or packages.get('app', 0) < best.get('app', 0):
+            best = packages
+    return best, loaded
+
+def check_import_time(budget_ms, runs, top):
+    failures = 0
+    for profile in ('realtime', 'http'):
+        packages, loaded = measure(profile, runs)
+        if packages is None:
+            print(f'{profile}: import app failed: {loaded}')
+            if profile == 'http':
+                failures += 1
+            continue
+        total_ms = packages.get('app', 0) / 1000
+        print(f'{profile}: import app {total_ms:.1f} ms')
+        heaviest = sorted(((us, name) for name, us in packages.items() if name != 'app'), reverse=True)[:top]
+        for us, name in heaviest:
+            print(f'  {us / 1000:8.1f} ms  {name}')
+        if profile == 'http':
+            if loaded:
+                failures += 1
+                print(f"  http profile imported the realtime stack: {', '.join(loaded)}")
+            if total_ms > budget_ms:
+                failures += 1
+                print(f'  over the {budget_ms:.0f} ms budget')
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure app import time per profile against a regression budget")
+    parser.add_argument('--budget-ms', type=float, default=float(os.getenv('IMPORT_BUDGET_MS', '900')))
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--top', type=int, default=10, help='heaviest packages to list')
+    args = parser.parse_args()
+    sys.exit(check_import_time(args.budget_ms, args.runs, args.top))
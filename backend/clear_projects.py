@@ -1,25 +1,32 @@
-from app import app, db, Project, Notification, project_acceptances
-from sqlalchemy import text
+from app import app, db, Project, Notification, NotificationArchive, NotificationBroadcast, Rating, Tombstone, project_acceptances
+from sqlalchemy import text, insert, select, literal, update
+from datetime import datetime
 
 def clear_projects():
     """Clear all projects, notifications, and project-employee relationships from the database"""
     with app.app_context():
         print("Clearing all projects and related data...")
         
-        # Delete all records from project_acceptances table
-        db.session.execute(text("DELETE FROM project_acceptances"))
-        db.session.commit()
-        print("Cleared project acceptances")
+        # Leave tombstones so clients syncing with ?since= drop the removed rows
+        now = datetime.utcnow()
+        columns = ['resource', 'resource_id', 'employee_id', 'removed_at']
+        db.session.execute(insert(Tombstone).from_select(columns, select(
+            literal('notification'), NotificationBroadcast.id, literal(None), literal(now)
+        )))
+        db.session.execute(insert(Tombstone).from_select(columns, select(
+            literal('project'), Project.id, literal(None), literal(now)
+        )))
         
-        # Delete all notifications
+        # One transaction: a failure part-way leaves everything in place
+        db.session.execute(text("DELETE FROM project_acceptances"))
         Notification.query.delete()
-        db.session.commit()
-        print("Cleared notifications")
-        
-        # Delete all projects
+        NotificationBroadcast.query.delete()
+        NotificationArchive.query.delete()
+        # Ratings stay in the employees' history, detached from the removed projects
+        db.session.execute(update(Rating).where(Rating.project_id.isnot(None)).values(project_id=None))
         Project.query.delete()
         db.session.commit()
-        print("Cleared projects")
+        print("Cleared projects, notifications (live and archived) and acceptances")
         
         print("All projects and related data have been cleared successfully!")
 
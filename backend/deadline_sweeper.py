@@ -0,0 +1,26 @@
+"""
+Deadline sweeper.
+
+Marks projects overdue (project.overdue_at) as their deadlines pass and sends
+deadlines_approaching --warning-hours before each one. It sleeps until the
+next deadline rather than polling the project table. Run one instance next to
+the gunicorn workers; `python app.py` runs it in-process when
+DEADLINE_SWEEPER=true.
+
+    python deadline_sweeper.py
+    python deadline_sweeper.py --window-hours 48 --warning-hours 4
+"""
+from app import deadline_scheduler
+import argparse
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Mark projects overdue as their deadlines pass")
+    parser.add_argument('--window-hours', type=float, default=None,
+                        help='hours of deadlines held in memory at a time (default: DEADLINE_WINDOW_HOURS)')
+    parser.add_argument('--warning-hours', type=float, default=None,
+                        help='hours before a deadline to warn, 0 for none (default: DEADLINE_WARNING_HOURS)')
+    parser.add_argument('--sync-seconds', type=float, default=None,
+                        help='seconds between reads of changed deadlines (default: DEADLINE_SYNC_SECONDS)')
+    args = parser.parse_args()
+    print("Sweeping project deadlines (Ctrl+C to stop)")
+    deadline_scheduler.run(args.window_hours, args.warning_hours, args.sync_seconds)
@@ -0,0 +1,140 @@
+"""
+Synthetic data generator for benchmarking at production scale.
+
+Recreates all tables, then bulk-loads employees, projects, one notification
+broadcast per project, the employees' responses and the matching acceptances.
+Projects are loaded as chunked multi-row inserts, and broadcasts, responses
+and acceptances with single INSERT ... SELECT statements. Their secondary
+indexes are built after the load rather than maintained row by row. Status
+and rating distributions follow what the app produces:
+
+- projects: 50% pending, 30% in_progress, 20% completed; assigned ones have a closed broadcast
+- employees offered a pending project: 70% have not answered, 20% accept, 10% reject
+- assigned projects: the assignee's response is 'assigned', other responders' 'closed'
+
+Every employee's password is "password"; the admin logs in as admin / password.
+
+    DATABASE_URL=postgresql://localhost/dev_tracker_bench python generate_data.py --employees 2000 --projects 1000
+"""
+from app import app, db, Employee, Project, Notification, NotificationBroadcast, project_acceptances
+from werkzeug.security import generate_password_hash
+from sqlalchemy import insert, select, case, true, or_
+from datetime import datetime, timedelta
+import argparse
+import random
+import time
+
+CHUNK_SIZE = 10000
+
+def insert_chunked(model, rows):
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) == CHUNK_SIZE:
+            db.session.execute(insert(model), chunk)
+            chunk = []
+    if chunk:
+        db.session.execute(insert(model), chunk)
+
+def employee_rows(count, password_hash, now):
+    yield {'name': 'Admin User', 'employee_id': 'admin', 'role': 'Manager', 'password_hash': password_hash,
+           'is_admin': True, 'rating': 5.0, 'rating_score': 5.0, 'created_at': now}
+    for i in range(count):
+        rating = round(min(5.0, max(1.0, random.gauss(3.8, 0.7))), 1)
+        yield {
+            'name': f'Employee {i}',
+            'employee_id': f'emp{i}',
+            'role': random.choice(['Developer', 'Developer', 'Developer', 'Tester']),
+            'password_hash': password_hash,
+            'is_admin': False,
+            'rating': rating,
+            'rating_score': rating,
+            'created_at': now - timedelta(days=random.randint(0, 720))
+        }
+
+def project_rows(count, employees, now):
+    for i in range(count):
+        status = random.choices(['pending', 'in_progress', 'completed'], weights=[50, 30, 20])[0]
+        created_at = now - timedelta(days=random.randint(0, 365), minutes=random.randint(0, 1440))
+        yield {
+            'title': f'Project {i}',
+            'description': f'Synthetic project {i} for benchmarking',
+            'status': status,
+            'priority': random.choices([1, 2, 3, 4, 5], weights=[30, 25, 20, 15, 10])[0],
+            'deadline': created_at + timedelta(days=random.randint(7, 120)) if random.random() < 0.7 else None,
+            'created_at': created_at,
+            'updated_at': created_at,
+            # Employees are ids 2..employees + 1 (the admin is id 1)
+            'employee_id': 2 + random.randrange(employees) if status != 'pending' else None,
+            'created_by': 1
+        }
+
+def generate_data(employees, projects, seed=42):
+    random.seed(seed)
+    now = datetime.utcnow()
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+        # Building indexes once after the load is far cheaper than updating them per row
+        deferred_indexes = (list(Notification.__table__.indexes) + list(NotificationBroadcast.__table__.indexes)
+                            + list(project_acceptances.indexes))
+        for index in deferred_indexes:
+            index.drop(db.engine)
+
+        started = time.perf_counter()
+        insert_chunked(Employee, employee_rows(employees, generate_password_hash('password'), now))
+        insert_chunked(Project, project_rows(projects, employees, now))
+        db.session.commit()
+        print(f"Employees and projects: {time.perf_counter() - started:.2f}s")
+
+        # One broadcast per project, closed once the project is assigned
+        started = time.perf_counter()
+        p = Project.__table__
+        result = db.session.execute(insert(NotificationBroadcast).from_select(
+            ['project_id', 'created_at', 'updated_at', 'closed_at'],
+            select(p.c.id, p.c.created_at, p.c.updated_at,
+                   case((p.c.employee_id.isnot(None), p.c.updated_at), else_=None))
+        ))
+        db.session.commit()
+        print(f"Broadcasts ({result.rowcount}): {time.perf_counter() - started:.2f}s")
+
+        # A response row for each non-admin employee who answered, statuses derived set-based
+        started = time.perf_counter()
+        e = Employee.__table__
+        bucket = (e.c.id * 31 + p.c.id * 17) % 10
+        status = case(
+            (p.c.employee_id == e.c.id, 'assigned'),
+            (p.c.employee_id.isnot(None), 'closed'),
+            (bucket < 9, 'accept'),
+            else_='reject'
+        )
+        result = db.session.execute(insert(Notification).from_select(
+            ['employee_id', 'project_id', 'status', 'created_at', 'updated_at'],
+            select(e.c.id, p.c.id, status, p.c.created_at, p.c.updated_at)
+            .select_from(e.join(p, true()))
+            .where(e.c.is_admin == False, or_(p.c.employee_id == e.c.id, bucket >= 7))  # noqa: E712
+        ))
+        db.session.commit()
+        print(f"Responses ({result.rowcount}): {time.perf_counter() - started:.2f}s")
+
+        started = time.perf_counter()
+        n = Notification.__table__
+        result = db.session.execute(insert(project_acceptances).from_select(
+            ['project_id', 'employee_id'],
+            select(n.c.project_id, n.c.employee_id).where(n.c.status.in_(['accept', 'assigned']))
+        ))
+        db.session.commit()
+        print(f"Acceptances ({result.rowcount}): {time.perf_counter() - started:.2f}s")
+
+        started = time.perf_counter()
+        for index in deferred_indexes:
+            index.create(db.engine)
+        print(f"Indexes: {time.perf_counter() - started:.2f}s")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Bulk-load synthetic employees, projects, broadcasts and responses")
+    parser.add_argument('--employees', type=int, default=1000)
+    parser.add_argument('--projects', type=int, default=1000)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+    generate_data(args.employees, args.projects, args.seed)
@@ -0,0 +1,24 @@
+"""
+gunicorn settings for the eventlet deployment:
+
+    gunicorn -c gunicorn.conf.py app:app
+
+WEB_CONCURRENCY workers each run their own eventlet hub. With more than one,
+set SOCKETIO_MESSAGE_QUEUE (e.g. redis://localhost:6379/0) so an event emitted
+in any worker reaches clients connected to the others.
+"""
+import os
+
+bind = os.getenv('BIND', f"0.0.0.0:{os.getenv('PORT', '5003')}")
+worker_class = 'eventlet'
+workers = int(os.getenv('WEB_CONCURRENCY', '1'))
+# Green threads per worker
+worker_connections = int(os.getenv('MAX_GREEN_THREADS', '1000'))
+# Workers import the app after forking, so each gets its own engine, pool and hub
+preload_app = False
+timeout = int(os.getenv('GUNICORN_TIMEOUT', '60'))
+
+def on_starting(server):
+    if server.cfg.workers > 1 and not os.getenv('SOCKETIO_MESSAGE_QUEUE'):
+        server.log.warning('%d workers without SOCKETIO_MESSAGE_QUEUE: Socket.IO events '
+                           'only reach clients connected to the worker that emitted them', server.cfg.workers)
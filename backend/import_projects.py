@@ -0,0 +1,43 @@
+"""
+Bulk project import.
+
+Reads projects from a JSON Lines or CSV file (format taken from the
+extension unless --format is given) and creates them with their broadcasts,
+--chunk-size rows per transaction. Invalid rows are reported and skipped.
+CSV files need a header row naming title, description, priority, deadline.
+
+    python import_projects.py backlog.jsonl
+    python import_projects.py tickets.csv --chunk-size 5000
+"""
+from app import app, get_admin_id, import_projects, iter_csv_rows, iter_jsonl_rows
+import argparse
+import sys
+import time
+
+def run_import(path, file_format=None, chunk_size=None):
+    """Import the file's projects, print per-row errors and return the number of failed rows"""
+    if file_format is None:
+        file_format = 'csv' if path.lower().endswith('.csv') else 'jsonl'
+    started = time.perf_counter()
+    with app.app_context(), open(path, newline='', encoding='utf-8') as lines:
+        admin_id = get_admin_id()
+        if not admin_id:
+            print("No admin user found to set as project creator")
+            return 1
+        rows = iter_csv_rows(lines) if file_format == 'csv' else iter_jsonl_rows(lines)
+        report = import_projects(rows, admin_id, chunk_size)
+    for error in report['errors']:
+        print(f"line {error['line']}: {error['error']}")
+    print(f"Created {report['created']} projects, {report['failed']} rows failed "
+          f"in {time.perf_counter() - started:.2f}s")
+    return report['failed']
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Import projects from a JSON Lines or CSV file")
+    parser.add_argument('path')
+    parser.add_argument('--format', choices=['jsonl', 'csv'], default=None,
+                        help='input format (default: from the file extension)')
+    parser.add_argument('--chunk-size', type=int, default=None,
+                        help='rows per transaction (default: BULK_IMPORT_CHUNK_SIZE)')
+    args = parser.parse_args()
+    sys.exit(1 if run_import(args.path, args.format, args.chunk_size) else 0)
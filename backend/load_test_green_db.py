@@ -0,0 +1,42 @@
+"""
+Shows whether slow queries overlap under eventlet or serialize behind each other.
+
+Runs batches of concurrent `SELECT pg_sleep(...)` through the app's engine from
+green threads, with 1, 2, 4, ... concurrent queries. With cooperative DB I/O
+the wall time per batch stays near one query's duration, so throughput grows
+with concurrency until the pool is exhausted:
+
+    DATABASE_URL=postgresql://localhost/dev_tracker python load_test_green_db.py
+"""
+import eventlet
+eventlet.monkey_patch()
+
+from app import app, db
+from sqlalchemy import text
+import argparse
+import time
+
+def slow_query(seconds):
+    with app.app_context():
+        db.session.execute(text('SELECT pg_sleep(:seconds)'), {'seconds': seconds})
+        db.session.remove()
+
+def load_test(max_concurrency, query_seconds):
+    pool = eventlet.GreenPool(max_concurrency)
+    concurrency = 1
+    print(f"{'concurrent':>10} {'wall time':>10} {'queries/s':>10}")
+    while concurrency <= max_concurrency:
+        started = time.perf_counter()
+        for _ in range(concurrency):
+            pool.spawn(slow_query, query_seconds)
+        pool.waitall()
+        elapsed = time.perf_counter() - started
+        print(f"{concurrency:>10} {elapsed:>9.2f}s {concurrency / elapsed:>10.1f}")
+        concurrency *= 2
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Concurrent slow-query load test for the green DB driver")
+    parser.add_argument('--max-concurrency', type=int, default=16)
+    parser.add_argument('--query-seconds', type=float, default=0.2)
+    args = parser.parse_args()
+    load_test(args.max_concurrency, args.query_seconds)
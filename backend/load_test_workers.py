@@ -0,0 +1,147 @@
+"""
+Multi-worker check: Socket.IO fan-out across workers and throughput scaling.
+
+Starts N single-worker gunicorn servers on consecutive ports, all sharing
+DATABASE_URL and SOCKETIO_MESSAGE_QUEUE, the way N workers behind a load
+balancer would. Then:
+
+1. connects an admin Socket.IO client to every worker, creates one project
+   through each worker and checks that every client receives every
+   `new_project` event, whichever worker emitted it;
+2. sends the same request load to 1, 2, ... N workers and prints the
+   requests per second.
+
+Exits non-zero if any event is not delivered. Run it against a scratch
+database, since it recreates all tables:
+
+    DATABASE_URL=postgresql://localhost/dev_tracker_workers \\
+        python load_test_workers.py --workers 4 --message-queue redis://localhost:6379/0
+"""
+from app import app, db, Employee
+from werkzeug.security import generate_password_hash
+from concurrent.futures import ThreadPoolExecutor
+import argparse
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+import urllib.request
+
+import socketio
+
+def seed():
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+        db.session.add(Employee(name='Admin User', employee_id='admin', role='Manager',
+                                password_hash=generate_password_hash('password'), is_admin=True))
+        for i in range(20):
+            db.session.add(Employee(name=f'Employee {i}', employee_id=f'emp{i}', role='Developer',
+                                    password_hash=generate_password_hash('password')))
+        db.session.commit()
+
+def call(url, method='GET', body=None, token=None):
+    headers = {'Content-Type': 'application/json'}
+    if token:
+        headers['Authorization'] = f'Bearer {token}'
+    data = json.dumps(body).encode() if body is not None else None
+    with urllib.request.urlopen(urllib.request.Request(url, data=data, headers=headers, method=method)) as response:
+        return json.loads(response.read() or b'null')
+
+def start_workers(count, base_port, message_queue):
+    env = dict(os.environ, SOCKETIO_MESSAGE_QUEUE=message_queue, WEB_CONCURRENCY='1')
+    workers = []
+    for i in range(count):
+        workers.append(subprocess.Popen(
+            [sys.executable, '-m', 'gunicorn', '-c', 'gunicorn.conf.py', '-b', f'127.0.0.1:{base_port + i}', 'app:app'],
+            env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        ))
+    urls = [f'http://127.0.0.1:{base_port + i}' for i in range(count)]
+    deadline = time.monotonic() + 30
+    for url in urls:
+        while True:
+            try:
+                call(url + '/')
+                break
+            except OSError:
+                if time.monotonic() > deadline:
+                    raise RuntimeError(f'Worker at {url} did not start')
+                time.sleep(0.2)
+    return workers, urls
+
+def check_fanout(urls, token, timeout):
+    """Create a project through each worker; every worker's client must hear about all of them"""
+    received = [set() for _ in urls]
+    lock = threading.Lock()
+    clients = []
+    for i, url in enumerate(urls):
+        client = socketio.Client()
+        def on_new_project(data, i=i):
+            with lock:
+                received[i].add(data['project']['id'])
+        client.on('new_project', on_new_project)
+        client.connect(url, auth={'token': token}, transports=['websocket'])
+        clients.append(client)
+
+    created = []
+    for i, url in enumerate(urls):
+        created.append(call(url + '/api/projects', 'POST', {'title': f'Fan-out via worker {i}'}, token)['id'])
+
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        with lock:
+            if all(received[i] >= set(created) for i in range(len(urls))):
+                break
+        time.sleep(0.05)
+    for client in clients:
+        client.disconnect()
+
+    missing = 0
+    for i, url in enumerate(urls):
+        for origin, project_id in enumerate(created):
+            if project_id not in received[i]:
+                missing += 1
+                print(f'Client on worker {i} missed the event emitted by worker {origin}')
+    print(f'Fan-out: {len(created) * len(urls) - missing}/{len(created) * len(urls)} events delivered')
+    return missing
+
+def measure_throughput(urls, path, token, requests, concurrency):
+    def one(i):
+        call(urls[i % len(urls)] + path, token=token)
+    started = time.perf_counter()
+    with ThreadPoolExecutor(concurrency) as pool:
+        list(pool.map(one, range(requests)))
+    return requests / (time.perf_counter() - started)
+
+def load_test(workers, base_port, message_queue, path, requests, concurrency, timeout):
+    seed()
+    processes, urls = start_workers(workers, base_port, message_queue)
+    try:
+        token = call(urls[0] + '/api/auth/login', 'POST', {'employee_id': 'admin', 'password': 'password'})['token']
+        missing = check_fanout(urls, token, timeout)
+
+        print(f"{'workers':>8} {'requests/s':>11}")
+        for count in range(1, workers + 1):
+            rate = measure_throughput(urls[:count], path, token, requests, concurrency)
+            print(f'{count:>8} {rate:>11.1f}')
+        return 1 if missing else 0
+    finally:
+        for process in processes:
+            process.terminate()
+        for process in processes:
+            process.wait()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Cross-worker Socket.IO delivery and throughput scaling")
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--base-port', type=int, default=5100)
+    parser.add_argument('--message-queue', default=os.getenv('SOCKETIO_MESSAGE_QUEUE', 'redis://localhost:6379/0'))
+    parser.add_argument('--path', default='/api/projects?limit=50', help='route used for the throughput runs')
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--concurrency', type=int, default=32)
+    parser.add_argument('--timeout', type=float, default=10, help='seconds to wait for events')
+    args = parser.parse_args()
+    sys.exit(load_test(args.workers, args.base_port, args.message_queue, args.path,
+                       args.requests, args.concurrency, args.timeout))
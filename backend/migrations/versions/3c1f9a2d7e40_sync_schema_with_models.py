@@ -0,0 +1,102 @@
+"""Sync schema with models
+
+Adds the notification, project_acceptances and tombstone tables, the
+updated_at columns and the project constraints that the models declare but
+the initial migration lacked.
+
+Databases created with db.create_all() (stamped at the initial revision)
+already have some of these, so each table and column is added only when it
+is missing. Existing rows get updated_at = created_at, and projects without
+a creator are attributed to the first admin. The rating table is kept with
+its rows; the rating history revision converts it.
+
+Revision ID: 3c1f9a2d7e40
+Revises: aab4b40a16b7
+Create Date: 2026-10-17 16:06:06.101172
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3c1f9a2d7e40'
+down_revision = 'aab4b40a16b7'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    inspector = sa.inspect(op.get_bind())
+    tables = inspector.get_table_names()
+
+    if 'notification' not in tables:
+        op.create_table('notification',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('employee_id', sa.Integer(), nullable=False),
+        sa.Column('project_id', sa.Integer(), nullable=False),
+        sa.Column('status', sa.String(length=20), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['employee_id'], ['employee.id'], ),
+        sa.ForeignKeyConstraint(['project_id'], ['project.id'], ),
+        sa.PrimaryKeyConstraint('id')
+        )
+    elif 'updated_at' not in {column['name'] for column in inspector.get_columns('notification')}:
+        with op.batch_alter_table('notification', schema=None) as batch_op:
+            batch_op.add_column(sa.Column('updated_at', sa.DateTime(), nullable=True))
+        op.execute("UPDATE notification SET updated_at = coalesce(created_at, CURRENT_TIMESTAMP)")
+    if 'project_acceptances' not in tables:
+        op.create_table('project_acceptances',
+        sa.Column('project_id', sa.Integer(), nullable=False),
+        sa.Column('employee_id', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['employee_id'], ['employee.id'], ),
+        sa.ForeignKeyConstraint(['project_id'], ['project.id'], ),
+        sa.PrimaryKeyConstraint('project_id', 'employee_id')
+        )
+    if 'tombstone' not in tables:
+        op.create_table('tombstone',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('resource', sa.String(length=20), nullable=False),
+        sa.Column('resource_id', sa.Integer(), nullable=False),
+        sa.Column('employee_id', sa.Integer(), nullable=True),
+        sa.Column('removed_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+        )
+
+    project_columns = {column['name']: column for column in inspector.get_columns('project')}
+    if 'updated_at' not in project_columns:
+        with op.batch_alter_table('project', schema=None) as batch_op:
+            batch_op.add_column(sa.Column('updated_at', sa.DateTime(), nullable=True))
+    # Delta sync and broadcasts order by updated_at, so every existing row needs one
+    op.execute("UPDATE project SET updated_at = coalesce(created_at, CURRENT_TIMESTAMP) WHERE updated_at IS NULL")
+    op.execute(
+        "UPDATE project SET created_by = (SELECT min(id) FROM employee WHERE is_admin = true) "
+        "WHERE created_by IS NULL"
+    )
+    title_length = getattr(project_columns['title']['type'], 'length', None)
+    if title_length != 100 or project_columns['created_by']['nullable']:
+        with op.batch_alter_table('project', schema=None) as batch_op:
+            batch_op.alter_column('title',
+                   existing_type=sa.VARCHAR(length=title_length),
+                   type_=sa.String(length=100),
+                   existing_nullable=False)
+            batch_op.alter_column('created_by',
+                   existing_type=sa.INTEGER(),
+                   nullable=False)
+
+
+def downgrade():
+    with op.batch_alter_table('project', schema=None) as batch_op:
+        batch_op.alter_column('created_by',
+               existing_type=sa.INTEGER(),
+               nullable=True)
+        batch_op.alter_column('title',
+               existing_type=sa.String(length=100),
+               type_=sa.VARCHAR(length=200),
+               existing_nullable=False)
+        batch_op.drop_column('updated_at')
+
+    op.drop_table('tombstone')
+    op.drop_table('project_acceptances')
+    op.drop_table('notification')
@@ -0,0 +1,36 @@
+"""Add the project full-text search column and GIN index (PostgreSQL only)
+
+Other databases search through the app's in-process index instead.
+
+Revision ID: 5f0d83b9a6c1
+Revises: e4a91c6b2f58
+Create Date: 2026-10-17 16:44:37.911352
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5f0d83b9a6c1'
+down_revision = 'e4a91c6b2f58'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.execute(
+        "ALTER TABLE project ADD COLUMN search_vector tsvector GENERATED ALWAYS AS ("
+        "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+        "setweight(to_tsvector('english', coalesce(description, '')), 'B')) STORED"
+    )
+    op.create_index('ix_project_search_vector', 'project', ['search_vector'], unique=False, postgresql_using='gin')
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.drop_index('ix_project_search_vector', table_name='project')
+    op.drop_column('project', 'search_vector')
@@ -0,0 +1,75 @@
+"""Replace per-employee pending notifications with broadcasts
+
+Adds the notification_broadcast table with one row per project (closed for
+assigned projects) and drops the pending notification rows it replaces.
+Responses stay in notification, now unique per employee and project.
+
+Revision ID: 7c42d22b5a52
+Revises: b63266dedd05
+Create Date: 2026-10-17 16:22:49.498567
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7c42d22b5a52'
+down_revision = 'b63266dedd05'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('notification_broadcast',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('project_id', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.Column('closed_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['project_id'], ['project.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('project_id')
+    )
+    # project.updated_at can be NULL on rows from before it existed; an assigned project's
+    # offer must still be closed, or it comes back to every employee as pending
+    changed_at = "coalesce(updated_at, created_at, CURRENT_TIMESTAMP)"
+    op.execute(
+        "INSERT INTO notification_broadcast (project_id, created_at, updated_at, closed_at) "
+        f"SELECT id, created_at, {changed_at}, CASE WHEN employee_id IS NOT NULL THEN {changed_at} END "
+        "FROM project"
+    )
+    with op.batch_alter_table('notification_broadcast', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_notification_broadcast_closed_at'), ['closed_at'], unique=False)
+        batch_op.create_index(batch_op.f('ix_notification_broadcast_updated_at'), ['updated_at'], unique=False)
+
+    # Unanswered offers are now implied by the open broadcast
+    op.execute("DELETE FROM notification WHERE status = 'pending'")
+    op.execute(
+        "DELETE FROM notification WHERE id NOT IN "
+        "(SELECT min(id) FROM notification GROUP BY employee_id, project_id)"
+    )
+    with op.batch_alter_table('notification', schema=None) as batch_op:
+        batch_op.create_index('ix_notification_employee_project', ['employee_id', 'project_id'], unique=True)
+
+
+def downgrade():
+    with op.batch_alter_table('notification', schema=None) as batch_op:
+        batch_op.drop_index('ix_notification_employee_project')
+
+    # Materialize a pending row for every employee who has not answered an open broadcast
+    op.execute(
+        "INSERT INTO notification (employee_id, project_id, status, created_at, updated_at) "
+        "SELECT employee.id, notification_broadcast.project_id, 'pending', "
+        "notification_broadcast.created_at, notification_broadcast.updated_at "
+        "FROM notification_broadcast CROSS JOIN employee "
+        "WHERE notification_broadcast.closed_at IS NULL AND employee.is_admin = false "
+        "AND NOT EXISTS (SELECT 1 FROM notification WHERE notification.employee_id = employee.id "
+        "AND notification.project_id = notification_broadcast.project_id)"
+    )
+
+    with op.batch_alter_table('notification_broadcast', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_notification_broadcast_updated_at'))
+        batch_op.drop_index(batch_op.f('ix_notification_broadcast_closed_at'))
+
+    op.drop_table('notification_broadcast')
@@ -0,0 +1,58 @@
+"""Add indexes for the hot query shapes
+
+Revision ID: 8d2e5b7c1a93
+Revises: 3c1f9a2d7e40
+Create Date: 2026-10-17 16:20:41.512083
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8d2e5b7c1a93'
+down_revision = '3c1f9a2d7e40'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('employee', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_employee_is_admin'), ['is_admin'], unique=False)
+
+    with op.batch_alter_table('project', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_project_employee_id'), ['employee_id'], unique=False)
+        batch_op.create_index('ix_project_status_priority', ['status', 'priority'], unique=False)
+        batch_op.create_index(batch_op.f('ix_project_updated_at'), ['updated_at'], unique=False)
+
+    with op.batch_alter_table('notification', schema=None) as batch_op:
+        batch_op.create_index('ix_notification_employee_status', ['employee_id', 'status'], unique=False)
+        batch_op.create_index('ix_notification_employee_updated', ['employee_id', 'updated_at'], unique=False)
+        batch_op.create_index(batch_op.f('ix_notification_project_id'), ['project_id'], unique=False)
+
+    with op.batch_alter_table('project_acceptances', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_project_acceptances_employee_id'), ['employee_id'], unique=False)
+
+    with op.batch_alter_table('tombstone', schema=None) as batch_op:
+        batch_op.create_index('ix_tombstone_resource_removed', ['resource', 'removed_at'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('tombstone', schema=None) as batch_op:
+        batch_op.drop_index('ix_tombstone_resource_removed')
+
+    with op.batch_alter_table('project_acceptances', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_project_acceptances_employee_id'))
+
+    with op.batch_alter_table('notification', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_notification_project_id'))
+        batch_op.drop_index('ix_notification_employee_updated')
+        batch_op.drop_index('ix_notification_employee_status')
+
+    with op.batch_alter_table('project', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_project_updated_at'))
+        batch_op.drop_index('ix_project_status_priority')
+        batch_op.drop_index(batch_op.f('ix_project_employee_id'))
+
+    with op.batch_alter_table('employee', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_employee_is_admin'))
@@ -0,0 +1,47 @@
+"""Add the notification archive table and retention index
+
+Revision ID: b63266dedd05
+Revises: 8d2e5b7c1a93
+Create Date: 2026-10-17 16:19:05.007498
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b63266dedd05'
+down_revision = '8d2e5b7c1a93'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('notification_archive',
+    sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('employee_id', sa.Integer(), nullable=False),
+    sa.Column('project_id', sa.Integer(), nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.Column('archived_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('notification_archive', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_notification_archive_employee_id'), ['employee_id'], unique=False)
+        batch_op.create_index(batch_op.f('ix_notification_archive_project_id'), ['project_id'], unique=False)
+
+    with op.batch_alter_table('notification', schema=None) as batch_op:
+        batch_op.create_index('ix_notification_status_updated', ['status', 'updated_at'], unique=False)
+
+
+
+def downgrade():
+    with op.batch_alter_table('notification', schema=None) as batch_op:
+        batch_op.drop_index('ix_notification_status_updated')
+
+    with op.batch_alter_table('notification_archive', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_notification_archive_project_id'))
+        batch_op.drop_index(batch_op.f('ix_notification_archive_employee_id'))
+
+    op.drop_table('notification_archive')
@@ -0,0 +1,31 @@
+"""Add project.overdue_at, set by the deadline sweeper
+
+Projects already past their deadline are left unmarked; the sweeper marks
+them on its first pass.
+
+Revision ID: c7d3e81f4a26
+Revises: 5f0d83b9a6c1
+Create Date: 2026-10-17 19:02:41.530118
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c7d3e81f4a26'
+down_revision = '5f0d83b9a6c1'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('project', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('overdue_at', sa.DateTime(), nullable=True))
+        batch_op.create_index('ix_project_overdue_deadline', ['overdue_at', 'deadline'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('project', schema=None) as batch_op:
+        batch_op.drop_index('ix_project_overdue_deadline')
+        batch_op.drop_column('overdue_at')
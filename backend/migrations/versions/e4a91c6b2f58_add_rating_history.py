@@ -0,0 +1,82 @@
+"""Add the append-only rating table and employee rating aggregates
+
+Existing ratings become the starting point of both averages. A rating
+table left by the initial migration keeps its rows: its project_id and
+created_by become optional, and each employee's rating_count and rated_at
+are taken from them.
+
+Revision ID: e4a91c6b2f58
+Revises: 7c42d22b5a52
+Create Date: 2026-10-17 16:31:12.284610
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e4a91c6b2f58'
+down_revision = '7c42d22b5a52'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if 'rating' in sa.inspect(op.get_bind()).get_table_names():
+        with op.batch_alter_table('rating', schema=None) as batch_op:
+            batch_op.alter_column('project_id', existing_type=sa.Integer(), nullable=True)
+            batch_op.alter_column('created_by', existing_type=sa.Integer(), nullable=True)
+    else:
+        op.create_table('rating',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('employee_id', sa.Integer(), nullable=False),
+        sa.Column('project_id', sa.Integer(), nullable=True),
+        sa.Column('rating', sa.Float(), nullable=False),
+        sa.Column('comment', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('created_by', sa.Integer(), nullable=True),
+        sa.ForeignKeyConstraint(['created_by'], ['employee.id'], ),
+        sa.ForeignKeyConstraint(['employee_id'], ['employee.id'], ),
+        sa.ForeignKeyConstraint(['project_id'], ['project.id'], ),
+        sa.PrimaryKeyConstraint('id')
+        )
+    with op.batch_alter_table('rating', schema=None) as batch_op:
+        batch_op.create_index('ix_rating_employee_created', ['employee_id', 'created_at'], unique=False)
+        batch_op.create_index(batch_op.f('ix_rating_project_id'), ['project_id'], unique=False)
+
+    with op.batch_alter_table('employee', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('rating_count', sa.Integer(), nullable=False, server_default='0'))
+        batch_op.add_column(sa.Column('rating_score', sa.Float(), nullable=True))
+        batch_op.add_column(sa.Column('rating_weight', sa.Float(), nullable=False, server_default='0'))
+        batch_op.add_column(sa.Column('rated_at', sa.DateTime(), nullable=True))
+    op.execute("UPDATE employee SET rating_score = rating")
+    # Ratings already on record count toward the running average the employee's rating holds
+    op.execute(
+        "UPDATE employee SET "
+        "rating_count = (SELECT count(*) FROM rating WHERE rating.employee_id = employee.id), "
+        "rating_weight = (SELECT count(*) FROM rating WHERE rating.employee_id = employee.id), "
+        "rated_at = (SELECT max(created_at) FROM rating WHERE rating.employee_id = employee.id) "
+        "WHERE EXISTS (SELECT 1 FROM rating WHERE rating.employee_id = employee.id)"
+    )
+    with op.batch_alter_table('employee', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_employee_rating'), ['rating'], unique=False)
+        batch_op.create_index(batch_op.f('ix_employee_rating_score'), ['rating_score'], unique=False)
+        batch_op.create_index('ix_employee_role_rating', ['role', 'rating'], unique=False)
+        batch_op.create_index('ix_employee_role_rating_score', ['role', 'rating_score'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('employee', schema=None) as batch_op:
+        batch_op.drop_index('ix_employee_role_rating_score')
+        batch_op.drop_index('ix_employee_role_rating')
+        batch_op.drop_index(batch_op.f('ix_employee_rating_score'))
+        batch_op.drop_index(batch_op.f('ix_employee_rating'))
+        batch_op.drop_column('rated_at')
+        batch_op.drop_column('rating_weight')
+        batch_op.drop_column('rating_score')
+        batch_op.drop_column('rating_count')
+
+    with op.batch_alter_table('rating', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_rating_project_id'))
+        batch_op.drop_index('ix_rating_employee_created')
+    # The rating table predates this revision (initial migration), so it stays with its rows
@@ -0,0 +1,86 @@
+import os
+import sys
+import tempfile
+from datetime import datetime
+
+# Configure the app before it is imported: a scratch SQLite database, the http profile (no
+# eventlet or Socket.IO server), no list response cache (every request hits the database)
+# and a token signing key. A PostgreSQL DATABASE_URL is used as is, and its tables dropped;
+# only then does test_query_plans.py run.
+if not os.getenv('DATABASE_URL', '').startswith(('postgres://', 'postgresql')):
+    DATABASE_PATH = os.path.join(tempfile.mkdtemp(), 'test.db')
+    os.environ['DATABASE_URL'] = f'sqlite:///{DATABASE_PATH}'
+os.environ['APP_PROFILE'] = 'http'
+os.environ['LIST_CACHE_TTL'] = '0'
+os.environ['SECRET_KEY'] = 'test-secret'
+os.environ.pop('SOCKETIO_MESSAGE_QUEUE', None)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from sqlalchemy import event
+
+from app import app as flask_app, db, Employee, Project, NotificationBroadcast
+
+@pytest.fixture
+def app():
+    with flask_app.app_context():
+        db.drop_all()
+        db.create_all()
+        yield flask_app
+        db.session.remove()
+        db.drop_all()
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+@pytest.fixture
+def count_statements(app):
+    """Returns run(fn) -> (statements executed by fn, fn's result)"""
+    def run(fn):
+        statements = []
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+        event.listen(db.engine, 'before_cursor_execute', record)
+        try:
+            result = fn()
+        finally:
+            event.remove(db.engine, 'before_cursor_execute', record)
+        return len(statements), result
+    return run
+
+@pytest.fixture
+def admin(app):
+    admin = Employee(name='Admin', employee_id='admin', role='Manager', password_hash='x', is_admin=True)
+    db.session.add(admin)
+    db.session.commit()
+    return admin
+
+@pytest.fixture
+def employee(app):
+    employee = Employee(name='Employee', employee_id='emp1', role='Developer', password_hash='x')
+    db.session.add(employee)
+    db.session.commit()
+    return employee
+
+@pytest.fixture
+def make_project(admin):
+    """
+    Returns make(offered=True, closed=False, **columns) -> a project created by
+    the admin; offered projects get a broadcast (project.broadcast), closed now if `closed`
+    """
+    def make(offered=True, closed=False, **columns):
+        project = Project(**dict({'title': 'Offer', 'created_by': admin.id}, **columns))
+        db.session.add(project)
+        db.session.flush()
+        if offered:
+            db.session.add(NotificationBroadcast(project_id=project.id,
+                                                 closed_at=datetime.utcnow() if closed else None))
+        db.session.commit()
+        return project
+    return make
+
+@pytest.fixture
+def offer(make_project):
+    """One open offer"""
+    return make_project()
@@ -0,0 +1,23 @@
+from datetime import datetime
+
+from app import db, archive_notifications, Notification
+
+def reject(employee, project):
+    db.session.add(Notification(employee_id=employee.id, project_id=project.id, status='reject'))
+    db.session.commit()
+
+def test_rejections_of_open_offers_stay_live(client, employee, offer):
+    reject(employee, offer)
+
+    assert archive_notifications(older_than_days=0) == 0
+    # The offer must not come back as pending
+    assert client.get(f'/api/notifications?employee_id={employee.id}').get_json() == []
+
+def test_rejections_of_closed_offers_are_archived(client, employee, offer):
+    reject(employee, offer)
+    offer.broadcast.closed_at = datetime.utcnow()
+    db.session.commit()
+
+    assert archive_notifications(older_than_days=0) == 1
+    assert Notification.query.count() == 0
+    assert client.get(f'/api/notifications?employee_id={employee.id}').get_json() == []
@@ -0,0 +1,15 @@
+from werkzeug.security import generate_password_hash
+
+from app import app as flask_app, db, decode_token, issue_token, Employee
+
+def test_placeholder_secret_disables_tokens(client, monkeypatch):
+    employee = Employee(name='Employee', employee_id='emp1', role='Developer',
+                        password_hash=generate_password_hash('secret'))
+    db.session.add(employee)
+    db.session.commit()
+    token = issue_token(employee)
+    assert decode_token(token)['id'] == employee.id
+
+    monkeypatch.setitem(flask_app.config, 'SECRET_KEY', 'your-secret-key-here')
+    assert decode_token(token) is None
+    assert client.post('/api/auth/login', json={'employee_id': 'emp1', 'password': 'secret'}).status_code == 503
@@ -0,0 +1,29 @@
+import pytest
+
+from app import db, project_acceptances, Project, Notification, NotificationBroadcast
+
+@pytest.fixture
+def accepted_offer(employee, offer):
+    db.session.add(Notification(employee_id=employee.id, project_id=offer.id, status='accept'))
+    db.session.execute(project_acceptances.insert().values(project_id=offer.id, employee_id=employee.id))
+    db.session.commit()
+    return offer
+
+def test_bulk_assignment_settles_responses(client, admin, accepted_offer):
+    assert client.patch('/api/projects', json={'ids': [accepted_offer.id], 'employee_id': admin.id}).status_code == 200
+
+    assert db.session.scalar(db.select(Notification.status)) == 'closed'
+    assert db.session.scalar(db.select(NotificationBroadcast.closed_at)) is not None
+
+def test_bulk_unassignment_reopens_the_offer(client, employee, accepted_offer):
+    project_id = accepted_offer.id
+    client.patch('/api/projects', json={'ids': [project_id], 'employee_id': employee.id})
+
+    assert client.patch('/api/projects', json={'ids': [project_id], 'employee_id': None,
+                                               'status': 'completed'}).status_code == 400
+    assert client.patch('/api/projects', json={'ids': [project_id], 'employee_id': None}).status_code == 200
+
+    db.session.expire_all()
+    assert db.session.get(Project, project_id).status == 'pending'
+    assert [n['status'] for n in client.get(f'/api/notifications?employee_id={employee.id}').get_json()] == ['pending']
+    assert db.session.execute(project_acceptances.select()).all() == []
@@ -0,0 +1,18 @@
+from app import db, archive_notifications, project_acceptances, Notification
+
+def test_acceptance_rate_survives_archiving(client, employee, make_project):
+    assigned, rejected = make_project(closed=True), make_project()
+    db.session.add_all([
+        Notification(employee_id=employee.id, project_id=assigned.id, status='assigned'),
+        Notification(employee_id=employee.id, project_id=rejected.id, status='reject'),
+    ])
+    db.session.execute(project_acceptances.insert().values(project_id=assigned.id, employee_id=employee.id))
+    db.session.commit()
+
+    def summary():
+        return client.get('/api/dashboard/summary').get_json()
+
+    assert summary()['acceptance_rate'] == 0.5
+    assert archive_notifications(older_than_days=0) == 1
+    assert summary()['acceptance_rate'] == 0.5
+    assert summary()['employees'][0]['responses'] == 2
@@ -0,0 +1,12 @@
+from app import fanout_jobs
+
+def test_fanout_jobs_are_bounded(app, client, admin, monkeypatch):
+    monkeypatch.setitem(app.config, 'NOTIFICATION_FANOUT_ASYNC', True)
+    monkeypatch.setattr(fanout_jobs, 'max_size', 2)
+    fanout_jobs.clear()
+
+    jobs = [client.post('/api/projects', json={'title': f'Project {i}'}).get_json()['fanout_job'] for i in range(3)]
+
+    assert fanout_jobs.stats()['size'] == 2
+    # The evicted job is still reported, from its broadcast
+    assert [client.get(f'/api/jobs/{job}').get_json()['status'] for job in jobs] == ['completed'] * 3
@@ -0,0 +1,6 @@
+from check_import_time import import_profile
+
+def test_http_profile_skips_the_realtime_stack():
+    packages, loaded = import_profile('http')
+    assert packages is not None, loaded
+    assert loaded == []
@@ -0,0 +1,13 @@
+from app import db, employee_directory_cache, record_rating, Employee
+
+def test_unrated_employees_are_left_off_by_default(client):
+    rated = Employee(name='Rated', employee_id='emp1', role='Developer', password_hash='x')
+    unrated = Employee(name='Unrated', employee_id='emp2', role='Developer', password_hash='x')
+    db.session.add_all([rated, unrated])
+    db.session.commit()
+    record_rating(rated.id, 3.0)
+    employee_directory_cache.clear()
+
+    # The unrated employee's default 5.0 must not outrank a real 3.0
+    assert [e['id'] for e in client.get('/api/employees/leaderboard').get_json()] == [rated.id]
+    assert [e['id'] for e in client.get('/api/employees/leaderboard?min_ratings=0').get_json()] == [unrated.id, rated.id]
@@ -0,0 +1,34 @@
+import pytest
+
+from app import list_response_cache
+
+@pytest.fixture
+def list_cache(app):
+    app.config['LIST_CACHE_TTL'] = list_response_cache.ttl = 60
+    list_response_cache.clear()
+    yield list_response_cache
+    app.config['LIST_CACHE_TTL'] = list_response_cache.ttl = 0
+    list_response_cache.clear()
+
+@pytest.fixture
+def projects(make_project):
+    return [make_project(title=f'Project {i}') for i in range(3)]
+
+def test_streamed_lists_are_not_cached(client, list_cache, projects):
+    for _ in range(2):
+        response = client.get('/api/projects')
+        assert response.is_streamed
+        assert len(response.get_json()) == 3
+    assert list_cache.stats()['size'] == 0
+
+def test_paged_lists_are_cached(client, list_cache, projects):
+    hits = list_cache.stats()['hits']
+    assert client.get('/api/projects?limit=2').get_json() == client.get('/api/projects?limit=2').get_json()
+    assert list_cache.stats()['hits'] == hits + 1
+
+def test_project_edits_clear_cached_notification_lists(client, list_cache, employee, offer):
+    url = f'/api/notifications?employee_id={employee.id}&limit=10'
+
+    assert client.get(url).get_json()['items'][0]['project_priority'] == 1
+    client.put(f'/api/projects/{offer.id}', json={'priority': 4})
+    assert client.get(url).get_json()['items'][0]['project_priority'] == 4
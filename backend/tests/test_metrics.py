@@ -0,0 +1,20 @@
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from app import db
+
+def test_failed_statements_leave_nothing_on_the_connection(app):
+    connection = db.session.connection()
+    with pytest.raises(OperationalError):
+        connection.execute(text('SELECT * FROM no_such_table'))
+    assert 'statement_started' not in connection.info
+    db.session.rollback()
+
+def test_statements_are_counted_per_request(app, client):
+    app.config['SERVER_TIMING'] = True
+    try:
+        timing = client.get('/api/projects').headers['Server-Timing']
+    finally:
+        app.config['SERVER_TIMING'] = False
+    assert 'queries' in timing and '"0 queries"' not in timing
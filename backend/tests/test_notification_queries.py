@@ -0,0 +1,34 @@
+import pytest
+
+from app import db, Notification
+
+@pytest.fixture
+def add_offers(employee, make_project):
+    def add(count, start=0):
+        """`count` open offers; the employee has accepted every other one"""
+        for i in range(start, start + count):
+            project = make_project(title=f'Project {i}', description=f'Offer {i}')
+            if i % 2:
+                db.session.add(Notification(employee_id=employee.id, project_id=project.id, status='accept'))
+        db.session.commit()
+    return add
+
+def test_notification_list_statement_count_is_constant(client, count_statements, employee, add_offers):
+    employee_id = employee.id
+
+    def list_notifications():
+        response = client.get(f'/api/notifications?employee_id={employee_id}')
+        # Streamed bodies run their queries while being read
+        return response.status_code, response.get_json()
+
+    add_offers(10)
+    small_count, (status, small) = count_statements(list_notifications)
+    assert status == 200
+    assert len(small) == 10
+
+    add_offers(90, start=10)
+    large_count, (status, large) = count_statements(list_notifications)
+    assert status == 200
+    assert len(large) == 100
+
+    assert large_count == small_count
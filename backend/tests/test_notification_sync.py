@@ -0,0 +1,13 @@
+from datetime import datetime
+
+def test_project_edits_reach_notification_lists(client, employee, make_project):
+    project = make_project(description='Before')
+    url = f'/api/notifications?employee_id={employee.id}'
+    etag = client.get(url).headers['ETag']
+    since = datetime.utcnow().isoformat()
+
+    assert client.put(f'/api/projects/{project.id}', json={'description': 'After', 'priority': 3}).status_code == 200
+
+    assert client.get(url, headers={'If-None-Match': etag}).status_code == 200
+    changed = client.get(f'{url}&since={since}').get_json()['changed']
+    assert [(row['project_description'], row['project_priority']) for row in changed] == [('After', 3)]
@@ -0,0 +1,48 @@
+import base64
+import json
+
+from sqlalchemy import update
+
+import pytest
+
+from app import db, Project
+
+@pytest.fixture
+def seed_projects(make_project):
+    def seed(count):
+        for i in range(count):
+            make_project(offered=False, title=f'Project {i}')
+        # Rows from before updated_at existed have no value
+        db.session.execute(update(Project).where(Project.id % 2 == 0).values(updated_at=None))
+        db.session.commit()
+    return seed
+
+def walk(client, sort):
+    """Every id on every page of ?sort=<sort>&limit=1, in order"""
+    ids, after = [], None
+    while True:
+        url = f'/api/projects?sort={sort}&limit=1' + (f'&after={after}' if after else '')
+        response = client.get(url)
+        assert response.status_code == 200
+        page = response.get_json()
+        ids.extend(item['id'] for item in page['items'])
+        if not page['has_more']:
+            return ids
+        after = page['next_after']
+
+def test_keyset_pages_cross_null_sort_values(client, seed_projects):
+    seed_projects(6)
+    ascending = walk(client, 'updated_at')
+    descending = walk(client, '-updated_at')
+    assert sorted(ascending) == list(range(1, 7))
+    assert sorted(descending) == list(range(1, 7))
+    # NULLs sort last ascending and first descending
+    assert ascending[-3:] == [2, 4, 6]
+    assert descending[:3] == [6, 4, 2]
+
+def test_malformed_after_cursor_is_rejected(client, seed_projects):
+    seed_projects(2)
+    for payload in ([{'x': 1}, None], ['not a date', 1], [None, 'x']):
+        after = base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+        response = client.get(f'/api/projects?sort=updated_at&limit=1&after={after}')
+        assert response.status_code == 400
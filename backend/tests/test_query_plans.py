@@ -0,0 +1,89 @@
+"""
+Query-plan regression test for the hot endpoints (PostgreSQL only).
+
+Exercises the read routes through Flask's test client, captures every SELECT
+they issue and EXPLAINs it with sequential scans disabled. Any remaining Seq
+Scan on an indexed table means the access path has no usable index. Skipped
+unless DATABASE_URL points at a scratch PostgreSQL database:
+
+    DATABASE_URL=postgresql://localhost/dev_tracker_test python -m pytest -q tests/test_query_plans.py
+"""
+from datetime import datetime
+
+import pytest
+from sqlalchemy import event, text
+
+from app import db, issue_token, Employee, deadline_scheduler
+
+# Tables whose hot access paths must be covered by an index
+WATCHED_TABLES = {'employee', 'project', 'notification', 'notification_broadcast', 'project_acceptances', 'tombstone', 'rating'}
+
+def seed():
+    db.session.add(Employee(name='Admin User', employee_id='admin123', role='Manager', password_hash='x',
+                            is_admin=True))
+    for i in range(5):
+        db.session.add(Employee(name=f'Employee {i}', employee_id=f'emp{i}', role='Developer', password_hash='x',
+                                rating=3.0 + i / 2))
+    db.session.commit()
+
+def exercise_routes(client):
+    """Hit each read route once; writes are only used to create data to read"""
+    since = datetime.utcnow().isoformat()
+    for i in range(3):
+        client.post('/api/projects', json={'title': f'Project {i}', 'priority': i + 1})
+    client.put('/api/notifications/1/respond', json={'response': 'accept'},
+               headers={'Authorization': f'Bearer {issue_token(db.session.get(Employee, 2))}'})
+    client.put('/api/projects/2', json={'employee_id': 2})
+    client.post('/api/ratings', json={'employee_id': 2, 'project_id': 2, 'rating': 4.5})
+
+    client.get('/api/projects')
+    client.get('/api/projects?employee_id=2')
+    client.get('/api/projects?status=pending&priority=1,2')
+    client.get(f'/api/projects?since={since}')
+    client.get('/api/projects/search?q=project')
+    client.get('/api/projects?embed=assignee')
+    client.get('/api/dashboard/summary')
+    client.get('/api/employees?is_admin=false')
+    client.get('/api/employees/leaderboard?limit=3')
+    client.get('/api/employees/leaderboard?role=Developer&by=score')
+    client.get('/api/ratings/employee/2')
+    client.get('/api/notifications?employee_id=2')
+    client.get(f'/api/notifications?employee_id=2&since={since}')
+    # The deadline sweeper's window load and change sync
+    deadline_scheduler.configure(window_hours=24)
+    deadline_scheduler.fire(datetime.utcnow())
+    deadline_scheduler.sync(datetime.utcnow())
+
+def seq_scans(plan):
+    """Yield the relations scanned sequentially anywhere in an EXPLAIN (FORMAT JSON) plan"""
+    if plan.get('Node Type') == 'Seq Scan':
+        yield plan.get('Relation Name')
+    for child in plan.get('Plans', []):
+        yield from seq_scans(child)
+
+def test_read_queries_use_indexes(app, client):
+    if db.engine.dialect.name != 'postgresql':
+        pytest.skip('query plans are only checked on PostgreSQL')
+    seed()
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith('SELECT'):
+            statements.append((statement, parameters))
+
+    event.listen(db.engine, 'before_cursor_execute', capture)
+    try:
+        exercise_routes(client)
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', capture)
+
+    failures = []
+    with db.engine.connect() as conn:
+        conn.execute(text('SET enable_seqscan = off'))
+        for statement, parameters in statements:
+            plan = conn.exec_driver_sql('EXPLAIN (FORMAT JSON) ' + statement, parameters).scalar()
+            scanned = set(seq_scans(plan[0]['Plan'])) & WATCHED_TABLES
+            if scanned:
+                failures.append(f"Seq Scan on {', '.join(sorted(scanned))}: {' '.join(statement.split())}")
+    assert statements
+    assert not failures, '\n'.join(failures)
@@ -0,0 +1,21 @@
+from app import db, issue_token, project_acceptances
+
+def respond(client, broadcast, response, employee=None, **body):
+    headers = {'Authorization': f'Bearer {issue_token(employee)}'} if employee else {}
+    return client.put(f'/api/notifications/{broadcast.id}/respond', json=dict(body, response=response),
+                      headers=headers)
+
+def test_rejecting_withdraws_an_acceptance(client, employee, offer):
+    for response in ('accept', 'reject'):
+        assert respond(client, offer.broadcast, response, employee).status_code == 200
+
+    assert db.session.execute(project_acceptances.select()).all() == []
+    assert client.post(f'/api/projects/{offer.id}/finalize-assignment').status_code == 400
+
+def test_responses_need_an_employee_token(client, admin, employee, offer):
+    broadcast = offer.broadcast
+
+    # The body's employee_id is not an identity
+    assert respond(client, broadcast, 'accept', employee_id=employee.id).status_code == 401
+    assert respond(client, broadcast, 'accept', admin).status_code == 403
+    assert db.session.execute(project_acceptances.select()).all() == []
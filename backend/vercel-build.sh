@@ -3,5 +3,13 @@
 # Install Python dependencies
 pip install -r requirements.txt
 
-# Initialize database (if needed)
-python -c "from app import db; db.create_all()" 
\ No newline at end of file
+# Bring the schema up to date. The http profile leaves out the `flask db` CLI (and the
+# realtime stack it would pull in), so register Flask-Migrate just for this step.
+APP_PROFILE=http python - <<'PY'
+from flask_migrate import Migrate, upgrade
+from app import app, db
+
+Migrate(app, db)
+with app.app_context():
+    upgrade()
+PY
@@ -1,4 +1,4 @@
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useMemo } from 'react';
 import {
   Container,
   Grid,
@@ -82,18 +82,82 @@ const AdminDashboard = () => {
           prevProjects.map(p => p.id === project.id ? project : p)
         );
       });
+
+      socket.on('new_project', ({ project }) => {
+        setProjects(prevProjects =>
+          prevProjects.some(p => p.id === project.id) ? prevProjects : [...prevProjects, project]
+        );
+      });
+
+      socket.on('project_assigned', ({ project, employee }) => {
+        setProjects(prevProjects =>
+          prevProjects.map(p => p.id === project.id
+            ? { ...project, assignee: { id: employee.id, name: employee.name, rating: employee.rating } }
+            : p)
+        );
+      });
+
+      // Batch auto-assignment pass
+      socket.on('projects_assigned', ({ assignments }) => {
+        const assignees = new Map(assignments.map(a => [a.project_id, a.employee_id]));
+        setProjects(prevProjects =>
+          prevProjects.map(p => assignees.has(p.id)
+            ? { ...p, employee_id: assignees.get(p.id), status: 'in_progress' }
+            : p)
+        );
+      });
+
+      // Bulk imports and bulk edits: re-fetch once per batch
+      socket.on('projects_imported', () => {
+        fetchProjects();
+      });
+
+      socket.on('projects_updated', () => {
+        fetchProjects();
+      });
+
+      socket.on('projects_overdue', ({ project_ids, overdue_at }) => {
+        const overdue = new Set(project_ids);
+        setProjects(prevProjects =>
+          prevProjects.map(p => overdue.has(p.id) ? { ...p, overdue_at } : p)
+        );
+      });
+
+      socket.on('employee_updated', (employee) => {
+        setEmployees(prevEmployees =>
+          prevEmployees.map(e => e.id === employee.id ? employee : e)
+        );
+      });
     }
 
     return () => {
       if (socket) {
         socket.off('project_updated');
+        socket.off('new_project');
+        socket.off('project_assigned');
+        socket.off('projects_assigned');
+        socket.off('projects_imported');
+        socket.off('projects_updated');
+        socket.off('projects_overdue');
+        socket.off('employee_updated');
       }
     };
   }, [socket]);
 
+  // Pushed updates carry no embedded assignee; those rows fall back to a keyed lookup
+  const employeesById = useMemo(() => new Map(employees.map(e => [e.id, e])), [employees]);
+
+  const assigneeName = (project) => {
+    if (project.assignee && project.assignee.id === project.employee_id) {
+      return project.assignee.name;
+    }
+    return employeesById.get(project.employee_id)?.name;
+  };
+
   const fetchProjects = async () => {
     try {
-      const response = await axios.get('/api/projects');
+      // Each project embeds its assignee's name and rating
+      const response = await axios.get('/api/projects?embed=assignee');
       setProjects(response.data);
     } catch (error) {
       setError('Failed to fetch projects');
@@ -219,13 +283,14 @@ const AdminDashboard = () => {
     try {
       if (!selectedEmployee) return;
       
-      await axios.put(`/api/employees/${selectedEmployee.id}/rating`, { 
+      const response = await axios.put(`/api/employees/${selectedEmployee.id}/rating`, { 
         rating: parseFloat(newRating) 
       });
       
+      // The employee's rating is now the average of every rating given
       setEmployees(employees.map(emp => 
         emp.id === selectedEmployee.id 
-          ? {...emp, rating: parseFloat(newRating)} 
+          ? {...emp, ...response.data} 
           : emp
       ));
       
@@ -474,9 +539,12 @@ const AdminDashboard = () => {
                             variant="outlined"
                             size="small"
                           />
+                          {project.overdue_at && (
+                            <Chip label="overdue" color="error" size="small" sx={{ ml: 1 }} />
+                          )}
                         </TableCell>
                         <TableCell>
-                          {employees.find(e => e.id === project.employee_id)?.name || 
+                          {assigneeName(project) || 
                             <Typography variant="body2" color="text.secondary">Unassigned</Typography>
                           }
                         </TableCell>
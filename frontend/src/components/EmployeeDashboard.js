@@ -47,7 +47,7 @@ import { useAuth } from '../contexts/AuthContext';
 import { useNavigate } from 'react-router-dom';
 
 const EmployeeDashboard = () => {
-  const { user, logout } = useAuth();
+  const { user, logout, socket } = useAuth();
   const navigate = useNavigate();
   const [projects, setProjects] = useState([]);
   const [notifications, setNotifications] = useState([]);
@@ -92,19 +92,91 @@ const EmployeeDashboard = () => {
 
   useEffect(() => {
     if (user) {
-      // Initial fetch
+      // Initial fetch - later changes are pushed over the socket instead of polled
       fetchProjects();
       fetchNotifications();
+    }
+  }, [user]); // eslint-disable-line react-hooks/exhaustive-deps
 
-      // Poll for new notifications and projects every 10 seconds
-      const notificationInterval = setInterval(() => {
-        fetchNotifications();
-        fetchProjects(); // Also refresh projects regularly
-      }, 5000); // Reduced to 5 seconds for more responsive updates
-
-      return () => clearInterval(notificationInterval);
+  useEffect(() => {
+    if (!socket || !user) {
+      return undefined;
     }
-  }, [user, fetchProjects, fetchNotifications]);
+
+    // A new offer was broadcast: re-fetch once to pick up our notification for it
+    socket.on('new_project', () => {
+      fetchNotifications();
+    });
+
+    socket.on('projects_imported', () => {
+      fetchNotifications();
+    });
+
+    socket.on('notification_updated', (notification) => {
+      setNotifications(prevNotifications =>
+        prevNotifications.map(n => n.id === notification.id ? { ...n, status: notification.status } : n)
+      );
+    });
+
+    // The project went to someone: drop the offer and pick it up if it is ours
+    socket.on('project_assigned', ({ project }) => {
+      setNotifications(prevNotifications =>
+        prevNotifications.filter(n => n.project_id !== project.id)
+      );
+      if (project.employee_id === user.id) {
+        fetchProjects();
+      }
+    });
+
+    socket.on('projects_assigned', ({ assignments }) => {
+      const assigned = new Set(assignments.map(a => a.project_id));
+      setNotifications(prevNotifications =>
+        prevNotifications.filter(n => !assigned.has(n.project_id))
+      );
+      if (assignments.some(a => a.employee_id === user.id)) {
+        fetchProjects();
+      }
+    });
+
+    socket.on('project_updated', (project) => {
+      setProjects(prevProjects => {
+        const others = prevProjects.filter(p => p.id !== project.id);
+        return project.employee_id === user.id ? [...others, project] : others;
+      });
+    });
+
+    // Sent to admins and to the employees whose projects changed
+    socket.on('projects_updated', () => {
+      fetchProjects();
+      fetchNotifications();
+    });
+
+    socket.on('projects_overdue', ({ project_ids, overdue_at }) => {
+      const overdue = new Set(project_ids);
+      setProjects(prevProjects =>
+        prevProjects.map(p => overdue.has(p.id) ? { ...p, overdue_at } : p)
+      );
+    });
+
+    // Reconnects may have missed events, so re-sync once
+    const handleReconnect = () => {
+      fetchProjects();
+      fetchNotifications();
+    };
+    socket.on('connect', handleReconnect);
+
+    return () => {
+      socket.off('new_project');
+      socket.off('notification_updated');
+      socket.off('project_assigned');
+      socket.off('projects_assigned');
+      socket.off('project_updated');
+      socket.off('projects_imported');
+      socket.off('projects_updated');
+      socket.off('projects_overdue');
+      socket.off('connect', handleReconnect);
+    };
+  }, [socket, user, fetchProjects, fetchNotifications]);
 
   const handleUpdateStatus = async (projectId, status) => {
     try {
@@ -412,6 +484,9 @@ const EmployeeDashboard = () => {
                               new Date(project.deadline).toLocaleString() : 
                               'No deadline'
                             }
+                            {project.overdue_at && (
+                              <Chip label="overdue" color="error" size="small" sx={{ ml: 1 }} />
+                            )}
                           </TableCell>
                           <TableCell align="center">
                             <Button
@@ -5,6 +5,15 @@ import io from 'socket.io-client';
 // Configure axios to point to the backend API
 axios.defaults.baseURL = 'http://localhost:5003';
 
+// Send the signed token from login with every API request
+const setAuthToken = (token) => {
+  if (token) {
+    axios.defaults.headers.common.Authorization = `Bearer ${token}`;
+  } else {
+    delete axios.defaults.headers.common.Authorization;
+  }
+};
+
 const AuthContext = createContext(null);
 
 export const useAuth = () => {
@@ -27,19 +36,21 @@ export const AuthProvider = ({ children }) => {
       setIsLoading(true);
       try {
         // Check if there's user data in localStorage
+        // Sessions saved before token auth have no token and must log in again
         const storedUser = localStorage.getItem('user');
-        if (storedUser) {
-          const parsedUser = JSON.parse(storedUser);
+        const parsedUser = storedUser ? JSON.parse(storedUser) : null;
+        if (parsedUser && parsedUser.token) {
+          setAuthToken(parsedUser.token);
           setUser(parsedUser);
           setIsAuthenticated(true);
-          initializeSocket(parsedUser.id);
+          initializeSocket(parsedUser);
         } else {
           try {
             const response = await axios.get('/api/auth/check');
             setUser(response.data);
             setIsAuthenticated(true);
             localStorage.setItem('user', JSON.stringify(response.data));
-            initializeSocket(response.data.id);
+            initializeSocket(response.data);
           } catch (error) {
             console.error('Auth check failed:', error);
             setUser(null);
@@ -60,9 +71,11 @@ export const AuthProvider = ({ children }) => {
     checkAuth();
   }, []);
 
-  const initializeSocket = (userId) => {
+  const initializeSocket = (currentUser) => {
     const newSocket = io('http://localhost:5003', {
-      query: { userId }
+      // WebSocket only: a connection stays on one backend worker without sticky sessions
+      transports: ['websocket'],
+      auth: { token: currentUser.token }
     });
 
     newSocket.on('connect', () => {
@@ -94,10 +107,11 @@ export const AuthProvider = ({ children }) => {
         employee_id: employeeId,
         password
       });
+      setAuthToken(response.data.token);
       setUser(response.data);
       setIsAuthenticated(true);
       localStorage.setItem('user', JSON.stringify(response.data));
-      initializeSocket(response.data.id);
+      initializeSocket(response.data);
       return response.data;
     } catch (error) {
       throw error.response?.data || new Error('Login failed');
@@ -145,6 +159,7 @@ export const AuthProvider = ({ children }) => {
     } catch (error) {
       console.error('Logout failed:', error);
     } finally {
+      setAuthToken(null);
       setUser(null);
       setIsAuthenticated(false);
       localStorage.removeItem('user');